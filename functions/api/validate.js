@@ -6,6 +6,30 @@ const ValidationOrchestrator = require('../validators/validationOrchestrator');
 // Create a validation orchestrator instance
 const validationOrchestrator = new ValidationOrchestrator();
 
+// Content-Encodings accepted on request bodies (advertised by /health).
+// ERN XML compresses 10-20x, so clients gzip large uploads.
+const REQUEST_ENCODINGS = ['gzip', 'deflate'];
+
+// Limit applies to the decompressed body
+const MAX_BODY_SIZE = process.env.VALIDATE_MAX_BODY_SIZE || '10mb';
+
+// Answer unsupported encodings with 415 so clients can resend uncompressed
+router.use((req, res, next) => {
+  const encoding = (req.headers['content-encoding'] || 'identity').toLowerCase();
+  if (encoding !== 'identity' && !REQUEST_ENCODINGS.includes(encoding)) {
+    return res.status(415).json({
+      error: {
+        message: `Unsupported Content-Encoding: ${encoding}`,
+        supported: REQUEST_ENCODINGS
+      }
+    });
+  }
+  next();
+});
+
+// Parse (and inflate) /validate bodies here rather than in the app-wide parser
+router.use(express.json({ limit: MAX_BODY_SIZE, inflate: true }));
+
 // Validation endpoint - NO AUTHENTICATION REQUIRED
 router.post('/', async (req, res) => {
   try {
@@ -130,4 +154,5 @@ router.get('/formats', (req, res) => {
   res.json(formats);
 });
 
-module.exports = router;
\ No newline at end of file
+module.exports = router;
+module.exports.REQUEST_ENCODINGS = REQUEST_ENCODINGS;
\ No newline at end of file
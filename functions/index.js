@@ -35,8 +35,10 @@ const corsOptions = {
 // Apply CORS middleware
 app.use(cors(corsOptions));
 
-// Parse JSON bodies
-app.use(express.json({ limit: '10mb' }));
+// Parse JSON bodies (/validate parses its own, possibly compressed, bodies)
+const jsonParser = express.json({ limit: '10mb' });
+const ownBodyParser = /^\/(api\/)?validate(\/|$)/;
+app.use((req, res, next) => (ownBodyParser.test(req.path) ? next() : jsonParser(req, res, next)));
 
 // Request logging middleware (helpful for debugging)
 app.use((req, res, next) => {
@@ -65,7 +67,8 @@ app.get('/health', (req, res) => {
     status: 'ok', 
     timestamp: new Date().toISOString(),
     service: 'DDEX Workbench API',
-    version: '1.0.2'
+    version: '1.0.2',
+    requestEncodings: validateRoutes.REQUEST_ENCODINGS
   });
 });
 
@@ -74,7 +77,8 @@ app.get('/api/health', (req, res) => {
     status: 'ok', 
     timestamp: new Date().toISOString(),
     service: 'DDEX Workbench API',
-    version: '1.0.2'
+    version: '1.0.2',
+    requestEncodings: validateRoutes.REQUEST_ENCODINGS
   });
 });
 
@@ -6,7 +6,21 @@ Official Python SDK for DDEX validation and processing tools.
 """
 
 from .client import DDEXClient
+from .async_client import AsyncDDEXClient
 from .validator import DDEXValidator
+from .document import DDEXDocument
+from .structural import StructuralValidator
+from .xsd import XSDValidator
+from .schematron import SchematronValidator
+from .local import LocalValidator
+from .ratelimit import RateLimiter
+from .concurrency import AdaptiveConcurrency
+from .journal import CheckpointJournal
+from .cache import ValidationCache, MemoryCache, DiskCache
+from .lazy import LazyValidationResult, LazySequence
+from .compact import ErrorTable, StringPool
+from .codec import JSONCodec
+from .minify import MinifiedDocument
 from .errors import (
     DDEXError,
     RateLimitError,
@@ -31,6 +45,7 @@ from .types import (
     ValidationSummary,
     PassedRule,
     BatchValidationResult,
+    BatchAccumulator,
     SVRLStatistics,
     ERNVersion,
     ERNProfile,
@@ -43,7 +58,19 @@ __version__ = "1.0.2"
 __all__ = [
     # Client and Validator
     "DDEXClient",
+    "AsyncDDEXClient",
     "DDEXValidator",
+    "DDEXDocument",
+    "StructuralValidator",
+    "XSDValidator",
+    "SchematronValidator",
+    "LocalValidator",
+    "RateLimiter",
+    "AdaptiveConcurrency",
+    "CheckpointJournal",
+    "ValidationCache",
+    "MemoryCache",
+    "DiskCache",
     
     # Error classes
     "DDEXError",
@@ -63,12 +90,19 @@ __all__ = [
     
     # Types
     "ValidationResult",
+    "LazyValidationResult",
+    "LazySequence",
+    "ErrorTable",
+    "StringPool",
+    "JSONCodec",
+    "MinifiedDocument",
     "ValidationErrorDetail",
     "ValidationWarning",
     "ValidationOptions",
     "ValidationSummary",
     "PassedRule",
     "BatchValidationResult",
+    "BatchAccumulator",
     "SVRLStatistics",
     "ERNVersion",
     "ERNProfile",
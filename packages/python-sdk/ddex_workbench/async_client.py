@@ -0,0 +1,843 @@
+# packages/python-sdk/ddex_workbench/async_client.py
+"""
+DDEX Workbench asyncio API Client
+
+Native asyncio counterpart of DDEXClient, built on httpx.
+Install with ``pip install ddex-workbench[async]``.
+"""
+
+import asyncio
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .cache import CacheRequest, ValidationCache
+from .client import _BaseClient
+from .codec import JSONCodec
+from .compression import DEFAULT_THRESHOLD as DEFAULT_COMPRESSION_THRESHOLD
+from .concurrency import AdaptiveConcurrency, controlling, report_retry, resolve_controller
+from .compact import ErrorTable
+from .journal import KEY_HASH, CheckpointJournal
+from .incremental import RESPONSE_CHUNK_SIZE, ErrorStreamParser
+from .local import LocalValidator
+from .minify import MinifiedDocument
+from .ratelimit import RateLimiter, parse_retry_after
+from .singleflight import AsyncSingleFlight
+from .source import FileSource, read_file
+from .validator import _file_error_result, _journal_key
+from .errors import (
+    APIError,
+    ConfigurationError,
+    DDEXError,
+    FileError,
+    NetworkError,
+    TimeoutError,
+)
+from .types import (
+    ApiKey,
+    BatchAccumulator,
+    BatchValidationResult,
+    HealthStatus,
+    SupportedFormats,
+    ValidationError as ValidationErrorDetail,
+    ValidationOptions,
+    ValidationResult,
+)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run CPU- or disk-bound work in the default executor, off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+
+class _BufferStream:
+    """Re-iterable async request body over a bytes-like buffer"""
+    
+    CHUNK_SIZE = 256 * 1024
+    
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview]):
+        self._buffer = buffer
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # Slices are small copies; a retry simply iterates again
+        for start in range(0, len(self._buffer), self.CHUNK_SIZE):
+            yield bytes(self._buffer[start:start + self.CHUNK_SIZE])
+
+
+class _IterStream:
+    """Re-iterable async request body over a re-iterable sync chunk source"""
+    
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = chunks
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # Reading and escaping may block (file objects), so run in the executor
+        loop = asyncio.get_running_loop()
+        iterator = iter(self._chunks)
+        while True:
+            chunk = await loop.run_in_executor(None, next, iterator, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+class AsyncDDEXClient(_BaseClient):
+    """
+    Asyncio client for DDEX Workbench API
+    
+    Mirrors the DDEXClient API with coroutine methods. A single instance can
+    drive hundreds of concurrent validations from one event loop.
+    """
+    
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_CONCURRENCY = 50
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = _BaseClient.DEFAULT_TIMEOUT,
+        max_retries: int = _BaseClient.DEFAULT_MAX_RETRIES,
+        retry_delay: float = _BaseClient.DEFAULT_RETRY_DELAY,
+        verify_ssl: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: Optional[Any] = None,
+        rate_limit: Union[bool, RateLimiter] = False,
+        cache: Union[bool, ValidationCache, None] = None,
+        local_first: Union[bool, LocalValidator] = False,
+        coalesce: bool = True,
+        json_codec: Union[str, JSONCodec, None] = None,
+        minify: bool = False,
+        compression: Union[bool, str] = False,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    ):
+        """
+        Initialize async DDEX client
+        
+        Args:
+            api_key: Optional API key for authentication
+            base_url: Base URL for API (defaults to production)
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            retry_delay: Initial delay between retries (exponential backoff)
+            verify_ssl: Whether to verify SSL certificates
+            max_connections: Maximum pooled connections to the API host
+            transport: Optional httpx async transport (e.g. for testing)
+            rate_limit: True to pace requests to the server budget, or a
+                RateLimiter shared with other clients
+            cache: Optional ValidationCache for validate() results, or
+                True for a memory-only cache
+            local_first: True (or a configured LocalValidator) to run local
+                structural/XSD checks before calling the API
+            coalesce: Let concurrent validate() calls for the same content,
+                version, profile and options share one HTTP request
+            json_codec: JSON codec for request and response bodies: "orjson",
+                "msgspec", "json" or a JSONCodec (default: fastest installed)
+            minify: Strip comments and indentation before uploading,
+                mapping reported positions back to the original
+            compression: Compress large request bodies: "auto" (if the
+                server lists the encoding in /health), "gzip", "deflate"
+                or False (default)
+            compression_threshold: Smallest body to compress, in bytes
+            
+        Raises:
+            ConfigurationError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ConfigurationError(
+                "AsyncDDEXClient requires httpx. "
+                "Install it with: pip install ddex-workbench[async]",
+                config_key="httpx"
+            )
+        
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            verify_ssl=verify_ssl,
+            rate_limit=rate_limit,
+            cache=cache,
+            local_first=local_first,
+            coalesce=coalesce,
+            json_codec=json_codec,
+            minify=minify,
+            compression=compression,
+            compression_threshold=compression_threshold
+        )
+        self.max_connections = max_connections
+        if coalesce:
+            self._flights = AsyncSingleFlight()
+        
+        self.session = httpx.AsyncClient(
+            headers=self._default_headers(),
+            timeout=timeout,
+            verify=verify_ssl,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            transport=transport
+        )
+    
+    def set_api_key(self, api_key: Optional[str]) -> None:
+        """
+        Dynamically set or update API key
+        
+        Args:
+            api_key: New API key or None to clear
+        """
+        self.api_key = api_key
+        if api_key:
+            self.session.headers["X-API-Key"] = api_key
+        else:
+            self.session.headers.pop("X-API-Key", None)
+        self._sync_rate_limit()
+    
+    def clear_api_key(self) -> None:
+        """Clear API key from client"""
+        self.set_api_key(None)
+    
+    def _retry_wait(self, attempt: int, response: Any) -> float:
+        """Backoff before retry ``attempt`` (0-based), honouring Retry-After"""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after
+        return self.retry_delay * (2 ** attempt)
+    
+    async def _negotiate_compression(self) -> None:
+        """Read the request encodings the server accepts from /health"""
+        try:
+            # /health is exempt from the server's rate limits; keep the tokens
+            self._record_encodings(await self._request("GET", "/health", rate_limited=False))
+        except DDEXError as e:
+            self._negotiation_failed(e)
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to API
+        
+        Retries 429 and 5xx responses with exponential backoff, like the
+        urllib3 retry strategy used by DDEXClient. With a rate limiter,
+        every attempt first waits for a token.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            **kwargs: Additional request arguments
+            
+        Returns:
+            Response JSON data
+            
+        Raises:
+            Various DDEXError subclasses based on response
+        """
+        response = await self._send(method, endpoint, **kwargs)
+        
+        # Parse successful response
+        try:
+            return self.codec.decode(response.content)
+        except ValueError as e:
+            raise DDEXError(f"Invalid JSON response: {e}")
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        stream: bool = False,
+        rate_limited: bool = True,
+        **kwargs
+    ) -> "httpx.Response":
+        """
+        Send a request with retries and check its status
+        
+        With ``stream=True`` the body of a successful response is left
+        unread; the caller must close the response.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            stream: Return before reading the response body
+            rate_limited: Whether the request takes a rate limiter token
+            **kwargs: Additional request arguments
+            
+        Returns:
+            The successful response
+            
+        Raises:
+            Various DDEXError subclasses based on response
+        """
+        url = self._url(endpoint)
+        timeout = kwargs.pop('timeout', self.timeout)
+        if 'json' in kwargs:
+            kwargs['content'] = self.codec.encode(kwargs.pop('json'))
+        
+        # Large bodies go compressed when the server accepts an encoding
+        body = kwargs.get('content')
+        encoding = None
+        if body is not None and self.compression:
+            size = self._body_size(body)
+            if self._needs_negotiation(size):
+                await self._negotiate_compression()
+            encoding = self._body_encoding(size)
+        plain_headers = kwargs.get('headers')
+        if encoding is not None:
+            kwargs['content'], kwargs['headers'] = self._compressed(body, encoding, plain_headers)
+        elif isinstance(body, bytearray):
+            # httpx only accepts bytes or streams; send the buffer in place
+            kwargs['content'] = _BufferStream(body)
+            kwargs['headers'] = {**(plain_headers or {}), 'Content-Length': str(len(body))}
+        if body is not None and not isinstance(kwargs['content'], (bytes, _BufferStream)):
+            # Streamed bodies are produced off the event loop, sent chunked
+            kwargs['content'] = _IterStream(kwargs['content'])
+        
+        limiter = self.rate_limiter if rate_limited else None
+        try:
+            attempt = 0
+            while True:
+                if limiter is not None:
+                    wait = limiter.reserve()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                
+                request = self.session.build_request(method, url, timeout=timeout, **kwargs)
+                response = await self.session.send(request, stream=stream)
+                
+                if limiter is not None:
+                    limiter.update_from_headers(response.headers)
+                
+                if (response.status_code in self.RETRY_STATUS_CODES
+                        and attempt < self.max_retries):
+                    await response.aclose()
+                    report_retry(parse_retry_after(response.headers.get('Retry-After')))
+                    if response.status_code == 429 and limiter is not None:
+                        # The limiter delays the next reservation
+                        limiter.pause(self._retry_wait(attempt, response))
+                    else:
+                        await asyncio.sleep(self._retry_wait(attempt, response))
+                    attempt += 1
+                    continue
+                break
+            
+            if response.status_code == 415 and encoding is not None:
+                # The server cannot decode the body after all; resend it as-is
+                await response.aclose()
+                self._compression_rejected()
+                kwargs['content'], kwargs['headers'] = body, plain_headers
+                return await self._send(method, endpoint, stream=stream, rate_limited=rate_limited,
+                                       timeout=timeout, **kwargs)
+            
+            if response.status_code >= 400:
+                await response.aread()
+                await response.aclose()
+            self._raise_for_status(
+                response.status_code,
+                response.headers,
+                response.text if response.status_code >= 400 else "",
+                endpoint,
+                method
+            )
+            return response
+        
+        except httpx.TimeoutException:
+            raise TimeoutError(f"Request timed out after {timeout} seconds")
+        except httpx.TransportError as e:
+            raise NetworkError(f"Connection error: {e}", original_error=e)
+        except httpx.HTTPError as e:
+            if isinstance(e, httpx.HTTPStatusError):
+                raise APIError(str(e), status_code=e.response.status_code)
+            raise NetworkError(f"Request failed: {e}", original_error=e)
+    
+    async def validate(
+        self,
+        content: Union[str, bytes],
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None,
+        force_remote: bool = False,
+        minify: Optional[bool] = None
+    ) -> ValidationResult:
+        """
+        Validate DDEX content
+        
+        With ``local_first`` enabled, documents failing the local checks
+        are returned without an API call; cache hits skip the local checks.
+        Concurrent calls with identical arguments share one request
+        (``metadata['coalesced']``). With
+        ``minify``, positions are reported against ``content`` as given.
+        Hashing, cache reads and writes, local checks, minification and
+        body encoding run in the default executor.
+        
+        Args:
+            content: XML content to validate (``str``, or UTF-8 bytes
+                sent without decoding)
+            version: ERN version (e.g., "4.3", "4.2", "3.8.2")
+            profile: Optional profile (e.g., "AudioAlbum")
+            options: Optional validation options
+            force_remote: Call the API even if local checks fail
+            minify: Minify the upload (defaults to the client setting)
+            
+        Returns:
+            ValidationResult with errors, warnings, and metadata
+            
+        Raises:
+            ValidationError: If validation request fails
+            RateLimitError: If rate limit exceeded
+            AuthenticationError: If authentication fails
+        """
+        def lookup() -> Tuple[Optional[CacheRequest], Optional[ValidationResult], Optional[str]]:
+            cache_request = self._cache_request(content, version, profile, options)
+            result = self._cached_result(cache_request)
+            key = None
+            if result is None and self._flights is not None:
+                key = self._flight_key(content, version, profile, options, force_remote)
+            return cache_request, result, key
+        
+        cache_request, result, key = None, None, None
+        if self.cache is not None or self._flights is not None:
+            cache_request, result, key = await _run_blocking(lookup)
+        if result is not None:
+            return result
+        
+        def prepare() -> Tuple[Optional[ValidationResult], Optional[MinifiedDocument], Any]:
+            local = self._local_result(content, version, profile)
+            if local is not None and not local.valid and not force_remote:
+                return local, None, None
+            minified = self._minified(content, minify)
+            upload = minified.content if minified is not None else content
+            return local, minified, self._encode_validate_body(upload, version, profile, options)
+        
+        def finish(response: Dict[str, Any], minified: Optional[MinifiedDocument]) -> Dict[str, Any]:
+            if minified is not None:
+                response = minified.remap_response(response)
+            if cache_request is not None:
+                self.cache.store(cache_request, response)
+            return response
+        
+        async def fetch() -> Tuple[Optional[Dict[str, Any]], Optional[ValidationResult]]:
+            local, minified, body = await _run_blocking(prepare)
+            if body is None:
+                return None, local
+            response = await self._request("POST", "/validate", content=body)
+            if minified is not None or cache_request is not None:
+                response = await _run_blocking(finish, response, minified)
+            return response, local
+        
+        if key is not None:
+            outcome, shared = await self._flights.do(key, fetch)
+        else:
+            outcome, shared = await fetch(), False
+        return self._validation_result(outcome, shared)
+    
+    async def validate_stream(
+        self,
+        source: Any,
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> ValidationResult:
+        """
+        Validate a document streamed from a file object or chunk iterable
+        
+        The body is sent with chunked transfer encoding while the source
+        is read (in the default executor). Caching, coalescing, local-first
+        checks and minification do not apply.
+        
+        Args:
+            source: Binary (UTF-8) or text file object, or an iterable of
+                ``bytes``/``str`` chunks
+            version: ERN version (e.g., "4.3", "4.2", "3.8.2")
+            profile: Optional profile (e.g., "AudioAlbum")
+            options: Optional validation options
+            
+        Returns:
+            ValidationResult with errors, warnings, and metadata
+        """
+        body = self._stream_validate_body(source, version, profile, options)
+        response = await self._request("POST", "/validate", content=body)
+        return self._validated(response, False)
+    
+    async def iter_errors(
+        self,
+        content: Union[str, bytes],
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None,
+        max_errors: Optional[int] = None,
+        minify: Optional[bool] = None
+    ) -> AsyncIterator[ValidationErrorDetail]:
+        """
+        Validate and yield errors while the response is still arriving
+        
+        Parses the response incrementally with ijson when installed (see
+        DDEXClient.iter_errors). Use with ``async for``.
+        
+        Args:
+            content: XML content to validate (``str`` or UTF-8 bytes)
+            version: ERN version (e.g., "4.3", "4.2", "3.8.2")
+            profile: Optional profile (e.g., "AudioAlbum")
+            options: Optional validation options
+            max_errors: Stop reading the response after this many errors
+            minify: Minify the upload (defaults to the client setting)
+            
+        Yields:
+            ValidationErrorDetail for each error, in response order
+        """
+        minified = await _run_blocking(self._minified, content, minify)
+        upload = minified.content if minified is not None else content
+        body = await _run_blocking(self._encode_validate_body, upload, version, profile, options)
+        response = await self._send("POST", "/validate", stream=True, content=body)
+        parser = ErrorStreamParser(self.codec)
+        
+        async def read_batches() -> AsyncIterator[List[Dict[str, Any]]]:
+            async for chunk in response.aiter_bytes(RESPONSE_CHUNK_SIZE):
+                yield parser.feed(chunk)
+            yield parser.close()
+        
+        batches = read_batches()
+        count = 0
+        try:
+            async for batch in batches:
+                for item in batch:
+                    yield self._streamed_error(item, minified)
+                    count += 1
+                    if max_errors is not None and count >= max_errors:
+                        # Closing drops the connection; the rest is never read
+                        return
+        except httpx.TransportError as e:
+            raise NetworkError(f"Connection error while reading response: {e}", original_error=e)
+        finally:
+            await batches.aclose()
+            await response.aclose()
+    
+    async def validate_with_svrl(
+        self,
+        content: str,
+        version: str,
+        profile: Optional[str] = None
+    ) -> Tuple[ValidationResult, Optional[str]]:
+        """
+        Validate and automatically generate SVRL
+        
+        Args:
+            content: XML content to validate
+            version: ERN version
+            profile: Optional profile
+            
+        Returns:
+            Tuple of (ValidationResult, SVRL XML string)
+        """
+        options = ValidationOptions(generate_svrl=True)
+        result = await self.validate(content, version, profile, options)
+        return result, result.svrl
+    
+    async def validate_file(
+        self,
+        filepath: Union[str, Path],
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> ValidationResult:
+        """
+        Validate an XML file
+        
+        The file is read in the default executor so large files do not
+        block the event loop. It is read once as bytes (memory-mapped
+        when large) and sent without decoding to ``str``.
+        
+        Args:
+            filepath: Path to XML file
+            version: ERN version
+            profile: Optional profile
+            options: Optional validation options
+            
+        Returns:
+            ValidationResult object
+            
+        Raises:
+            FileError: If file cannot be read
+        """
+        source = await _run_blocking(read_file, filepath)
+        try:
+            return await self._validate_source(source, version, profile, options)
+        finally:
+            source.close()
+    
+    async def _validate_source(
+        self,
+        source: FileSource,
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> ValidationResult:
+        """validate_file() for a file already read with read_file()"""
+        result = await self.validate(source.data, version, profile, options)
+        result.metadata['file_path'] = str(source.path)
+        result.metadata['file_name'] = source.path.name
+        result.metadata['file_size'] = source.size
+        return result
+    
+    async def validate_batch(
+        self,
+        files: Iterable[Union[str, Path]],
+        version: str,
+        profile: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        options: Optional[ValidationOptions] = None,
+        keep_results: bool = True,
+        adaptive: Union[bool, AdaptiveConcurrency] = False,
+        journal: Optional[CheckpointJournal] = None,
+        error_table: Optional[ErrorTable] = None
+    ) -> BatchValidationResult:
+        """
+        Validate multiple XML files concurrently on the event loop
+        
+        Args:
+            files: File paths to validate (any iterable)
+            version: ERN version
+            profile: Optional profile
+            max_concurrency: Maximum in-flight validations
+            options: Optional validation options
+            keep_results: Keep every ValidationResult in ``results``; set
+                to False for large batches that only need the totals
+            adaptive: Tune concurrency from latency and 429/5xx responses
+                (True, or an AdaptiveConcurrency to configure/observe it)
+            journal: Checkpoint journal; files validated by an earlier
+                run are not validated again
+            error_table: ErrorTable to collect every error and warning in
+                compact columnar form
+            
+        Returns:
+            BatchValidationResult with all results
+        """
+        batch = BatchAccumulator(keep_results=keep_results, error_table=error_table)
+        results = self.iter_validate(
+            files, version, profile, max_concurrency, options, adaptive=adaptive, journal=journal
+        )
+        async for result in results:
+            batch.add(result)
+        return batch.result()
+    
+    async def iter_validate(
+        self,
+        files: Iterable[Union[str, Path]],
+        version: str,
+        profile: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        options: Optional[ValidationOptions] = None,
+        adaptive: Union[bool, AdaptiveConcurrency] = False,
+        journal: Optional[CheckpointJournal] = None
+    ) -> AsyncIterator[ValidationResult]:
+        """
+        Validate files concurrently, yielding results as they complete
+        
+        ``files`` is consumed lazily and at most ``max_concurrency`` tasks
+        exist at a time, so memory stays bounded however many files there
+        are. Files that fail are yielded as FILE_ERROR results. In adaptive
+        mode ``max_concurrency`` is only the starting point (see
+        AdaptiveConcurrency). With a ``journal``, files validated by an
+        earlier run are yielded from it with ``metadata['resumed']`` set.
+        
+        Args:
+            files: File paths to validate (any iterable)
+            version: ERN version
+            profile: Optional profile
+            max_concurrency: Maximum in-flight validations
+            options: Optional validation options
+            adaptive: True, or an AdaptiveConcurrency whose ``on_change``
+                callback reports the current limit
+            journal: Checkpoint journal for resumable runs
+            
+        Yields:
+            ValidationResult for each file, in completion order
+        """
+        controller = resolve_controller(adaptive, max_concurrency)
+        hashed = journal is not None and journal.key_mode == KEY_HASH
+        files = iter(files)
+        exhausted = False
+        pending: Dict[asyncio.Future, Tuple[Path, Optional[str]]] = {}
+        max_concurrency = max(max_concurrency, 1)
+        
+        try:
+            while True:
+                limit = controller.limit if controller else max_concurrency
+                while not exhausted and len(pending) < limit:
+                    # Lazy directory walks stat as they go, so pull them off the loop
+                    file = await _run_blocking(next, files, None)
+                    if file is None:
+                        exhausted = True
+                        break
+                    filepath = Path(file)
+                    key = stored = None
+                    if journal is not None and not hashed:
+                        key = await _run_blocking(_journal_key, journal, filepath, version, profile)
+                        if key is not None:
+                            stored = await _run_blocking(journal.get, key)
+                    if stored is not None:
+                        stored.metadata['file'] = str(filepath)
+                        yield stored
+                        continue
+                    validate = self._validate_source if hashed else self.validate_file
+                    if controller:
+                        validate = partial(self._validate_timed, controller, validate)
+                    if hashed:
+                        coro = self._validate_journaled(journal, validate, filepath, version, profile, options)
+                    else:
+                        coro = validate(filepath, version, profile, options)
+                    pending[asyncio.ensure_future(coro)] = (filepath, key)
+                if not pending:
+                    return
+                
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    filepath, key = pending.pop(task)
+                    try:
+                        result = task.result()
+                        result.metadata['file'] = str(filepath)
+                    except Exception as e:
+                        result = _file_error_result(filepath, e)
+                    else:
+                        if key is not None:
+                            await _run_blocking(journal.record, key, filepath, result)
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if journal is not None:
+                await _run_blocking(journal.flush)
+    
+    async def _validate_journaled(
+        self,
+        journal: CheckpointJournal,
+        validate: Callable[..., Any],
+        filepath: Path,
+        version: str,
+        profile: Optional[str],
+        options: Optional[ValidationOptions]
+    ) -> ValidationResult:
+        """
+        Task for hash-keyed journals: read the file once, key it by the
+        SHA-256 of those bytes, and validate and record it unless stored
+        """
+        source = await _run_blocking(read_file, filepath, ('sha256',))
+        try:
+            key = journal.digest_key(source.digests['sha256'], version, profile)
+            stored = await _run_blocking(journal.get, key)
+            if stored is not None:
+                return stored
+            result = await validate(source, version, profile, options)
+        finally:
+            source.close()
+        result.metadata['file'] = str(filepath)
+        await _run_blocking(journal.record, key, filepath, result)
+        return result
+    
+    @staticmethod
+    async def _validate_timed(
+        controller: AdaptiveConcurrency,
+        validate: Callable[..., Any],
+        *args: Any
+    ) -> ValidationResult:
+        """Run a validation, reporting latency and failures to ``controller``"""
+        start = time.perf_counter()
+        try:
+            with controlling(controller):
+                result = await validate(*args)
+        except Exception as e:
+            controller.record(time.perf_counter() - start, e)
+            raise
+        controller.record(time.perf_counter() - start)
+        return result
+    
+    async def health(self) -> HealthStatus:
+        """
+        Check API health status
+        
+        Returns:
+            HealthStatus object
+        """
+        response = await self._request("GET", "/health")
+        self._record_encodings(response)
+        return self._parse_health(response)
+    
+    async def formats(self) -> SupportedFormats:
+        """
+        Get supported formats and versions
+        
+        Returns:
+            SupportedFormats object
+        """
+        response = await self._request("GET", "/formats")
+        return self._parse_formats(response)
+    
+    async def create_api_key(self, name: str) -> ApiKey:
+        """
+        Create new API key (requires authentication)
+        
+        Args:
+            name: Name/description for the API key
+            
+        Returns:
+            ApiKey object with new key
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        response = await self._request("POST", "/api-keys", json={"name": name})
+        return ApiKey(**response)
+    
+    async def list_api_keys(self) -> List[ApiKey]:
+        """
+        List all API keys (requires authentication)
+        
+        Returns:
+            List of ApiKey objects
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        response = await self._request("GET", "/api-keys")
+        return [ApiKey(**key) for key in response.get("keys", [])]
+    
+    async def delete_api_key(self, key_id: str) -> bool:
+        """
+        Delete an API key (requires authentication)
+        
+        Args:
+            key_id: ID of the key to delete
+            
+        Returns:
+            True if deleted successfully
+            
+        Raises:
+            AuthenticationError: If not authenticated
+            NotFoundError: If key not found
+        """
+        await self._request("DELETE", f"/api-keys/{key_id}")
+        return True
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close session"""
+        await self.close()
+    
+    async def close(self):
+        """Close the underlying connection pool"""
+        if hasattr(self, 'session'):
+            await self.session.aclose()
@@ -0,0 +1,429 @@
+# packages/python-sdk/ddex_workbench/cache.py
+"""Validation result caching for DDEX Workbench SDK"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .canonical import CanonicalDocument, anchor_response, remap_response
+from .types import ValidationOptions
+
+
+def make_cache_key(
+    content: Union[str, bytes],
+    version: str,
+    profile: Optional[str] = None,
+    options: Optional[ValidationOptions] = None
+) -> str:
+    """
+    Build a content-addressed cache key for a validation request
+    
+    Args:
+        content: XML content
+        version: ERN version
+        profile: Optional profile
+        options: Optional validation options
+        
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    params = {
+        "version": version,
+        "profile": profile,
+        "options": asdict(options) if options else None
+    }
+    digest = hashlib.sha256(content)
+    digest.update(b"\0")
+    digest.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class MemoryCache:
+    """
+    Thread-safe in-memory LRU cache bounded by entry count and size
+    
+    Values are raw /validate response bodies; sizes are their JSON length.
+    """
+    
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = 64 * 1024 * 1024):
+        """
+        Initialize memory cache
+        
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total size of cached results (None for no limit)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response and mark it recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+    
+    def set(self, key: str, value: Dict[str, Any], size: int) -> None:
+        """Store a response, evicting least recently used entries"""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def size(self) -> int:
+        """Total size of cached responses in bytes"""
+        return self._size
+
+
+class DiskCache:
+    """
+    Persistent SQLite cache with TTL and size-based eviction
+    
+    Entries older than ``ttl`` are ignored and purged; when the database
+    grows beyond ``max_bytes`` the least recently used entries are evicted.
+    """
+    
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[float] = 7 * 24 * 3600,
+        max_bytes: Optional[int] = 512 * 1024 * 1024
+    ):
+        """
+        Initialize disk cache
+        
+        Args:
+            path: SQLite database file (created if missing)
+            ttl: Entry lifetime in seconds (None for no expiry)
+            max_bytes: Maximum total size of cached results (None for no limit)
+        """
+        self.path = str(Path(path).expanduser())
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)"
+            )
+            self._size = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()[0]
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response if present and not expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            with self._conn:
+                if self.ttl is not None and created + self.ttl < now:
+                    self._delete(key)
+                    return None
+                self._conn.execute(
+                    "UPDATE results SET accessed = ? WHERE key = ?", (now, key)
+                )
+        return json.loads(value)
+    
+    def set(self, key: str, value: Dict[str, Any], size: int, encoded: Optional[bytes] = None) -> None:
+        """Store a response, evicting expired and least recently used entries"""
+        if encoded is None:
+            encoded = json.dumps(value).encode('utf-8')
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._delete(key)
+            self._conn.execute(
+                "INSERT INTO results (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, encoded, size, now, now)
+            )
+            self._size += size
+            self._evict(now)
+    
+    def _delete(self, key: str) -> None:
+        """Delete one entry (lock and transaction must be held)"""
+        row = self._conn.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._size -= row[0]
+    
+    def _evict(self, now: float) -> None:
+        """Purge expired entries, then LRU entries over the size bound"""
+        if self.ttl is not None:
+            purged = self._conn.execute(
+                "DELETE FROM results WHERE created < ?", (now - self.ttl,)
+            ).rowcount
+            if purged:
+                self._size = self._conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM results"
+                ).fetchone()[0]
+        if self.max_bytes is None:
+            return
+        while self._size > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT key, size FROM results ORDER BY accessed LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM results WHERE key = ?", (row[0],))
+            self._size -= row[1]
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+            self._size = 0
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    @property
+    def size(self) -> int:
+        """Total size of cached responses in bytes"""
+        return self._size
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class CacheRequest:
+    """Cache key for one validation request, plus its canonical form if used"""
+    
+    __slots__ = ("key", "document")
+    
+    def __init__(self, key: str, document: Optional[CanonicalDocument] = None):
+        self.key = key
+        self.document = document
+
+
+class ValidationCache:
+    """
+    Two-tier validation result cache
+    
+    Looks up the in-memory LRU first, then the optional disk tier; disk
+    hits are promoted into memory.
+    
+    With ``canonicalize=True`` keys are built from the C14N fingerprint of
+    the content instead of its raw bytes, so layout variants of a message
+    share one entry. Error and warning positions are stored relative to
+    the enclosing element and mapped back onto the caller's text on a hit.
+    """
+    
+    def __init__(
+        self,
+        memory: Optional[MemoryCache] = None,
+        disk: Optional[DiskCache] = None,
+        canonicalize: bool = False
+    ):
+        """
+        Initialize validation cache
+        
+        Args:
+            memory: Memory tier (a default MemoryCache if omitted)
+            disk: Optional persistent tier
+            canonicalize: Key entries by canonical XML fingerprint
+        """
+        self.memory = memory if memory is not None else MemoryCache()
+        self.disk = disk
+        self.canonicalize = canonicalize
+        self.hits = 0
+        self.misses = 0
+    
+    @classmethod
+    def with_disk(
+        cls,
+        path: Union[str, Path],
+        ttl: Optional[float] = 7 * 24 * 3600,
+        max_bytes: Optional[int] = 512 * 1024 * 1024,
+        canonicalize: bool = False,
+        **memory_kwargs
+    ) -> "ValidationCache":
+        """
+        Create a cache with a memory tier in front of a SQLite file
+        
+        Args:
+            path: SQLite database file
+            ttl: Disk entry lifetime in seconds
+            max_bytes: Maximum size of the disk tier
+            canonicalize: Key entries by canonical XML fingerprint
+            **memory_kwargs: Arguments for the MemoryCache
+            
+        Returns:
+            ValidationCache instance
+        """
+        return cls(
+            MemoryCache(**memory_kwargs),
+            DiskCache(path, ttl=ttl, max_bytes=max_bytes),
+            canonicalize=canonicalize
+        )
+    
+    def prepare(
+        self,
+        content: Union[str, bytes],
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> CacheRequest:
+        """
+        Compute the cache key for a validation request
+        
+        Args:
+            content: XML content
+            version: ERN version
+            profile: Optional profile
+            options: Optional validation options
+            
+        Returns:
+            CacheRequest for fetch() and store()
+        """
+        if not self.canonicalize:
+            return CacheRequest(make_cache_key(content, version, profile, options))
+        document = CanonicalDocument(content)
+        key = make_cache_key(document.fingerprint, version, profile, options)
+        return CacheRequest(key, document)
+    
+    def fetch(self, request: CacheRequest) -> Optional[Dict[str, Any]]:
+        """
+        Look up the response for a prepared request
+        
+        Args:
+            request: Result of prepare()
+            
+        Returns:
+            Response body with positions in the caller's content, or None
+        """
+        value = self.get(request.key)
+        if value is None or request.document is None:
+            return value
+        
+        response = dict(value)
+        anchors = response.pop("_anchors", None)
+        source = response.pop("_source", None)
+        if anchors is None or source == request.document.source_digest:
+            return response
+        return remap_response(request.document, response, anchors)
+    
+    def store(self, request: CacheRequest, response: Dict[str, Any]) -> None:
+        """
+        Store the response for a prepared request
+        
+        Args:
+            request: Result of prepare()
+            response: Raw /validate response body
+        """
+        if request.document is not None:
+            response = dict(
+                response,
+                _anchors=anchor_response(request.document, response),
+                _source=request.document.source_digest
+            )
+        self.set(request.key, response)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached /validate response
+        
+        Args:
+            key: Cache key from make_cache_key()
+            
+        Returns:
+            Raw response body or None on a miss
+        """
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value, len(json.dumps(value)))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a /validate response in every tier
+        
+        Args:
+            key: Cache key from make_cache_key()
+            value: Raw response body
+        """
+        encoded = json.dumps(value).encode('utf-8')
+        self.memory.set(key, value, len(encoded))
+        if self.disk is not None:
+            self.disk.set(key, value, len(encoded), encoded)
+    
+    def clear(self) -> None:
+        """Remove all entries from every tier"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with hit/miss counts and tier sizes
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.size,
+            "disk_entries": len(self.disk) if self.disk is not None else 0,
+            "disk_bytes": self.disk.size if self.disk is not None else 0
+        }
+    
+    def close(self) -> None:
+        """Close the disk tier"""
+        if self.disk is not None:
+            self.disk.close()
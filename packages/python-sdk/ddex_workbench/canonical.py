@@ -0,0 +1,258 @@
+# packages/python-sdk/ddex_workbench/canonical.py
+"""
+XML canonicalization for DDEX Workbench SDK
+
+Produces layout-independent fingerprints of ERN messages so that
+re-indented, attribute-reordered or re-prefixed variants of the same
+message share validation results, and maps error positions between
+variants.
+"""
+
+import hashlib
+import sys
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple, Union
+from xml.parsers import expat
+
+try:
+    from xml.etree.ElementTree import C14NWriterTarget
+except ImportError:  # pragma: no cover - Python 3.7
+    C14NWriterTarget = None
+
+
+class _WhitespaceDroppingTarget:
+    """
+    Forward expat events to a C14N 2.0 writer
+    
+    Whitespace-only text between elements (indentation) is dropped, as in
+    MinifiedDocument; whitespace that is the entire content of an element
+    is kept, so ``<X> </X>`` and ``<X/>`` stay distinct. All other text is
+    passed through unchanged. Comments are not forwarded.
+    """
+    
+    def __init__(self, writer: Any):
+        self._writer = writer
+        self._text: List[str] = []
+        self._leaf = False  # no child node since the last start tag
+    
+    @staticmethod
+    def _name(name: str) -> str:
+        # expat reports "uri}local" with namespace_separator="}"
+        return "{" + name if "}" in name else name
+    
+    def _flush(self, keep_whitespace: bool = False) -> None:
+        if self._text:
+            text = "".join(self._text)
+            self._text = []
+            if keep_whitespace or text.strip():
+                self._writer.data(text)
+    
+    def start_ns(self, prefix: Optional[str], uri: str) -> None:
+        self._writer.start_ns(prefix or "", uri)
+    
+    def start(self, name: str, attrs: Dict[str, str]) -> None:
+        self._flush()
+        self._leaf = True
+        self._writer.start(
+            self._name(name),
+            {self._name(k): v for k, v in attrs.items()}
+        )
+    
+    def end(self, name: str) -> None:
+        self._flush(keep_whitespace=self._leaf)
+        self._leaf = False
+        self._writer.end(self._name(name))
+    
+    def data(self, text: str) -> None:
+        self._text.append(text)
+    
+    def pi(self, target: str, data: str) -> None:
+        self._flush()
+        self._leaf = False
+        self._writer.pi(target, data)
+    
+    def comment(self, text: str) -> None:
+        # Without comments, the text on either side is a single text node
+        pass
+
+
+class CanonicalDocument:
+    """
+    Canonical form and element positions of an XML document
+    
+    Built in a single expat pass. ``fingerprint`` is the SHA-256 of the
+    C14N 2.0 form with whitespace between elements dropped and namespace
+    prefixes rewritten, so it is stable across indentation, attribute order
+    and prefix choice. ``positions`` holds the (line, column) of every element
+    start tag in document order; element order is preserved by
+    canonicalization, so the n-th element of one variant is the n-th
+    element of every other variant.
+    
+    Malformed documents (and Python 3.7, which lacks C14N 2.0) fall back
+    to a plain content hash.
+    """
+    
+    def __init__(self, content: Union[str, bytes]):
+        """
+        Canonicalize a document
+        
+        Args:
+            content: XML content
+        """
+        raw = content.encode('utf-8') if isinstance(content, str) else bytes(content)
+        self.source_digest = hashlib.sha256(raw).hexdigest()
+        self.positions: List[Tuple[int, int]] = []
+        self.canonical = False
+        
+        digest = hashlib.sha256()
+        if C14NWriterTarget is not None:
+            try:
+                self._canonicalize(content, digest)
+                self.canonical = True
+            except (expat.ExpatError, ValueError):
+                self.positions = []
+        
+        if self.canonical:
+            self.fingerprint = "c14n:" + digest.hexdigest()
+        else:
+            self.fingerprint = "raw:" + self.source_digest
+    
+    def _canonicalize(self, content: Union[str, bytes], digest: Any) -> None:
+        """Run the expat pass feeding both the digest and the position index"""
+        writer = C14NWriterTarget(
+            lambda chunk: digest.update(chunk.encode('utf-8')),
+            rewrite_prefixes=True
+        )
+        target = _WhitespaceDroppingTarget(writer)
+        positions = self.positions
+        
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        parser.ordered_attributes = False
+        
+        def start(name, attrs):
+            positions.append((parser.CurrentLineNumber, parser.CurrentColumnNumber + 1))
+            target.start(name, attrs)
+        
+        parser.StartNamespaceDeclHandler = target.start_ns
+        parser.StartElementHandler = start
+        parser.EndElementHandler = target.end
+        parser.CharacterDataHandler = target.data
+        parser.ProcessingInstructionHandler = target.pi
+        parser.CommentHandler = target.comment
+        parser.Parse(content, True)
+    
+    def to_anchor(self, line: int, column: int) -> Optional[List[int]]:
+        """
+        Express a position relative to the element containing it
+        
+        Args:
+            line: 1-based line (0 means unknown)
+            column: Column
+            
+        Returns:
+            [element ordinal, line offset, column] or None if the position
+            cannot be anchored
+        """
+        if not line or not self.positions:
+            return None
+        # An unknown column (0) means "somewhere on this line": prefer the
+        # element that starts on the line over the one before it
+        ordinal = bisect_right(self.positions, (line, column or sys.maxsize)) - 1
+        if ordinal < 0:
+            return None
+        elem_line, elem_column = self.positions[ordinal]
+        line_offset = line - elem_line
+        if line_offset == 0:
+            return [ordinal, 0, column - elem_column]
+        return [ordinal, line_offset, column]
+    
+    def from_anchor(self, anchor: Optional[List[int]], line: int, column: int) -> Tuple[int, int]:
+        """
+        Resolve an anchor produced by another variant onto this document
+        
+        Args:
+            anchor: Result of to_anchor() on the original document
+            line: Original line, used when the anchor cannot be resolved
+            column: Original column, used when the anchor cannot be resolved
+            
+        Returns:
+            (line, column) in this document
+        """
+        if anchor is None or anchor[0] >= len(self.positions):
+            return line, column
+        ordinal, line_offset, column_value = anchor
+        elem_line, elem_column = self.positions[ordinal]
+        if line_offset == 0:
+            return elem_line, max(0, elem_column + column_value) if column else column
+        return elem_line + line_offset, column_value
+
+
+def fingerprint(content: Union[str, bytes]) -> str:
+    """
+    Layout-independent fingerprint of an XML document
+    
+    Two messages that differ only in indentation, attribute order, comments
+    or namespace prefixes have the same fingerprint, which makes it suitable
+    for deduplicating validations.
+    
+    Args:
+        content: XML content
+        
+    Returns:
+        Fingerprint string
+    """
+    return CanonicalDocument(content).fingerprint
+
+
+def anchor_response(document: CanonicalDocument, response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Record element anchors for every error and warning position
+    
+    Args:
+        document: Canonical form of the validated content
+        response: Raw /validate response body
+        
+    Returns:
+        Mapping with anchor lists for "errors" and "warnings"
+    """
+    return {
+        kind: [
+            document.to_anchor(item.get("line", 0) or 0, item.get("column", 0) or 0)
+            for item in response.get(kind) or []
+        ]
+        for kind in ("errors", "warnings")
+    }
+
+
+def remap_response(
+    document: CanonicalDocument,
+    response: Dict[str, Any],
+    anchors: Dict[str, List[Optional[List[int]]]]
+) -> Dict[str, Any]:
+    """
+    Translate error and warning positions onto a variant document
+    
+    Args:
+        document: Canonical form of the caller's content
+        response: Cached /validate response body for the original variant
+        anchors: Result of anchor_response() on the original variant
+        
+    Returns:
+        Copy of the response with positions in the caller's document
+    """
+    remapped = dict(response)
+    for kind in ("errors", "warnings"):
+        items = response.get(kind) or []
+        kind_anchors = anchors.get(kind) or []
+        new_items = []
+        for i, item in enumerate(items):
+            anchor = kind_anchors[i] if i < len(kind_anchors) else None
+            if anchor is not None:
+                item = dict(item)
+                item["line"], item["column"] = document.from_anchor(
+                    anchor, item.get("line", 0), item.get("column", 0)
+                )
+            new_items.append(item)
+        remapped[kind] = new_items
+    return remapped
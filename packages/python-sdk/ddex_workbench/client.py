@@ -5,10 +5,13 @@ DDEX Workbench API Client
 Main client for interacting with the DDEX Workbench API.
 """
 
+import copy
 import json
 import platform
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
@@ -24,32 +27,73 @@ from .errors import (
     RateLimitError,
     ServerError,
     TimeoutError,
+    UnsupportedVersionError,
     ValidationError,
 )
+from .codec import STREAM_THRESHOLD, DocumentBody, JSONCodec, encode_document_body, get_codec
+from .compression import (
+    DEFAULT_THRESHOLD as DEFAULT_COMPRESSION_THRESHOLD,
+    CompressedStream,
+    advertised_encodings,
+    compress_body,
+    resolve_compression,
+)
+from .cache import CacheRequest, ValidationCache, make_cache_key
+from .concurrency import report_retry
+from .lazy import LazyValidationResult
+from .local import LocalValidator, merge_results
+from .incremental import RESPONSE_CHUNK_SIZE, ErrorStreamParser
+from .minify import MinifiedDocument
+from .singleflight import SingleFlight
+from .ratelimit import (
+    ANONYMOUS_LIMIT,
+    API_KEY_LIMIT,
+    RateLimiter,
+    parse_retry_after,
+)
 from .types import (
     ApiKey,
     HealthStatus,
-    PassedRule,
     SupportedFormats,
     ValidationError as ValidationErrorDetail,
     ValidationOptions,
     ValidationResult,
-    ValidationSummary,
     ValidationWarning,
 )
 
 
-class DDEXClient:
+class _ReportingRetry(Retry):
+    """
+    urllib3 retry strategy that reports every retried 429/5xx or
+    connection error to the batch's AdaptiveConcurrency, if any
     """
-    Client for DDEX Workbench API
     
-    Provides methods to validate DDEX documents and interact with the API.
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Raises once retries are exhausted; the caller then sees the failure itself
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if response is None:
+            report_retry()
+        elif response.status in (self.status_forcelist or ()):
+            report_retry(parse_retry_after(response.headers.get('Retry-After')))
+        return retry
+
+
+class _BaseClient:
+    """
+    Transport-independent parts of the DDEX Workbench clients
+    
+    Holds configuration, request payload construction, response parsing and
+    the mapping of HTTP status codes onto SDK exceptions. Subclasses only
+    provide the transport.
     """
     
     DEFAULT_BASE_URL = "https://api.ddex-workbench.org/v1"
     DEFAULT_TIMEOUT = 30
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_RETRY_DELAY = 1.0
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    # Wait before asking /health again after a failed compression probe
+    NEGOTIATION_RETRY_DELAY = 60.0
     
     def __init__(
         self,
@@ -58,7 +102,525 @@ class DDEXClient:
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        rate_limit: Union[bool, RateLimiter] = False,
+        cache: Union[bool, ValidationCache, None] = None,
+        local_first: Union[bool, LocalValidator] = False,
+        coalesce: bool = True,
+        json_codec: Union[str, JSONCodec, None] = None,
+        minify: bool = False,
+        compression: Union[bool, str] = False,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    ):
+        self.api_key = api_key
+        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.verify_ssl = verify_ssl
+        
+        # Client-side token bucket; True builds one sized to the server budget
+        self._owns_rate_limiter = rate_limit is True
+        if isinstance(rate_limit, RateLimiter):
+            self.rate_limiter: Optional[RateLimiter] = rate_limit
+        elif rate_limit:
+            self.rate_limiter = RateLimiter(self._default_rate_limit())
+        else:
+            self.rate_limiter = None
+        
+        # Optional result cache; True builds a memory-only cache
+        if cache is True:
+            self.cache: Optional[ValidationCache] = ValidationCache()
+        else:
+            self.cache = cache or None
+        
+        # Optional local pre-validation; True builds a default LocalValidator
+        if isinstance(local_first, LocalValidator):
+            self.local_validator: Optional[LocalValidator] = local_first
+        elif local_first:
+            self.local_validator = LocalValidator()
+        else:
+            self.local_validator = None
+        
+        # Identical concurrent validations share one request (set by subclasses)
+        self.coalesce = coalesce
+        self._flights: Any = None
+        
+        # Request bodies are encoded straight to bytes; orjson/msgspec if installed
+        self.codec = get_codec(json_codec)
+        
+        # Strip comments/indentation from uploads, remapping positions back
+        self.minify = minify
+        
+        # Opt-in compression of large bodies; "auto" asks /health what the server accepts
+        self.compression = resolve_compression(compression)
+        self.compression_threshold = compression_threshold
+        self._server_encodings: Optional[Tuple[str, ...]] = None
+        self._negotiate_after = 0.0
+    
+    def _default_rate_limit(self) -> int:
+        """Server budget for the current credentials (req/min)"""
+        return API_KEY_LIMIT if self.api_key else ANONYMOUS_LIMIT
+    
+    def _sync_rate_limit(self) -> None:
+        """Follow an API key change with the matching default budget"""
+        if self.rate_limiter is not None and self._owns_rate_limiter:
+            self.rate_limiter.set_limit(self._default_rate_limit())
+    
+    def _get_user_agent(self) -> str:
+        """Generate User-Agent string"""
+        from . import __version__
+        python_version = platform.python_version()
+        system = platform.system()
+        return f"ddex-workbench-python/{__version__} (Python/{python_version}; {system})"
+    
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every request"""
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": self._get_user_agent()
+        }
+        if self.api_key:
+            headers["X-API-Key"] = self.api_key
+        return headers
+    
+    def _url(self, endpoint: str) -> str:
+        """Resolve an endpoint against the base URL"""
+        return urljoin(self.base_url, endpoint.lstrip('/'))
+    
+    def get_config(self) -> Dict[str, Any]:
+        """
+        Get current client configuration
+        
+        Returns:
+            Dictionary with current configuration
+        """
+        return {
+            "base_url": self.base_url,
+            "api_key": "***" + self.api_key[-4:] if self.api_key else None,
+            "timeout": self.timeout,
+            "max_retries": self.max_retries,
+            "retry_delay": self.retry_delay,
+            "verify_ssl": self.verify_ssl,
+            "rate_limit": self.rate_limiter.limit if self.rate_limiter else None,
+            "local_first": self.local_validator is not None,
+            "coalesce": self.coalesce,
+            "json_codec": self.codec.name,
+            "minify": self.minify,
+            "compression": self.compression,
+            "user_agent": self._get_user_agent()
+        }
+    
+    def _record_encodings(self, health: Dict[str, Any]) -> None:
+        """Remember the request encodings listed in a /health response"""
+        self._server_encodings = advertised_encodings(health)
+    
+    @staticmethod
+    def _body_size(body: Any) -> Optional[int]:
+        """Size of a request body, or None if streamed with unknown size"""
+        if isinstance(body, (bytes, bytearray)):
+            return len(body)
+        return getattr(body, "size_hint", None)
+    
+    def _is_large(self, size: Optional[int]) -> bool:
+        """True if a body of ``size`` bytes (None: unknown) should be compressed"""
+        return size is None or size >= self.compression_threshold
+    
+    def _needs_negotiation(self, size: Optional[int]) -> bool:
+        """True if a body of ``size`` bytes waits on the server's encodings"""
+        return (self.compression == "auto" and self._server_encodings is None
+                and self._is_large(size) and time.monotonic() >= self._negotiate_after)
+    
+    def _negotiation_failed(self, error: DDEXError) -> None:
+        """
+        Handle a failed /health probe
+        
+        Transient failures (rate limiting, server and network errors) send
+        bodies uncompressed until the probe is retried after
+        ``NEGOTIATION_RETRY_DELAY`` seconds; any other error means the
+        server's support is unknown, so compression stays off.
+        """
+        if isinstance(error, (RateLimitError, ServerError, NetworkError, TimeoutError)):
+            self._negotiate_after = time.monotonic() + self.NEGOTIATION_RETRY_DELAY
+        else:
+            self._server_encodings = ()
+    
+    def _body_encoding(self, size: Optional[int]) -> Optional[str]:
+        """Content-Encoding for a request body of ``size`` bytes, or None"""
+        if not self.compression or not self._is_large(size):
+            return None
+        if self.compression == "auto":
+            return self._server_encodings[0] if self._server_encodings else None
+        return self.compression
+    
+    def _compressed(
+        self,
+        body: Any,
+        encoding: str,
+        headers: Optional[Dict[str, str]]
+    ) -> Tuple[Any, Dict[str, str]]:
+        """Compressed body (streamed bodies stay streamed) and its headers"""
+        headers = {**(headers or {}), "Content-Encoding": encoding}
+        if isinstance(body, (bytes, bytearray)):
+            return compress_body(body, encoding), headers
+        return CompressedStream(body, encoding), headers
+    
+    def _compression_rejected(self) -> None:
+        """The server answered 415 to a compressed body: stop compressing"""
+        self._server_encodings = ()
+        if self.compression != "auto":
+            self.compression = False
+    
+    def _raise_for_status(
+        self,
+        status_code: int,
+        headers: Any,
+        text: str,
+        endpoint: str,
+        method: str
+    ) -> None:
+        """
+        Map an HTTP error status onto the matching DDEXError subclass
+        
+        Args:
+            status_code: HTTP status code
+            headers: Response headers (case-insensitive mapping)
+            text: Raw response body
+            endpoint: API endpoint that was called
+            method: HTTP method that was used
+            
+        Raises:
+            Various DDEXError subclasses based on response
+        """
+        # Handle rate limiting
+        if status_code == 429:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            limit = headers.get('X-RateLimit-Limit') or headers.get('RateLimit-Limit')
+            remaining = (headers.get('X-RateLimit-Remaining')
+                         or headers.get('RateLimit-Remaining') or 0)
+            
+            raise RateLimitError(
+                message="Rate limit exceeded",
+                retry_after=int(retry_after) if retry_after is not None else 60,
+                limit=int(limit) if limit else None,
+                remaining=int(remaining)
+            )
+        
+        # Handle authentication errors
+        if status_code == 401:
+            raise AuthenticationError("Invalid or missing API key")
+        
+        # Handle not found
+        if status_code == 404:
+            raise NotFoundError(f"Resource not found: {endpoint}")
+        
+        # Handle server errors
+        if status_code >= 500:
+            raise ServerError(
+                f"Server error: {status_code}",
+                status_code=status_code
+            )
+        
+        # Handle other client errors
+        if status_code >= 400:
+            try:
+                error_data = json.loads(text)
+                message = error_data.get('error', f"API error: {status_code}")
+            except:
+                message = f"API error: {status_code}"
+            
+            raise APIError(
+                message,
+                status_code=status_code,
+                endpoint=endpoint,
+                method=method,
+                response_body=text
+            )
+    
+    def _build_validate_payload(
+        self,
+        content: str,
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> Dict[str, Any]:
+        """Build the JSON body for POST /validate"""
+        payload = {
+            "content": content,
+            "type": "ERN",
+            "version": version
+        }
+        
+        if profile:
+            payload["profile"] = profile
+        
+        # Add options if provided
+        if options:
+            if options.generate_svrl:
+                payload["generateSVRL"] = True
+            if options.verbose:
+                payload["verbose"] = True
+            if options.include_passed_rules:
+                payload["includePassedRules"] = True
+            if options.custom_rules:
+                payload["customRules"] = options.custom_rules
+            if options.max_errors:
+                payload["maxErrors"] = options.max_errors
+        
+        return payload
+    
+    def _encode_validate_body(
+        self,
+        content: Union[str, bytes],
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> Union[bytes, bytearray, DocumentBody]:
+        """
+        Encode the POST /validate body
+        
+        Bytes-like content (bytes, mmap) is escaped straight into the
+        body without being decoded to ``str``. Documents of STREAM_THRESHOLD
+        and more are not encoded up front but streamed (DocumentBody), so
+        the XML is never resident twice.
+        """
+        payload = self._build_validate_payload(content, version, profile, options)
+        if isinstance(content, str) and len(content) < STREAM_THRESHOLD:
+            return self.codec.encode(payload)
+        del payload["content"]
+        if len(content) >= STREAM_THRESHOLD:
+            return DocumentBody(self.codec, payload, content)
+        return encode_document_body(self.codec, payload, content)
+    
+    def _stream_validate_body(
+        self,
+        source: Any,
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> DocumentBody:
+        """Streamed POST /validate body for a file object or chunk iterable"""
+        payload = self._build_validate_payload("", version, profile, options)
+        del payload["content"]
+        return DocumentBody(self.codec, payload, source)
+    
+    def _local_result(
+        self,
+        content: Union[str, bytes],
+        version: str,
+        profile: Optional[str]
+    ) -> Optional[ValidationResult]:
+        """Local pre-validation result, or None when local-first is off"""
+        if self.local_validator is None:
+            return None
+        try:
+            return self.local_validator.validate(content, version, profile)
+        except UnsupportedVersionError:
+            # Leave unknown versions to the API
+            return None
+    
+    @staticmethod
+    def _local_rejection(local: ValidationResult) -> ValidationResult:
+        """Mark a local failure returned without calling the API"""
+        local.metadata['remote_skipped'] = True
+        return local
+    
+    def _validation_result(
+        self,
+        outcome: Tuple[Optional[Dict[str, Any]], Optional[ValidationResult]],
+        shared: bool
+    ) -> ValidationResult:
+        """
+        Build one caller's result from a validate() fetch
+        
+        Args:
+            outcome: (API response, local result); the response is None
+                when local pre-validation rejected the document, the local
+                result is None with local-first off
+            shared: The fetch was made by another caller (coalesced)
+            
+        Returns:
+            ValidationResult for this caller
+        """
+        response, local = outcome
+        if local is not None and shared:
+            local = copy.deepcopy(local)
+        if response is None:
+            result = self._local_rejection(local)
+            if shared:
+                result.metadata['coalesced'] = True
+            return result
+        result = self._validated(response, shared)
+        return merge_results(local, result) if local is not None else result
+    
+    def _cache_request(
+        self,
+        content: Union[str, bytes],
+        version: str,
+        profile: Optional[str],
+        options: Optional[ValidationOptions]
+    ) -> Optional[CacheRequest]:
+        """Prepared cache lookup for a validation request, or None without a cache"""
+        if self.cache is None:
+            return None
+        return self.cache.prepare(content, version, profile, options)
+    
+    @staticmethod
+    def _flight_key(
+        content: Union[str, bytes],
+        version: str,
+        profile: Optional[str],
+        options: Optional[ValidationOptions],
+        force_remote: bool = False
+    ) -> str:
+        """Identity of a validate() call for coalescing"""
+        key = make_cache_key(content, version, profile, options)
+        return key + ":remote" if force_remote else key
+    
+    def _minified(
+        self,
+        content: Union[str, bytes],
+        minify: Optional[bool]
+    ) -> Optional[MinifiedDocument]:
+        """Minified upload for a validate() call, or None to send content as-is"""
+        if not (self.minify if minify is None else minify):
+            return None
+        return MinifiedDocument(content)
+    
+    def _streamed_error(
+        self,
+        item: Dict[str, Any],
+        minified: Optional[MinifiedDocument]
+    ) -> ValidationErrorDetail:
+        """Build one error of a streamed response, in original positions"""
+        if minified is not None:
+            item = minified.remap_issue(item)
+        return self._parse_error(item)
+    
+    def _validated(self, response: Dict[str, Any], shared: bool) -> ValidationResult:
+        """Parse a /validate response, marking results shared with another caller"""
+        result = self._parse_validation_result(response)
+        if shared:
+            result.metadata['coalesced'] = True
+        return result
+    
+    def _cached_result(self, cache_request: Optional[CacheRequest]) -> Optional[ValidationResult]:
+        """Rebuild a ValidationResult from the cache, or None on a miss"""
+        if cache_request is None:
+            return None
+        response = self.cache.fetch(cache_request)
+        if response is None:
+            return None
+        result = self._parse_validation_result(response)
+        result.metadata['cached'] = True
+        return result
+    
+    def _parse_validation_result(self, response: Dict[str, Any]) -> ValidationResult:
+        """
+        Build a ValidationResult from a /validate response body
+        
+        Errors, warnings and passed rules are decoded on first access
+        (see LazyValidationResult), so checking ``valid`` costs next to
+        nothing even for verbose responses.
+        """
+        return LazyValidationResult(response, self._parse_error, self._parse_warning)
+    
+    @staticmethod
+    def _parse_error(error_data: Dict[str, Any]) -> ValidationErrorDetail:
+        """Parse error from API response"""
+        return ValidationErrorDetail(
+            line=error_data.get("line", 0),
+            column=error_data.get("column", 0),
+            message=error_data.get("message", "Unknown error"),
+            severity=error_data.get("severity", "error"),
+            rule=error_data.get("rule"),
+            context=error_data.get("context"),
+            suggestion=error_data.get("suggestion"),
+            xpath=error_data.get("xpath")
+        )
+    
+    @staticmethod
+    def _parse_warning(warning_data: Dict[str, Any]) -> ValidationWarning:
+        """Parse warning from API response"""
+        return ValidationWarning(
+            line=warning_data.get("line", 0),
+            column=warning_data.get("column", 0),
+            message=warning_data.get("message", "Unknown warning"),
+            rule=warning_data.get("rule"),
+            context=warning_data.get("context")
+        )
+    
+    def _parse_health(self, response: Dict[str, Any]) -> HealthStatus:
+        """Build a HealthStatus from a /health response body"""
+        # Handle flexible response format
+        return HealthStatus(
+            status=response.get('status', 'unknown'),
+            version=response.get('version', ''),
+            timestamp=response.get('timestamp', ''),
+            service=response.get('service'),  # Single service field
+            services=response.get('services'),  # Multiple services dict
+            request_encodings=list(response.get('requestEncodings') or [])
+        )
+    
+    def _parse_formats(self, response: Dict[str, Any]) -> SupportedFormats:
+        """Build SupportedFormats from a /formats response body"""
+        # Create result with flexible handling
+        result = SupportedFormats()
+        
+        # Handle different possible response structures
+        if 'formats' in response:
+            result.formats = response['formats']
+        if 'types' in response:
+            result.types = response['types']
+        if 'versions' in response:
+            result.versions = response['versions']
+        if 'profiles' in response:
+            result.profiles = response['profiles']
+        
+        # If we got a types field but no formats, process it
+        if not result.formats and result.types:
+            if isinstance(result.types, list):
+                result.formats = result.types
+            elif isinstance(result.types, dict):
+                result.formats = list(result.types.keys())
+                for fmt, info in result.types.items():
+                    if isinstance(info, dict):
+                        if 'versions' in info:
+                            result.versions[fmt] = info['versions']
+                        if 'profiles' in info:
+                            result.profiles[fmt] = info['profiles']
+        
+        return result
+
+
+class DDEXClient(_BaseClient):
+    """
+    Client for DDEX Workbench API
+    
+    Provides methods to validate DDEX documents and interact with the API.
+    """
+    
+    # urllib3's default pool size per host
+    DEFAULT_MAX_CONNECTIONS = 10
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = _BaseClient.DEFAULT_TIMEOUT,
+        max_retries: int = _BaseClient.DEFAULT_MAX_RETRIES,
+        retry_delay: float = _BaseClient.DEFAULT_RETRY_DELAY,
+        verify_ssl: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        rate_limit: Union[bool, RateLimiter] = False,
+        cache: Union[bool, ValidationCache, None] = None,
+        local_first: Union[bool, LocalValidator] = False,
+        coalesce: bool = True,
+        json_codec: Union[str, JSONCodec, None] = None,
+        minify: bool = False,
+        compression: Union[bool, str] = False,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
     ):
         """
         Initialize DDEX client
@@ -70,13 +632,50 @@ class DDEXClient:
             max_retries: Maximum number of retries for failed requests
             retry_delay: Initial delay between retries (exponential backoff)
             verify_ssl: Whether to verify SSL certificates
+            max_connections: Keep-alive connections pooled for the API
+                host; batch validation grows it to match its concurrency
+            rate_limit: True to pace requests to the server budget
+                (60 req/min with an API key, 10 anonymous), or a
+                RateLimiter to share one budget between clients
+            cache: Optional ValidationCache for validate() results, or
+                True for a memory-only cache
+            local_first: True (or a configured LocalValidator) to run local
+                structural/XSD checks before calling the API, which is
+                skipped for documents that fail locally
+            coalesce: Let concurrent validate() calls for the same content,
+                version, profile and options share one HTTP request
+            json_codec: JSON codec for request and response bodies: "orjson",
+                "msgspec", "json" or a JSONCodec (default: fastest installed)
+            minify: Strip comments and indentation before uploading;
+                error and warning positions are mapped back to the
+                original document
+            compression: Compress request bodies of at least
+                ``compression_threshold`` bytes: "auto" uses gzip if the
+                server lists it in /health, "gzip"/"deflate" always, False
+                (default) never
+            compression_threshold: Smallest body to compress, in bytes
         """
-        self.api_key = api_key
-        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip('/')
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
-        self.verify_ssl = verify_ssl
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            verify_ssl=verify_ssl,
+            rate_limit=rate_limit,
+            cache=cache,
+            local_first=local_first,
+            coalesce=coalesce,
+            json_codec=json_codec,
+            minify=minify,
+            compression=compression,
+            compression_threshold=compression_threshold
+        )
+        
+        self.max_connections = max(1, max_connections)
+        if coalesce:
+            self._flights = SingleFlight()
+        self._pool_lock = threading.Lock()
         
         # Setup session with retry strategy
         self.session = requests.Session()
@@ -88,35 +687,103 @@ class DDEXClient:
     
     def _setup_session(self):
         """Setup session with retry strategy and headers"""
-        # Configure retry strategy
-        retry_strategy = Retry(
+        # Configure retry strategy; with a rate limiter, 429s are paced
+        # by the limiter instead of being retried blindly
+        status_forcelist = list(self.RETRY_STATUS_CODES)
+        if self.rate_limiter is not None:
+            status_forcelist.remove(429)
+        
+        retry_strategy = _ReportingRetry(
             total=self.max_retries,
             backoff_factor=self.retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"]
+            status_forcelist=status_forcelist,
+            allowed_methods=["GET", "POST", "PUT", "DELETE"],
+            respect_retry_after_header=self.rate_limiter is None,
+            # Hand the last response back once retries run out, so it maps
+            # to RateLimitError/ServerError rather than a NetworkError
+            raise_on_status=False
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        self._retry_strategy = retry_strategy
+        self._mount_adapter()
+        
+        # Set default headers (includes the API key if provided)
+        self.session.headers.update(self._default_headers())
+    
+    def _mount_adapter(self) -> None:
+        """Mount an HTTPAdapter pooling ``max_connections`` per host"""
+        adapter = HTTPAdapter(
+            pool_maxsize=self.max_connections,
+            max_retries=self._retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+    
+    def ensure_connections(self, connections: int) -> None:
+        """
+        Grow the connection pool to at least ``connections``
         
-        # Set default headers
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": self._get_user_agent()
-        })
+        Called by batch validation with its concurrency, so that workers
+        do not discard connections ("pool is full") and pay a new TLS
+        handshake per request. Growing replaces the pool; idle
+        connections are dropped.
         
-        # Add API key if provided
-        if self.api_key:
-            self.session.headers["X-API-Key"] = self.api_key
+        Args:
+            connections: Required number of pooled connections
+        """
+        with self._pool_lock:
+            if connections <= self.max_connections:
+                return
+            self.max_connections = connections
+            self._mount_adapter()
     
-    def _get_user_agent(self) -> str:
-        """Generate User-Agent string"""
-        from . import __version__
-        python_version = platform.python_version()
-        system = platform.system()
-        return f"ddex-workbench-python/{__version__} (Python/{python_version}; {system})"
+    def _connection_pool(self, url: str) -> Any:
+        """urllib3 pool that requests will use for ``url``"""
+        adapter = self.session.get_adapter(url)
+        if hasattr(adapter, "get_connection_with_tls_context"):
+            request = requests.Request("GET", url).prepare()
+            return adapter.get_connection_with_tls_context(request, self.verify_ssl)
+        # requests < 2.32
+        pool = adapter.get_connection(url)
+        adapter.cert_verify(pool, url, self.verify_ssl, None)
+        return pool
+    
+    def warm_up(self, connections: Optional[int] = None) -> int:
+        """
+        Open keep-alive connections to the API ahead of time
+        
+        Connects (TCP and TLS) in parallel and returns the connections to
+        the pool, so the first requests of a batch do not each pay for a
+        handshake. Failures are not raised; the request that needs the
+        connection will report them.
+        
+        Args:
+            connections: Number of connections (defaults to, and is
+                capped at, ``max_connections``)
+            
+        Returns:
+            Number of connections open in the pool
+        """
+        count = min(connections or self.max_connections, self.max_connections)
+        pool = self._connection_pool(self.base_url + "/")
+        conns = [pool._get_conn() for _ in range(count)]
+        
+        def connect(conn: Any) -> bool:
+            try:
+                if getattr(conn, "sock", None) is None:
+                    conn.connect()
+                return True
+            except Exception:
+                conn.close()
+                return False
+        
+        try:
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                opened = sum(executor.map(connect, conns))
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+        return opened
     
     def set_api_key(self, api_key: Optional[str]) -> None:
         """
@@ -130,27 +797,19 @@ class DDEXClient:
             self.session.headers["X-API-Key"] = api_key
         else:
             self.session.headers.pop("X-API-Key", None)
+        self._sync_rate_limit()
     
     def clear_api_key(self) -> None:
         """Clear API key from client"""
         self.set_api_key(None)
     
-    def get_config(self) -> Dict[str, Any]:
-        """
-        Get current client configuration
-        
-        Returns:
-            Dictionary with current configuration
-        """
-        return {
-            "base_url": self.base_url,
-            "api_key": "***" + self.api_key[-4:] if self.api_key else None,
-            "timeout": self.timeout,
-            "max_retries": self.max_retries,
-            "retry_delay": self.retry_delay,
-            "verify_ssl": self.verify_ssl,
-            "user_agent": self._get_user_agent()
-        }
+    def _negotiate_compression(self) -> None:
+        """Read the request encodings the server accepts from /health"""
+        try:
+            # /health is exempt from the server's rate limits; keep the tokens
+            self._record_encodings(self._request("GET", "/health", rate_limited=False))
+        except DDEXError as e:
+            self._negotiation_failed(e)
     
     def _request(
         self,
@@ -172,7 +831,41 @@ class DDEXClient:
         Raises:
             Various DDEXError subclasses based on response
         """
-        url = urljoin(self.base_url, endpoint.lstrip('/'))
+        response = self._send(method, endpoint, **kwargs)
+        
+        # Parse successful response
+        try:
+            return self.codec.decode(response.content)
+        except ValueError as e:
+            raise DDEXError(f"Invalid JSON response: {e}")
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        rate_limited: bool = True,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send a request and check its status
+        
+        Handles body encoding and compression, rate limiting and the
+        mapping of error statuses. With ``stream=True`` the body of a
+        successful response is left unread.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            rate_limited: Whether the request takes a rate limiter token
+            **kwargs: Additional request arguments
+            
+        Returns:
+            The successful response
+            
+        Raises:
+            Various DDEXError subclasses based on response
+        """
+        url = self._url(endpoint)
         
         # Set timeout if not provided
         if 'timeout' not in kwargs:
@@ -181,59 +874,57 @@ class DDEXClient:
         # Set SSL verification
         kwargs['verify'] = self.verify_ssl
         
+        # Encode JSON bodies once, to bytes, with the configured codec
+        if 'json' in kwargs:
+            kwargs['data'] = self.codec.encode(kwargs.pop('json'))
+        
+        # Large bodies go compressed when the server accepts an encoding
+        body = kwargs.get('data')
+        encoding = None
+        if body is not None and self.compression:
+            size = self._body_size(body)
+            if self._needs_negotiation(size):
+                self._negotiate_compression()
+            encoding = self._body_encoding(size)
+        if encoding is not None:
+            plain_headers = kwargs.get('headers')
+            kwargs['data'], kwargs['headers'] = self._compressed(body, encoding, plain_headers)
+        
+        limiter = self.rate_limiter if rate_limited else None
         try:
-            response = self.session.request(method, url, **kwargs)
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After', 60)
-                limit = response.headers.get('X-RateLimit-Limit')
-                remaining = response.headers.get('X-RateLimit-Remaining', 0)
+            attempt = 0
+            while True:
+                if limiter is not None:
+                    limiter.acquire()
                 
-                raise RateLimitError(
-                    message="Rate limit exceeded",
-                    retry_after=int(retry_after),
-                    limit=int(limit) if limit else None,
-                    remaining=int(remaining)
-                )
-            
-            # Handle authentication errors
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid or missing API key")
-            
-            # Handle not found
-            if response.status_code == 404:
-                raise NotFoundError(f"Resource not found: {endpoint}")
-            
-            # Handle server errors
-            if response.status_code >= 500:
-                raise ServerError(
-                    f"Server error: {response.status_code}",
-                    status_code=response.status_code
-                )
-            
-            # Handle other client errors
-            if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    message = error_data.get('error', f"API error: {response.status_code}")
-                except:
-                    message = f"API error: {response.status_code}"
+                response = self.session.request(method, url, **kwargs)
                 
-                raise APIError(
-                    message,
-                    status_code=response.status_code,
-                    endpoint=endpoint,
-                    method=method,
-                    response_body=response.text
-                )
+                if limiter is None:
+                    break
+                limiter.update_from_headers(response.headers)
+                if response.status_code != 429 or attempt >= self.max_retries:
+                    break
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                report_retry(retry_after)
+                limiter.pause(retry_after)
+                attempt += 1
             
-            # Parse successful response
-            try:
-                return response.json()
-            except json.JSONDecodeError as e:
-                raise DDEXError(f"Invalid JSON response: {e}")
+            if response.status_code == 415 and encoding is not None:
+                # The server cannot decode the body after all; resend it as-is
+                response.close()
+                self._compression_rejected()
+                kwargs['data'], kwargs['headers'] = body, plain_headers
+                return self._send(method, endpoint, rate_limited, **kwargs)
             
+            self._raise_for_status(
+                response.status_code,
+                response.headers,
+                response.text if response.status_code >= 400 else "",
+                endpoint,
+                method
+            )
+            return response
+        
         except requests.exceptions.Timeout:
             raise TimeoutError(f"Request timed out after {kwargs.get('timeout', self.timeout)} seconds")
         except requests.exceptions.ConnectionError as e:
@@ -245,19 +936,38 @@ class DDEXClient:
     
     def validate(
         self,
-        content: str,
+        content: Union[str, bytes],
         version: str,
         profile: Optional[str] = None,
-        options: Optional[ValidationOptions] = None
+        options: Optional[ValidationOptions] = None,
+        force_remote: bool = False,
+        minify: Optional[bool] = None
     ) -> ValidationResult:
         """
         Validate DDEX content
         
+        With ``local_first`` enabled, local structural/XSD checks run before
+        the API call and documents that fail them are returned without one
+        (``metadata['remote_skipped']``). Each error records its ``engine``.
+        Cache hits and calls coalesced with an identical in-flight call are
+        answered without running the local checks again.
+        
+        Concurrent calls with identical arguments share one request; the
+        callers that joined it get ``metadata['coalesced']`` and see the
+        same exception if it fails.
+        
+        With ``minify``, comments and indentation are stripped from the
+        upload; line breaks are kept and columns translated back, so every
+        reported position refers to ``content`` as given.
+        
         Args:
-            content: XML content to validate
+            content: XML content to validate, as ``str`` or as UTF-8
+                bytes (bytes, mmap), which are sent without decoding
             version: ERN version (e.g., "4.3", "4.2", "3.8.2")
             profile: Optional profile (e.g., "AudioAlbum")
             options: Optional validation options
+            force_remote: Call the API even if local checks fail
+            minify: Minify the upload (defaults to the client setting)
             
         Returns:
             ValidationResult with errors, warnings, and metadata
@@ -267,61 +977,126 @@ class DDEXClient:
             RateLimitError: If rate limit exceeded
             AuthenticationError: If authentication fails
         """
-        payload = {
-            "content": content,
-            "type": "ERN",
-            "version": version
-        }
+        # Cache hits skip local checks, the network and the rate limiter
+        cache_request = self._cache_request(content, version, profile, options)
+        result = self._cached_result(cache_request)
+        if result is not None:
+            return result
         
-        if profile:
-            payload["profile"] = profile
+        def fetch() -> Tuple[Optional[Dict[str, Any]], Optional[ValidationResult]]:
+            local = self._local_result(content, version, profile)
+            if local is not None and not local.valid and not force_remote:
+                return None, local
+            minified = self._minified(content, minify)
+            upload = minified.content if minified is not None else content
+            body = self._encode_validate_body(upload, version, profile, options)
+            response = self._request("POST", "/validate", data=body)
+            if minified is not None:
+                response = minified.remap_response(response)
+            if cache_request is not None:
+                self.cache.store(cache_request, response)
+            return response, local
         
-        # Add options if provided
-        if options:
-            if options.generate_svrl:
-                payload["generateSVRL"] = True
-            if options.verbose:
-                payload["verbose"] = True
-            if options.include_passed_rules:
-                payload["includePassedRules"] = True
-            if options.custom_rules:
-                payload["customRules"] = options.custom_rules
-            if options.max_errors:
-                payload["maxErrors"] = options.max_errors
+        # Calls joining an identical in-flight call skip local checks too
+        if self._flights is not None:
+            key = self._flight_key(content, version, profile, options, force_remote)
+            outcome, shared = self._flights.do(key, fetch)
+        else:
+            outcome, shared = fetch(), False
+        return self._validation_result(outcome, shared)
+    
+    def validate_stream(
+        self,
+        source: Any,
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> ValidationResult:
+        """
+        Validate a document streamed from a file object or chunk iterable
         
-        response = self._request("POST", "/validate", json=payload)
-        
-        # Parse errors
-        errors = [
-            self._parse_error(e) for e in response.get("errors", [])
-        ]
-        
-        # Parse warnings (may be separate from errors)
-        warnings = [
-            self._parse_warning(w) for w in response.get("warnings", [])
-        ]
-        
-        # Parse passed rules if present
-        passed_rules = None
-        if "passedRules" in response:
-            passed_rules = [
-                PassedRule(**rule) for rule in response["passedRules"]
-            ]
-        
-        # Parse summary if present
-        summary = None
-        if "summary" in response:
-            summary = ValidationSummary(**response["summary"])
-        
-        return ValidationResult(
-            valid=response["valid"],
-            errors=errors,
-            warnings=warnings,
-            metadata=response.get("metadata", {}),
-            svrl=response.get("svrl"),
-            passed_rules=passed_rules,
-            summary=summary
-        )
+        The JSON body is written incrementally with chunked transfer
+        encoding: each slice of the document is read, escaped and sent
+        before the next is read, so the document is never held in memory
+        and the upload starts immediately. Caching, coalescing, local-first
+        checks and minification need the whole document and do not apply.
+        
+        Args:
+            source: Binary (UTF-8) or text file object, or an iterable of
+                ``bytes``/``str`` chunks
+            version: ERN version (e.g., "4.3", "4.2", "3.8.2")
+            profile: Optional profile (e.g., "AudioAlbum")
+            options: Optional validation options
+            
+        Returns:
+            ValidationResult with errors, warnings, and metadata
+            
+        Raises:
+            ValidationError: If validation request fails
+            DDEXError: If a retry needs to replay a non-seekable source
+        """
+        body = self._stream_validate_body(source, version, profile, options)
+        response = self._request("POST", "/validate", data=body)
+        return self._validated(response, False)
+    
+    def iter_errors(
+        self,
+        content: Union[str, bytes],
+        version: str,
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None,
+        max_errors: Optional[int] = None,
+        minify: Optional[bool] = None
+    ) -> Iterator[ValidationErrorDetail]:
+        """
+        Validate and yield errors while the response is still arriving
+        
+        The response is read in chunks and parsed incrementally with ijson
+        (``pip install ddex-workbench[stream]``), so the first errors of a
+        response with hundreds of thousands of them are available at once
+        and the full response is never held in memory. Without ijson the
+        body is read completely first. The request is sent when iteration
+        starts; caching, coalescing and local-first checks do not apply.
+        
+        Args:
+            content: XML content to validate (``str`` or UTF-8 bytes)
+            version: ERN version (e.g., "4.3", "4.2", "3.8.2")
+            profile: Optional profile (e.g., "AudioAlbum")
+            options: Optional validation options
+            max_errors: Stop reading the response after this many errors
+            minify: Minify the upload (defaults to the client setting)
+            
+        Yields:
+            ValidationErrorDetail for each error, in response order
+            
+        Raises:
+            ValidationError: If validation request fails
+            NetworkError: If the connection fails while reading
+        """
+        minified = self._minified(content, minify)
+        upload = minified.content if minified is not None else content
+        body = self._encode_validate_body(upload, version, profile, options)
+        response = self._send("POST", "/validate", data=body, stream=True)
+        parser = ErrorStreamParser(self.codec)
+        
+        def batches() -> Iterator[List[Dict[str, Any]]]:
+            for chunk in response.iter_content(RESPONSE_CHUNK_SIZE):
+                yield parser.feed(chunk)
+            yield parser.close()
+        
+        count = 0
+        try:
+            for batch in batches():
+                for item in batch:
+                    yield self._streamed_error(item, minified)
+                    count += 1
+                    if max_errors is not None and count >= max_errors:
+                        # Closing drops the connection; the rest is never read
+                        return
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(f"Connection error while reading response: {e}", original_error=e)
+        finally:
+            response.close()
     
     def validate_with_svrl(
         self,
@@ -344,29 +1119,6 @@ class DDEXClient:
         result = self.validate(content, version, profile, options)
         return result, result.svrl
     
-    def _parse_error(self, error_data: Dict[str, Any]) -> ValidationErrorDetail:
-        """Parse error from API response"""
-        return ValidationErrorDetail(
-            line=error_data.get("line", 0),
-            column=error_data.get("column", 0),
-            message=error_data.get("message", "Unknown error"),
-            severity=error_data.get("severity", "error"),
-            rule=error_data.get("rule"),
-            context=error_data.get("context"),
-            suggestion=error_data.get("suggestion"),
-            xpath=error_data.get("xpath")
-        )
-    
-    def _parse_warning(self, warning_data: Dict[str, Any]) -> ValidationWarning:
-        """Parse warning from API response"""
-        return ValidationWarning(
-            line=warning_data.get("line", 0),
-            column=warning_data.get("column", 0),
-            message=warning_data.get("message", "Unknown warning"),
-            rule=warning_data.get("rule"),
-            context=warning_data.get("context")
-        )
-    
     def health(self) -> HealthStatus:
         """
         Check API health status
@@ -375,15 +1127,8 @@ class DDEXClient:
             HealthStatus object
         """
         response = self._request("GET", "/health")
-        
-        # Handle flexible response format
-        return HealthStatus(
-            status=response.get('status', 'unknown'),
-            version=response.get('version', ''),
-            timestamp=response.get('timestamp', ''),
-            service=response.get('service'),  # Single service field
-            services=response.get('services')  # Multiple services dict
-        )
+        self._record_encodings(response)
+        return self._parse_health(response)
     
     def formats(self) -> SupportedFormats:
         """
@@ -393,34 +1138,7 @@ class DDEXClient:
             SupportedFormats object
         """
         response = self._request("GET", "/formats")
-        
-        # Create result with flexible handling
-        result = SupportedFormats()
-        
-        # Handle different possible response structures
-        if 'formats' in response:
-            result.formats = response['formats']
-        if 'types' in response:
-            result.types = response['types']
-        if 'versions' in response:
-            result.versions = response['versions']
-        if 'profiles' in response:
-            result.profiles = response['profiles']
-        
-        # If we got a types field but no formats, process it
-        if not result.formats and result.types:
-            if isinstance(result.types, list):
-                result.formats = result.types
-            elif isinstance(result.types, dict):
-                result.formats = list(result.types.keys())
-                for fmt, info in result.types.items():
-                    if isinstance(info, dict):
-                        if 'versions' in info:
-                            result.versions[fmt] = info['versions']
-                        if 'profiles' in info:
-                            result.profiles[fmt] = info['profiles']
-        
-        return result
+        return self._parse_formats(response)
     
     def create_api_key(self, name: str) -> ApiKey:
         """
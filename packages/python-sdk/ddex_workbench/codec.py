@@ -0,0 +1,330 @@
+# packages/python-sdk/ddex_workbench/codec.py
+"""
+Pluggable JSON codecs for request bodies and responses
+
+The clients encode payloads to bytes and decode response bodies through
+a JSONCodec. orjson or msgspec are used when installed (``pip install
+ddex-workbench[fast]`` or ``ddex-workbench[msgspec]``); both escape a large XML document in C straight
+into a bytes buffer and decode big error arrays several times faster
+than the standard library, which remains the fallback.
+"""
+
+import json
+import mmap
+import os
+import re
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+from .errors import ConfigurationError, DDEXError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the extra
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised without the extra
+    msgspec = None
+
+
+class JSONCodec:
+    """JSON encoder/decoder used for API traffic"""
+    
+    name = "abstract"
+    
+    def encode(self, obj: Any) -> bytes:
+        """
+        Serialise ``obj`` to UTF-8 JSON bytes
+        
+        Args:
+            obj: JSON-compatible data
+            
+        Returns:
+            Encoded body
+        """
+        raise NotImplementedError
+    
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """
+        Parse a JSON document
+        
+        Args:
+            data: UTF-8 bytes or text
+            
+        Returns:
+            Decoded data
+            
+        Raises:
+            ValueError: If ``data`` is not valid JSON
+        """
+        raise NotImplementedError
+    
+    def __repr__(self) -> str:
+        return f"<JSONCodec {self.name}>"
+
+
+class StdlibCodec(JSONCodec):
+    """Codec built on the standard library ``json`` module"""
+    
+    name = "json"
+    
+    def __init__(self):
+        # ASCII output makes the final encode a plain copy; escaping
+        # non-ASCII is cheaper than encoding a wide str to UTF-8
+        self._encoder = json.JSONEncoder(separators=(',', ':'), allow_nan=False)
+    
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode('ascii')
+    
+    def decode(self, data: Union[bytes, str]) -> Any:
+        if isinstance(data, bytes):
+            # json.loads(bytes) decodes with 'surrogatepass', which is slower
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec built on orjson"""
+    
+    name = "orjson"
+    
+    def __init__(self):
+        if orjson is None:
+            raise ConfigurationError(
+                "The orjson codec requires orjson. "
+                "Install it with: pip install ddex-workbench[fast]",
+                config_key="orjson"
+            )
+    
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+    
+    def decode(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError subclasses ValueError
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec built on msgspec"""
+    
+    name = "msgspec"
+    
+    def __init__(self):
+        if msgspec is None:
+            raise ConfigurationError(
+                "The msgspec codec requires msgspec. "
+                "Install it with: pip install ddex-workbench[msgspec]",
+                config_key="msgspec"
+            )
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+    
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+    
+    def decode(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+# Escaping UTF-8 XML directly as bytes: multi-byte sequences never contain
+# ASCII bytes, so only quote, backslash and control bytes need rewriting
+_COMMON_ESCAPES = ((b'\\', b'\\\\'), (b'"', b'\\"'), (b'\n', b'\\n'), (b'\r', b'\\r'), (b'\t', b'\\t'))
+_OTHER_CONTROL = re.compile(rb'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def escape_json_bytes(data: bytes) -> bytes:
+    """
+    Escape UTF-8 bytes for use inside a JSON string literal
+    
+    Args:
+        data: UTF-8 encoded text
+        
+    Returns:
+        Escaped bytes (without the surrounding quotes)
+    """
+    for raw, escaped in _COMMON_ESCAPES:
+        if raw in data:
+            data = data.replace(raw, escaped)
+    if _OTHER_CONTROL.search(data):
+        data = _OTHER_CONTROL.sub(lambda m: b'\\u%04x' % m.group()[0], data)
+    return data
+
+
+# Documents at least this large are streamed rather than encoded up front
+STREAM_THRESHOLD = 4 * 1024 * 1024
+
+# Slice size for escaping; streamed bodies send smaller slices so that
+# only a few hundred KB of the document are in flight at a time
+CHUNK_SIZE = 1024 * 1024
+STREAM_CHUNK_SIZE = 256 * 1024
+
+# Documents that are sliced rather than read
+_SLICEABLE = (str, bytes, bytearray, memoryview, mmap.mmap)
+
+
+class DocumentBody:
+    """
+    Streamed JSON body ``{key: <document>, **fields}``
+    
+    The envelope is encoded once; the document is read, escaped and
+    yielded one slice at a time, so the body is never held in memory and
+    sending starts before a file has been fully read. Transports send it
+    with chunked transfer encoding.
+    
+    The document may be ``str``, UTF-8 bytes (bytes, mmap), a file object
+    or an iterable of ``bytes``/``str`` chunks. Iterating the body again
+    (e.g. when a request is retried) starts over: bytes and strings are
+    re-sliced and seekable files rewound. One-shot sources raise
+    DDEXError if replayed.
+    """
+    
+    def __init__(
+        self,
+        codec: JSONCodec,
+        fields: Dict[str, Any],
+        source: Any,
+        key: str = "content",
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ):
+        rest = codec.encode(fields)
+        self._head = b'{' + codec.encode(key) + b':"'
+        self._tail = b'",' + rest[1:] if len(rest) > 2 else b'"}'
+        self._source = source
+        self._chunk_size = chunk_size
+        self._iterations = 0
+        
+        # Files are rewound to where they were; iterators cannot be replayed
+        self._sliced = isinstance(source, _SLICEABLE)
+        self._file = not self._sliced and hasattr(source, "read")
+        self._start: Optional[int] = None
+        if self._file and _seekable(source):
+            self._start = source.tell()
+        self._one_shot = not (self._sliced or self._file) and iter(source) is source
+        self.size_hint = _size_hint(source)
+    
+    def _chunks(self) -> Iterator[Any]:
+        source, size = self._source, self._chunk_size
+        replay = self._iterations > 1
+        if self._sliced:
+            return (source[i:i + size] for i in range(0, len(source), size))
+        if self._file:
+            if replay:
+                if self._start is None:
+                    raise DDEXError("Streamed document cannot be replayed: file is not seekable")
+                source.seek(self._start)
+            return iter(lambda: source.read(size), source.read(0))
+        if replay and self._one_shot:
+            raise DDEXError("Streamed document cannot be replayed: source is an iterator")
+        return iter(source)
+    
+    def __iter__(self) -> Iterator[bytes]:
+        self._iterations += 1
+        chunks = self._chunks()
+        yield self._head
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            elif isinstance(chunk, memoryview):
+                chunk = bytes(chunk)
+            if chunk:
+                yield escape_json_bytes(chunk)
+        yield self._tail
+
+
+def _seekable(source: Any) -> bool:
+    try:
+        return bool(source.seekable())
+    except (AttributeError, ValueError, OSError):
+        return False
+
+
+def _size_hint(source: Any) -> Optional[int]:
+    """Document size in characters/bytes, if known without reading it"""
+    if isinstance(source, _SLICEABLE):
+        return len(source)
+    if hasattr(source, "read"):
+        try:
+            return os.fstat(source.fileno()).st_size - source.tell()
+        except (AttributeError, ValueError, OSError):
+            return None
+    if isinstance(source, (list, tuple)):
+        return sum(len(chunk) for chunk in source)
+    return None
+
+
+def encode_document_body(
+    codec: JSONCodec,
+    fields: Dict[str, Any],
+    content: Union[bytes, bytearray, memoryview, Any],
+    key: str = "content",
+    chunk_size: int = CHUNK_SIZE
+) -> bytearray:
+    """
+    Encode ``{key: content, **fields}`` with ``content`` given as UTF-8 bytes
+    
+    The content is escaped slice by slice into a single buffer, so it is
+    never decoded to ``str`` and the body is the only full-size copy.
+    
+    Args:
+        codec: Codec for the remaining fields
+        fields: Other JSON fields
+        content: UTF-8 bytes, or any sliceable bytes-like object (e.g. mmap)
+        key: Field name for the content
+        chunk_size: Slice size for escaping
+        
+    Returns:
+        The JSON body
+    """
+    body = bytearray()
+    for part in DocumentBody(codec, fields, content, key, chunk_size):
+        body += part
+    return body
+
+
+_CODECS: Dict[str, Callable[[], JSONCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    StdlibCodec.name: StdlibCodec,
+}
+
+
+def available_codecs() -> list:
+    """Names of the codecs usable in this environment, fastest first"""
+    names = []
+    if orjson is not None:
+        names.append(OrjsonCodec.name)
+    if msgspec is not None:
+        names.append(MsgspecCodec.name)
+    names.append(StdlibCodec.name)
+    return names
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Resolve a codec
+    
+    Args:
+        codec: A JSONCodec, a name ("orjson", "msgspec", "json"), or
+            None/"auto" for the fastest installed codec
+        
+    Returns:
+        JSONCodec instance
+        
+    Raises:
+        ConfigurationError: If the codec is unknown or not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None or codec == "auto":
+        codec = available_codecs()[0]
+    factory: Optional[Callable[[], JSONCodec]] = _CODECS.get(codec)
+    if factory is None:
+        raise ConfigurationError(
+            f"Unknown JSON codec '{codec}'. Choose from: {', '.join(_CODECS)}",
+            config_key="json_codec"
+        )
+    return factory()
@@ -0,0 +1,217 @@
+# packages/python-sdk/ddex_workbench/compact.py
+"""
+Memory-compact storage of validation issues for large batches
+
+Rule IDs, messages and contexts repeat across the files of a batch.
+StringPool shares one copy of each string, compact_result() applies it
+to a retained result, and ErrorTable stores issues column by column
+with strings reduced to integer codes.
+"""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .lazy import materialize
+from .types import ValidationError, ValidationResult, ValidationWarning
+
+
+_ERROR_STRINGS = ("message", "severity", "rule", "context", "suggestion", "xpath", "engine")
+_WARNING_STRINGS = ("message", "rule", "context", "engine")
+
+
+class StringPool:
+    """Interns strings within one batch (unlike sys.intern, freed with the pool)"""
+    
+    __slots__ = ("_strings",)
+    
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+    
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        """Return the pooled copy of ``value``"""
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+    
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+def compact_result(result: ValidationResult, pool: StringPool) -> ValidationResult:
+    """
+    Prepare a result for long-term retention
+    
+    Lazy results are materialized (dropping the raw response) and the
+    strings of every error and warning are replaced by pooled copies.
+    
+    Args:
+        result: Validation result
+        pool: Batch string pool
+        
+    Returns:
+        The compacted result (the same object for plain results)
+    """
+    result = materialize(result)
+    for error in result.errors:
+        for name in _ERROR_STRINGS:
+            setattr(error, name, pool.intern(getattr(error, name)))
+    for warning in result.warnings:
+        for name in _WARNING_STRINGS:
+            setattr(warning, name, pool.intern(getattr(warning, name)))
+    return result
+
+
+class ErrorTable:
+    """
+    Columnar table of the errors and warnings of many results
+    
+    Each issue is one row; line and column numbers are stored in typed
+    arrays and every string column as a code into a shared string list,
+    so a row costs a few dozen bytes instead of a dataclass instance.
+    Rows are rebuilt into ValidationError/ValidationWarning on access.
+    """
+    
+    STRING_COLUMNS = ("source", "message", "severity", "rule", "context", "suggestion", "xpath", "engine")
+    
+    def __init__(self):
+        self._strings: List[Optional[str]] = [None]
+        self._codes: Dict[str, int] = {}
+        self._warning = array('b')
+        self._line = array('l')
+        self._column = array('l')
+        self._text: Dict[str, array] = {name: array('L') for name in self.STRING_COLUMNS}
+    
+    def _code(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+    
+    def _append(self, issue: Union[ValidationError, ValidationWarning], source: Optional[str]) -> None:
+        is_warning = isinstance(issue, ValidationWarning)
+        self._warning.append(is_warning)
+        self._line.append(issue.line or 0)
+        self._column.append(issue.column or 0)
+        for name in self.STRING_COLUMNS:
+            if name == "source":
+                value = source
+            elif name == "severity":
+                value = "warning" if is_warning else issue.severity
+            else:
+                value = getattr(issue, name, None)
+            self._text[name].append(self._code(value))
+    
+    def add(self, result: ValidationResult, source: Optional[str] = None) -> int:
+        """
+        Append the errors and warnings of a result
+        
+        Args:
+            result: Validation result
+            source: Row label; defaults to ``metadata['file']``
+            
+        Returns:
+            Number of rows added
+        """
+        if source is None:
+            source = result.metadata.get('file') if result.metadata else None
+        before = len(self)
+        for error in result.errors:
+            self._append(error, source)
+        for warning in result.warnings:
+            self._append(warning, source)
+        return len(self) - before
+    
+    def __len__(self) -> int:
+        return len(self._line)
+    
+    def _value(self, name: str, index: int) -> Optional[str]:
+        return self._strings[self._text[name][index]]
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Return one row as a dictionary
+        
+        Args:
+            index: Row number
+            
+        Returns:
+            Dictionary with source, line, column and the string columns
+        """
+        data: Dict[str, Any] = {name: self._value(name, index) for name in self.STRING_COLUMNS}
+        data["line"] = self._line[index]
+        data["column"] = self._column[index]
+        return data
+    
+    def __getitem__(self, index: int) -> Union[ValidationError, ValidationWarning]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        data = self.row(index)
+        if self._warning[index]:
+            return ValidationWarning(
+                line=data["line"], column=data["column"], message=data["message"],
+                rule=data["rule"], context=data["context"], engine=data["engine"]
+            )
+        del data["source"]
+        return ValidationError(**data)
+    
+    def __iter__(self) -> Iterator[Union[ValidationError, ValidationWarning]]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def column(self, name: str) -> List[Any]:
+        """
+        Values of one column
+        
+        Args:
+            name: "line", "column" or one of STRING_COLUMNS
+            
+        Returns:
+            List of values, one per row
+        """
+        if name == "line":
+            return list(self._line)
+        if name == "column":
+            return list(self._column)
+        if name not in self._text:
+            raise KeyError(name)
+        strings = self._strings
+        return [strings[code] for code in self._text[name]]
+    
+    def counts(self, name: str = "rule") -> Dict[Optional[str], int]:
+        """
+        Number of rows per value of a string column
+        
+        Args:
+            name: Column to group by (default "rule")
+            
+        Returns:
+            Dictionary of value to count, most common first
+        """
+        strings = self._strings
+        return {strings[code]: n for code, n in Counter(self._text[name]).most_common()}
+    
+    def select(self, **criteria: Optional[str]) -> Iterator[int]:
+        """
+        Row numbers whose string columns equal the given values
+        
+        Example: ``table.select(rule="ERN-001", severity="error")``
+        
+        Yields:
+            Matching row numbers
+        """
+        wanted = []
+        for name, value in criteria.items():
+            if name not in self._text:
+                raise KeyError(name)
+            if value is not None and value not in self._codes:
+                return
+            wanted.append((self._text[name], self._code(value)))
+        for i in range(len(self)):
+            if all(column[i] == code for column, code in wanted):
+                yield i
@@ -0,0 +1,223 @@
+# packages/python-sdk/ddex_workbench/concurrency.py
+"""Adaptive concurrency control for batch validation"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional, Union
+
+from .errors import NetworkError, RateLimitError, ServerError, TimeoutError
+
+
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MAX_LIMIT = 64
+
+# Failures that mean the server is saturated rather than the file is bad
+OVERLOAD_ERRORS = (RateLimitError, ServerError, TimeoutError, NetworkError)
+
+# Controller of the batch validation running in the current thread or task
+_active: "ContextVar[Optional[AdaptiveConcurrency]]" = ContextVar("ddex_adaptive", default=None)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD controller for the number of in-flight validations
+    
+    Every successful validation adds ``1 / limit`` to the limit, so it
+    grows by about one per round trip. The limit is cut by ``decrease``
+    when a request fails with 429/5xx/timeout or when smoothed latency
+    exceeds ``latency_tolerance`` times the best latency observed, i.e.
+    once queueing starts on the server. A ``Retry-After`` also freezes
+    growth until it expires. At most one cut is applied per round trip,
+    since requests already in flight report the same congestion.
+    
+    Throttled and failed attempts that the client retries are reported
+    as well (record_retry()), so congestion is seen on the first 429 or
+    5xx rather than only once a request has run out of retries.
+    """
+    
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        on_change: Optional[Callable[[int], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize controller
+        
+        Args:
+            initial: Starting concurrency
+            min_limit: Lowest concurrency
+            max_limit: Highest concurrency
+            decrease: Multiplicative decrease factor (0-1)
+            latency_tolerance: Latency inflation over the baseline that
+                counts as congestion
+            smoothing: Weight of each new sample in the latency average
+            on_change: Called with the new limit whenever it changes
+            clock: Monotonic clock (injectable for testing)
+        """
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.on_change = on_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self._baseline: Optional[float] = None
+        self._latency: Optional[float] = None
+        self._last_decrease = float('-inf')
+        self._hold_until = float('-inf')
+    
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit"""
+        return int(self._limit)
+    
+    @property
+    def latency(self) -> Optional[float]:
+        """Smoothed latency in seconds"""
+        return self._latency
+    
+    def record(
+        self,
+        latency: float,
+        error: Optional[BaseException] = None,
+        retry_after: Optional[float] = None
+    ) -> int:
+        """
+        Feed the outcome of one validation
+        
+        Args:
+            latency: Seconds the validation took
+            error: Exception raised by the validation, if any; only
+                overload errors (429, 5xx, timeouts) reduce the limit
+            retry_after: Server-requested delay in seconds
+            
+        Returns:
+            The updated limit
+        """
+        if retry_after is None and isinstance(error, RateLimitError) and error.retry_after:
+            retry_after = float(error.retry_after)
+        overloaded = isinstance(error, OVERLOAD_ERRORS)
+        return self._update(latency if error is None else None, overloaded, retry_after)
+    
+    def record_retry(self, retry_after: Optional[float] = None) -> int:
+        """
+        Feed one attempt that failed with 429/5xx or a connection error
+        and was retried by the client
+        
+        Args:
+            retry_after: Server-requested delay in seconds
+            
+        Returns:
+            The updated limit
+        """
+        return self._update(None, True, retry_after)
+    
+    def _update(
+        self,
+        latency: Optional[float],
+        overloaded: bool,
+        retry_after: Optional[float]
+    ) -> int:
+        """Apply one outcome; ``latency`` is None for failures"""
+        with self._lock:
+            before = self.limit
+            now = self._clock()
+            if retry_after:
+                self._hold_until = max(self._hold_until, now + retry_after)
+            
+            if overloaded or retry_after:
+                self._cut(now)
+            elif latency is not None:
+                self._observe(latency)
+                if self._latency > self._baseline * self.latency_tolerance:
+                    self._cut(now)
+                elif now >= self._hold_until:
+                    self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            after = self.limit
+        
+        if after != before and self.on_change:
+            self.on_change(after)
+        return after
+    
+    def _observe(self, latency: float) -> None:
+        """Update the smoothed and baseline latency (lock must be held)"""
+        if self._latency is None:
+            self._latency = self._baseline = latency
+            return
+        self._latency += self.smoothing * (latency - self._latency)
+        # Let the baseline drift up slowly so a permanently slower server
+        # is not treated as congested forever
+        self._baseline = min(latency, self._baseline * 1.001) if self._baseline else latency
+    
+    def _cut(self, now: float) -> None:
+        """Multiplicative decrease, once per round trip (lock must be held)"""
+        if now - self._last_decrease < (self._latency or 0.0):
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease)
+        if self._latency is not None and self._baseline:
+            # Forget latency measured at the old, higher limit
+            self._latency = min(self._latency, self._baseline * self.latency_tolerance)
+    
+    def __repr__(self) -> str:
+        return f"AdaptiveConcurrency(limit={self.limit}, latency={self._latency!r})"
+
+
+def resolve_controller(
+    adaptive: Union[bool, AdaptiveConcurrency, None],
+    initial: int
+) -> Optional[AdaptiveConcurrency]:
+    """
+    Normalise an ``adaptive`` argument
+    
+    Args:
+        adaptive: True for a default controller, a controller, or False/None
+        initial: Starting limit for a default controller
+        
+    Returns:
+        Controller, or None when adaptive mode is off
+    """
+    if isinstance(adaptive, AdaptiveConcurrency):
+        return adaptive
+    if adaptive:
+        return AdaptiveConcurrency(initial=initial)
+    return None
+
+
+@contextmanager
+def controlling(controller: AdaptiveConcurrency) -> Iterator[None]:
+    """
+    Make ``controller`` receive the retries of requests made in this block
+    
+    The controller is bound to the current thread or asyncio task, which
+    is where the clients run their retry loops.
+    """
+    token = _active.set(controller)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def report_retry(retry_after: Optional[float] = None) -> None:
+    """
+    Report a throttled or failed attempt that is about to be retried
+    
+    Args:
+        retry_after: Server-requested delay in seconds
+    """
+    controller = _active.get()
+    if controller is not None:
+        controller.record_retry(retry_after)
@@ -0,0 +1,369 @@
+# packages/python-sdk/ddex_workbench/document.py
+"""Parsed DDEX document shared by detection, metadata extraction and validation"""
+
+import mmap
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from .errors import FileError
+from .sniffer import DEFAULT_MAX_BYTES, profile_from_attribute, root_version, sniff
+
+
+_UNSET = object()
+
+# Slice size when feeding bytes-like content to a parser
+_FEED_SIZE = 1024 * 1024
+
+# Elements counted by the metadata walk, keyed by local name
+_COUNTED = {
+    'Release': 'release_count',
+    'SoundRecording': 'sound_recording_count',
+    'Video': 'video_count',
+    'ReleaseDeal': 'deal_count',
+}
+
+# Header fields recorded by the metadata walk: (parent, element) -> key
+_HEADER_FIELDS = {
+    ('MessageHeader', 'MessageId'): 'message_id',
+    ('MessageHeader', 'MessageCreatedDateTime'): 'created_date',
+}
+
+def split_tag(tag: str) -> Tuple[str, str]:
+    """
+    Split an ElementTree tag into namespace and local name
+    
+    Args:
+        tag: Tag such as "{http://ddex.net/xml/ern/43}Release"
+        
+    Returns:
+        Tuple of (namespace, local name); namespace is "" if unqualified
+    """
+    if tag[:1] == '{':
+        namespace, _, local = tag[1:].partition('}')
+        return namespace, local
+    return '', tag
+
+
+class MetadataCollector:
+    """
+    Accumulates message metadata from start/end element events
+    
+    Fed either by a walk over a parsed tree or directly by ``iterparse``,
+    so both produce the same fields. Elements are matched by local name
+    within the root's namespace (or unqualified, as ERN children are).
+    """
+    
+    def __init__(self):
+        self.namespace: Optional[str] = None
+        self.root_attrib: Dict[str, str] = {}
+        self.fields: Dict[str, str] = {}
+        self.counts: Dict[str, int] = {key: 0 for key in _COUNTED.values()}
+        self._path: List[Optional[str]] = []
+    
+    def _local(self, tag: Any) -> Optional[str]:
+        if not isinstance(tag, str):
+            return None
+        namespace, local = split_tag(tag)
+        if namespace and namespace != self.namespace:
+            return None
+        return local
+    
+    def start(self, tag: Any, attrib: Optional[Dict[str, str]] = None) -> None:
+        """Record an element start"""
+        if self.namespace is None:
+            self.namespace = split_tag(tag)[0]
+            self.root_attrib = dict(attrib or {})
+        local = self._local(tag)
+        if local in _COUNTED:
+            self.counts[_COUNTED[local]] += 1
+        self._path.append(local)
+    
+    def end(self, tag: Any, text: Optional[str]) -> None:
+        """Record an element end along with its text"""
+        local = self._path.pop()
+        if not text or local is None:
+            return
+        parent = self._path[-1] if self._path else None
+        key = _HEADER_FIELDS.get((parent, local))
+        if key is None and local == 'FullName' and parent == 'PartyName' and 'MessageSender' in self._path:
+            key = 'sender'
+        if key is not None and key not in self.fields:
+            self.fields[key] = text
+    
+    @property
+    def structural_profile(self) -> Optional[str]:
+        """Profile guessed from resource and release counts"""
+        videos = self.counts['video_count']
+        sounds = self.counts['sound_recording_count']
+        if videos and not sounds:
+            return 'Video'
+        if sounds and not videos:
+            return 'AudioSingle' if self.counts['release_count'] == 1 else 'AudioAlbum'
+        return None
+
+
+def _walk(root: ET.Element) -> Iterator[Tuple[str, ET.Element]]:
+    """Yield ("start"/"end", element) events for a tree without recursion"""
+    stack: List[Tuple[ET.Element, bool]] = [(root, False)]
+    while stack:
+        elem, done = stack.pop()
+        if done:
+            yield 'end', elem
+            continue
+        yield 'start', elem
+        stack.append((elem, True))
+        stack.extend((child, False) for child in reversed(elem))
+
+
+class DDEXDocument:
+    """
+    A DDEX message parsed at most once
+    
+    Version, profile, header fields and release/resource/deal counts are
+    computed lazily, the structural ones in a single walk of the tree.
+    Pass a DDEXDocument to the validator and ``utils`` helpers instead of a
+    string to avoid re-parsing the same message for each of them.
+    Bytes-like content (bytes, mmap) is parsed as UTF-8 in slices and only
+    decoded to ``str`` if ``content`` is read.
+    """
+    
+    def __init__(
+        self,
+        content: Union[str, bytes, mmap.mmap, memoryview],
+        path: Optional[Union[str, Path]] = None
+    ):
+        """
+        Wrap XML content
+        
+        Args:
+            content: XML content (``str`` or UTF-8 bytes-like)
+            path: Optional file the content was read from
+        """
+        self._text: Optional[str] = content if isinstance(content, str) else None
+        self._data = None if isinstance(content, str) else content
+        self.path = Path(path) if path is not None else None
+        self._root: Optional[ET.Element] = None
+        self._parsed = False
+        self._parse_error: Optional[str] = None
+        self._parse_position: Optional[Tuple[int, int]] = None
+        self._collector: Optional[MetadataCollector] = None
+        self._version: Any = _UNSET
+    
+    @classmethod
+    def from_file(cls, filepath: Union[str, Path]) -> "DDEXDocument":
+        """
+        Read a document from disk
+        
+        Args:
+            filepath: Path to XML file
+            
+        Returns:
+            DDEXDocument instance
+            
+        Raises:
+            FileError: If file cannot be read
+        """
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileError(f"File not found: {filepath}", filepath=str(filepath))
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            raise FileError(f"Failed to read file: {e}", filepath=str(filepath))
+        return cls(content, path=filepath)
+    
+    @classmethod
+    def coerce(cls, content: Union[str, bytes, "DDEXDocument"]) -> "DDEXDocument":
+        """Return ``content`` as a DDEXDocument, wrapping strings"""
+        return content if isinstance(content, cls) else cls(content)
+    
+    @property
+    def content(self) -> str:
+        """XML content as text, decoded from bytes-like content on first access"""
+        if self._text is None:
+            self._text = str(self._data, 'utf-8')
+        return self._text
+    
+    def iter_bytes(self, chunk_size: int = _FEED_SIZE) -> Iterator[bytes]:
+        """
+        Yield the content as UTF-8 slices, for feeding a parser
+        
+        Bytes-like content is sliced in place rather than copied whole,
+        so a memory-mapped file is never duplicated in memory.
+        """
+        if self._data is None:
+            yield self.content.encode('utf-8')
+            return
+        with memoryview(self._data) as view:
+            for start in range(0, len(view), chunk_size):
+                yield view[start:start + chunk_size].tobytes()
+    
+    @property
+    def root(self) -> Optional[ET.Element]:
+        """Root element, or None if the content is not well-formed"""
+        if not self._parsed:
+            self._parsed = True
+            try:
+                if self._data is None:
+                    self._root = ET.fromstring(self._text)
+                else:
+                    parser = ET.XMLParser()
+                    for chunk in self.iter_bytes():
+                        parser.feed(chunk)
+                    self._root = parser.close()
+            except ET.ParseError as e:
+                self._parse_error = str(e)
+                line, column = e.position
+                self._parse_position = (line, column + 1)
+        return self._root
+    
+    @property
+    def parse_error(self) -> Optional[str]:
+        """Parser message if the content is not well-formed"""
+        self.root  # parse on first access
+        return self._parse_error
+    
+    @property
+    def parse_position(self) -> Optional[Tuple[int, int]]:
+        """(line, column) of the parse error, if any"""
+        self.root  # parse on first access
+        return self._parse_position
+    
+    @property
+    def namespace(self) -> str:
+        """Namespace URI of the root element ("" if unqualified)"""
+        root = self.root
+        return split_tag(root.tag)[0] if root is not None else ''
+    
+    @property
+    def collector(self) -> Optional[MetadataCollector]:
+        """Result of the fused metadata walk (None if not well-formed)"""
+        if self._collector is None and self.root is not None:
+            collector = MetadataCollector()
+            for event, elem in _walk(self.root):
+                if event == 'start':
+                    collector.start(elem.tag, elem.attrib)
+                else:
+                    collector.end(elem.tag, elem.text)
+            self._collector = collector
+        return self._collector
+    
+    @property
+    def version(self) -> Optional[str]:
+        """Detected ERN version"""
+        if self._version is _UNSET:
+            if self._data is None:
+                head: Union[str, bytes] = self._text
+            else:
+                with memoryview(self._data) as view:
+                    head = view[:DEFAULT_MAX_BYTES].tobytes()
+            self._version = sniff(head).version
+        return self._version
+    
+    @property
+    def profile(self) -> Optional[str]:
+        """Detected profile"""
+        if self.root is None:
+            return None
+        profile = profile_from_attribute(self.root.get('ReleaseProfileVersionId', ''))
+        if profile:
+            return profile
+        return self.collector.structural_profile
+    
+    @property
+    def message_id(self) -> Optional[str]:
+        """MessageHeader/MessageId"""
+        collector = self.collector
+        return collector.fields.get('message_id') if collector else None
+    
+    @property
+    def created_date(self) -> Optional[str]:
+        """MessageHeader/MessageCreatedDateTime"""
+        collector = self.collector
+        return collector.fields.get('created_date') if collector else None
+    
+    @property
+    def sender(self) -> Optional[str]:
+        """Full name of the MessageSender party"""
+        collector = self.collector
+        return collector.fields.get('sender') if collector else None
+    
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Message metadata in the shape returned by extract_metadata()
+        
+        Returns:
+            Dictionary with version, profile, header fields and counts, or
+            with "parse_error" if the content is not well-formed
+        """
+        if self.root is None:
+            return {'parse_error': self.parse_error}
+        return build_metadata(self.collector, self.version, self.profile)
+
+
+def build_metadata(
+    collector: MetadataCollector,
+    version: Optional[str],
+    profile: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Assemble the extract_metadata() dictionary from a collector
+    
+    Args:
+        collector: Completed MetadataCollector
+        version: Detected version
+        profile: Detected profile
+        
+    Returns:
+        Metadata dictionary
+    """
+    metadata: Dict[str, Any] = {'version': version, 'profile': profile}
+    metadata.update(collector.fields)
+    counts = collector.counts
+    metadata['release_count'] = counts['release_count']
+    metadata['sound_recording_count'] = counts['sound_recording_count']
+    metadata['video_count'] = counts['video_count']
+    metadata['total_resources'] = counts['sound_recording_count'] + counts['video_count']
+    metadata['deal_count'] = counts['deal_count']
+    return metadata
+
+
+def stream_metadata(source: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
+    """
+    Extract message metadata without building the whole tree
+    
+    Uses ``iterparse`` and discards every element once it has ended, so
+    memory stays bounded by document depth rather than size. Returns the
+    same dictionary as DDEXDocument.metadata().
+    
+    Args:
+        source: File path or binary file object
+        
+    Returns:
+        Metadata dictionary, or {"parse_error": ...} if not well-formed
+    """
+    collector = MetadataCollector()
+    stack: List[ET.Element] = []
+    try:
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                collector.start(elem.tag, elem.attrib)
+                stack.append(elem)
+                continue
+            collector.end(elem.tag, elem.text)
+            stack.pop()
+            elem.clear()
+            # Detach the finished element; it is always the last child
+            if stack and len(stack[-1]) and stack[-1][-1] is elem:
+                del stack[-1][-1]
+    except ET.ParseError as e:
+        return {'parse_error': str(e)}
+    
+    version = root_version(collector.namespace or '', collector.root_attrib)
+    profile = (
+        profile_from_attribute(collector.root_attrib.get('ReleaseProfileVersionId', ''))
+        or collector.structural_profile
+    )
+    return build_metadata(collector, version, profile)
@@ -0,0 +1,105 @@
+# packages/python-sdk/ddex_workbench/incremental.py
+"""
+Incremental parsing of large /validate responses
+
+A broken 50k-track message can produce hundreds of thousands of errors.
+ErrorStreamParser is fed the response body chunk by chunk and hands back
+each error as soon as it is complete, so callers can act on the first
+errors (or stop reading) while the rest is still arriving. It uses ijson
+when installed (``pip install ddex-workbench[stream]``); without it the
+body is buffered and decoded once complete.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .codec import JSONCodec
+from .errors import DDEXError
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised without the extra
+    ijson = None
+
+
+# Read size for streamed responses
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+
+class ErrorStreamParser:
+    """
+    Push parser for the ``errors`` array of a /validate response
+    
+    feed() each chunk of the body, then close(); both return the error
+    objects (dicts) completed by that call, in document order.
+    """
+    
+    def __init__(self, codec: JSONCodec):
+        """
+        Create a parser
+        
+        Args:
+            codec: Codec for decoding the buffered body when ijson is missing
+        """
+        self._codec = codec
+        self._buffer: Optional[bytearray] = None
+        if ijson is not None:
+            self._items = ijson.sendable_list()
+            self._parser = ijson.items_coro(self._items, "errors.item", use_float=True)
+        else:
+            self._buffer = bytearray()
+    
+    @property
+    def incremental(self) -> bool:
+        """True if errors are returned while the body is still arriving"""
+        return self._buffer is None
+    
+    def _drain(self) -> List[Dict[str, Any]]:
+        items = list(self._items)
+        del self._items[:]
+        return items
+    
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """
+        Parse the next chunk of the body
+        
+        Args:
+            chunk: Raw (decompressed) body bytes
+            
+        Returns:
+            Errors completed by this chunk
+            
+        Raises:
+            DDEXError: If the body is not valid JSON
+        """
+        if self._buffer is not None:
+            self._buffer += chunk
+            return []
+        try:
+            self._parser.send(chunk)
+        except ijson.JSONError as e:
+            raise DDEXError(f"Invalid JSON response: {e}")
+        return self._drain()
+    
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        Finish parsing once the whole body has been fed
+        
+        Returns:
+            Errors not yet returned
+            
+        Raises:
+            DDEXError: If the body is incomplete or not valid JSON
+        """
+        if self._buffer is not None:
+            try:
+                response = self._codec.decode(bytes(self._buffer))
+            except ValueError as e:
+                raise DDEXError(f"Invalid JSON response: {e}")
+            finally:
+                self._buffer = bytearray()
+            return list(response.get("errors") or []) if isinstance(response, dict) else []
+        try:
+            self._parser.close()
+        except ijson.JSONError as e:
+            raise DDEXError(f"Invalid JSON response: {e}")
+        return self._drain()
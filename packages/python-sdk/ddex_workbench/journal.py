@@ -0,0 +1,268 @@
+# packages/python-sdk/ddex_workbench/journal.py
+"""Durable checkpoint journal for resumable batch validation"""
+
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .lazy import materialize
+from .types import (
+    PassedRule,
+    ValidationError,
+    ValidationResult,
+    ValidationSummary,
+    ValidationWarning,
+)
+
+
+KEY_STAT = "stat"
+KEY_HASH = "hash"
+
+# Rows written per transaction by the writer thread
+_WRITE_BATCH = 256
+_CLOSE = object()
+
+
+def result_to_dict(result: ValidationResult) -> Dict[str, Any]:
+    """Serialise a ValidationResult to JSON-compatible data"""
+    return asdict(materialize(result))
+
+
+def result_from_dict(data: Dict[str, Any]) -> ValidationResult:
+    """Rebuild a ValidationResult serialised by result_to_dict()"""
+    passed_rules = data.get("passed_rules")
+    summary = data.get("summary")
+    return ValidationResult(
+        valid=data["valid"],
+        errors=[ValidationError(**e) for e in data.get("errors", [])],
+        warnings=[ValidationWarning(**w) for w in data.get("warnings", [])],
+        metadata=dict(data.get("metadata") or {}),
+        svrl=data.get("svrl"),
+        passed_rules=[PassedRule(**r) for r in passed_rules] if passed_rules is not None else None,
+        summary=ValidationSummary(**summary) if summary else None
+    )
+
+
+class CheckpointJournal:
+    """
+    SQLite journal of finished validations, for resuming batch runs
+    
+    Each file is keyed by its path, size and modification time
+    (``key="stat"``) or by a SHA-256 of its content (``key="hash"``,
+    which survives moves and touches but reads every file), plus the
+    version and profile. A rerun of ``iter_validate``/``validate_batch``
+    with the same journal yields stored results for unchanged files and
+    only validates the rest.
+    
+    The database runs in WAL mode. ``record()`` only enqueues; a single
+    writer thread commits rows in batches, so workers never wait on disk
+    writes and lookups are not blocked by them. In hash mode the batch
+    workers key each file from the digest of the bytes they read for
+    upload (digest_key()), so files are read once.
+    """
+    
+    def __init__(self, path: Union[str, Path], key: str = KEY_STAT):
+        """
+        Open (or create) a journal
+        
+        Args:
+            path: SQLite database file
+            key: "stat" (path, size, mtime) or "hash" (content SHA-256)
+        """
+        if key not in (KEY_STAT, KEY_HASH):
+            raise ValueError(f"key must be '{KEY_STAT}' or '{KEY_HASH}'")
+        self.path = str(Path(path).expanduser())
+        self.key_mode = key
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, path TEXT NOT NULL, valid INTEGER NOT NULL, "
+                "result TEXT NOT NULL, recorded REAL NOT NULL)"
+            )
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="ddex-journal", daemon=True)
+        self._writer.start()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def key(self, filepath: Union[str, Path], version: str, profile: Optional[str] = None) -> str:
+        """
+        Journal key of a file for a version/profile
+        
+        Args:
+            filepath: File path
+            version: ERN version
+            profile: Optional profile
+            
+        Returns:
+            Key string
+            
+        Raises:
+            OSError: If the file cannot be read
+        """
+        filepath = Path(filepath)
+        if self.key_mode == KEY_HASH:
+            digest = hashlib.sha256()
+            with open(filepath, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            return self.digest_key(digest.hexdigest(), version, profile)
+        stat = filepath.stat()
+        identity = f"stat:{filepath.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        return f"{identity}|{version}|{profile or ''}"
+    
+    @staticmethod
+    def digest_key(sha256: str, version: str, profile: Optional[str] = None) -> str:
+        """
+        Hash-mode journal key from a content SHA-256 computed elsewhere
+        
+        Args:
+            sha256: Hex SHA-256 of the file content
+            version: ERN version
+            profile: Optional profile
+            
+        Returns:
+            Key string, equal to key() for the same content
+        """
+        return f"sha256:{sha256}|{version}|{profile or ''}"
+    
+    def get(self, key: str) -> Optional[ValidationResult]:
+        """
+        Return the stored result for a key
+        
+        Args:
+            key: Key from key()
+            
+        Returns:
+            ValidationResult with ``metadata['resumed']`` set, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        result = result_from_dict(json.loads(row[0]))
+        result.metadata['resumed'] = True
+        return result
+    
+    def record(self, key: str, filepath: Union[str, Path], result: ValidationResult) -> None:
+        """
+        Queue a finished result for writing
+        
+        Args:
+            key: Key from key()
+            filepath: File the result belongs to
+            result: Validation result
+            
+        Raises:
+            ValueError: If the journal is closed
+        """
+        if self._error is not None:
+            raise self._error
+        encoded = json.dumps(result_to_dict(result))
+        with self._lock:
+            if self._closed:
+                raise ValueError("Cannot record to a closed journal")
+            self._queue.put((key, str(filepath), int(bool(result.valid)), encoded, time.time()))
+    
+    def _write_loop(self) -> None:
+        """Writer thread: commit queued rows in batches"""
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                rows: List[Tuple] = []
+                done = 1
+                closing = item is _CLOSE
+                if not closing:
+                    rows.append(item)
+                    while len(rows) < _WRITE_BATCH:
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        done += 1
+                        if item is _CLOSE:
+                            closing = True
+                            break
+                        rows.append(item)
+                try:
+                    if rows:
+                        with conn:
+                            conn.executemany(
+                                "INSERT OR REPLACE INTO results (key, path, valid, result, recorded) "
+                                "VALUES (?, ?, ?, ?, ?)",
+                                rows
+                            )
+                except sqlite3.Error as e:
+                    self._error = e
+                finally:
+                    for _ in range(done):
+                        self._queue.task_done()
+                if closing:
+                    return
+        finally:
+            conn.close()
+    
+    def flush(self) -> None:
+        """Block until every recorded result is committed"""
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Counts of journaled files
+        
+        Returns:
+            Dictionary with total, valid and invalid counts
+        """
+        self.flush()
+        with self._lock:
+            total, valid = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(valid), 0) FROM results"
+            ).fetchone()
+        return {"total": total, "valid": valid, "invalid": total - valid}
+    
+    def clear(self) -> None:
+        """Forget every recorded result"""
+        self.flush()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+    
+    def close(self) -> None:
+        """Flush pending writes and close the database"""
+        with self._lock:
+            closing = not self._closed
+            self._closed = True
+            if closing:
+                self._queue.put(_CLOSE)
+        if closing:
+            self._writer.join()
+        with self._lock:
+            self._conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,300 @@
+# packages/python-sdk/ddex_workbench/lazy.py
+"""Lazily decoded validation results"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from .types import PassedRule, ValidationResult, ValidationSummary
+
+
+def _decoding(name: str):
+    """Wrap a list method so every entry (of both operands) is decoded before it runs"""
+    method = getattr(list, name)
+    
+    def wrapper(self, *args, **kwargs):
+        self._decode_all()
+        for arg in args:
+            # list's C code reads the other operand's raw items directly
+            if isinstance(arg, LazySequence):
+                arg._decode_all()
+        return method(self, *args, **kwargs)
+    
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class LazySequence(list):
+    """
+    List that decodes raw items on first access
+    
+    Holds the raw response entries and turns each into an object only
+    when it is read; decoded objects are kept, so every read after the
+    first returns the same instance. Indexing, slicing and iteration
+    decode only what they touch and ``append``/``extend``/``insert``
+    decode nothing; any other list operation (``in``, ``index``,
+    comparison, removal, sorting, ``copy``) decodes everything first.
+    Copying or pickling yields a plain list.
+    """
+    
+    __slots__ = ("_pending", "_decode")
+    
+    def __init__(self, raw: Iterable[Any] = (), decode: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize view
+        
+        Args:
+            raw: Raw entries (typically dicts from a JSON response)
+            decode: Function building an object from one raw entry; None
+                for a list of ready objects
+        """
+        super().__init__(raw)
+        self._decode = decode
+        self._pending: Optional[bytearray] = (
+            bytearray(b"\x01") * len(self) if decode is not None and len(self) else None
+        )
+    
+    def _get(self, index: int) -> Any:
+        pending = self._pending
+        if pending is not None and pending[index]:
+            list.__setitem__(self, index, self._decode(list.__getitem__(self, index)))
+            pending[index] = 0
+        return list.__getitem__(self, index)
+    
+    def _decode_all(self) -> None:
+        if self._pending is not None:
+            for i in range(len(self)):
+                self._get(i)
+            self._pending = None
+    
+    @property
+    def decoded(self) -> int:
+        """Number of entries decoded so far"""
+        if self._pending is None:
+            return len(self)
+        return len(self._pending) - sum(self._pending)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("list index out of range")
+        return self._get(index)
+    
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self._get(i)
+    
+    def __reversed__(self) -> Iterator[Any]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self._get(i)
+    
+    # Adding entries leaves the existing ones undecoded
+    def append(self, value: Any) -> None:
+        super().append(value)
+        if self._pending is not None:
+            self._pending.append(0)
+    
+    def extend(self, values: Iterable[Any]) -> None:
+        values = list(values)
+        super().extend(values)
+        if self._pending is not None:
+            self._pending.extend(bytes(len(values)))
+    
+    def __iadd__(self, values: Iterable[Any]) -> "LazySequence":
+        self.extend(values)
+        return self
+    
+    def insert(self, index: int, value: Any) -> None:
+        size = len(self)
+        if index < 0:
+            index = max(0, index + size)
+        index = min(index, size)
+        super().insert(index, value)
+        if self._pending is not None:
+            self._pending.insert(index, 0)
+    
+    # Everything else sees the whole list, so decode it all first
+    __setitem__ = _decoding("__setitem__")
+    __delitem__ = _decoding("__delitem__")
+    __imul__ = _decoding("__imul__")
+    __contains__ = _decoding("__contains__")
+    __eq__ = _decoding("__eq__")
+    __ne__ = _decoding("__ne__")
+    __lt__ = _decoding("__lt__")
+    __le__ = _decoding("__le__")
+    __gt__ = _decoding("__gt__")
+    __ge__ = _decoding("__ge__")
+    __add__ = _decoding("__add__")
+    __mul__ = _decoding("__mul__")
+    __rmul__ = _decoding("__rmul__")
+    pop = _decoding("pop")
+    remove = _decoding("remove")
+    clear = _decoding("clear")
+    index = _decoding("index")
+    count = _decoding("count")
+    reverse = _decoding("reverse")
+    sort = _decoding("sort")
+    copy = _decoding("copy")
+    
+    __hash__ = None
+    
+    def __radd__(self, other: Any) -> List[Any]:
+        return list(other) + list(self)
+    
+    def __reduce_ex__(self, protocol):
+        return (list, (list(self),))
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _passed_rule(data: Dict[str, Any]) -> PassedRule:
+    return PassedRule(**data)
+
+
+class LazyValidationResult(ValidationResult):
+    """
+    ValidationResult that decodes errors, warnings and passed rules on demand
+    
+    Keeps the raw /validate response; ``valid``, ``metadata``, ``svrl``
+    and ``summary`` are available immediately, while ``errors``,
+    ``warnings`` and ``passed_rules`` are LazySequence lists built on
+    first access. Callers that only check ``valid`` never decode the
+    entries. Assigning a list to any of these attributes replaces it.
+    """
+    
+    def __init__(
+        self,
+        response: Dict[str, Any],
+        parse_error: Callable[[Dict[str, Any]], Any],
+        parse_warning: Callable[[Dict[str, Any]], Any]
+    ):
+        """
+        Initialize result
+        
+        Args:
+            response: /validate response body
+            parse_error: Builds an error object from one raw error
+            parse_warning: Builds a warning object from one raw warning
+        """
+        self._response = response
+        self._parse_error = parse_error
+        self._parse_warning = parse_warning
+        summary = response.get("summary")
+        super().__init__(
+            valid=response["valid"],
+            errors=[],
+            warnings=[],
+            metadata=dict(response.get("metadata") or {}),
+            svrl=response.get("svrl"),
+            summary=ValidationSummary(**summary) if summary else None
+        )
+        # The entry fields are decoded from the response when first read
+        self._engine: Optional[str] = None
+        self._errors: Optional[LazySequence] = None
+        self._warnings: Optional[LazySequence] = None
+        self._passed_rules: Union[LazySequence, List[PassedRule], None] = None
+        self._passed_rules_loaded = False
+    
+    @property
+    def response(self) -> Dict[str, Any]:
+        """The raw /validate response body"""
+        return self._response
+    
+    def set_default_engine(self, engine: str) -> None:
+        """
+        Attribute errors and warnings without an ``engine`` to ``engine``
+        
+        Entries not decoded yet are tagged when they are decoded, so this
+        does not force decoding.
+        
+        Args:
+            engine: Engine name, e.g. "api"
+        """
+        self._engine = engine
+        for view in (self._errors, self._warnings):
+            if view is None:
+                continue
+            pending = view._pending if isinstance(view, LazySequence) else None
+            for i in range(len(view)):
+                if pending is None or not pending[i]:
+                    self._tag(list.__getitem__(view, i))
+    
+    def _tag(self, item: Any) -> Any:
+        if self._engine is not None and getattr(item, "engine", self._engine) is None:
+            item.engine = self._engine
+        return item
+    
+    def _decode_error(self, raw: Dict[str, Any]) -> Any:
+        return self._tag(self._parse_error(raw))
+    
+    def _decode_warning(self, raw: Dict[str, Any]) -> Any:
+        return self._tag(self._parse_warning(raw))
+    
+    @property
+    def errors(self):
+        if self._errors is None:
+            self._errors = LazySequence(self._response.get("errors") or [], self._decode_error)
+        return self._errors
+    
+    @errors.setter
+    def errors(self, value) -> None:
+        self._errors = value
+    
+    @property
+    def warnings(self):
+        if self._warnings is None:
+            self._warnings = LazySequence(self._response.get("warnings") or [], self._decode_warning)
+        return self._warnings
+    
+    @warnings.setter
+    def warnings(self, value) -> None:
+        self._warnings = value
+    
+    @property
+    def passed_rules(self):
+        if not self._passed_rules_loaded:
+            raw = self._response.get("passedRules")
+            self._passed_rules = LazySequence(raw, _passed_rule) if raw is not None else None
+            self._passed_rules_loaded = True
+        return self._passed_rules
+    
+    @passed_rules.setter
+    def passed_rules(self, value) -> None:
+        self._passed_rules = value
+        self._passed_rules_loaded = True
+    
+    def materialize(self) -> ValidationResult:
+        """
+        Decode everything into a plain ValidationResult
+        
+        Returns:
+            ValidationResult detached from the raw response
+        """
+        passed_rules = self.passed_rules
+        return ValidationResult(
+            valid=self.valid,
+            errors=list(self.errors),
+            warnings=list(self.warnings),
+            metadata=self.metadata,
+            svrl=self.svrl,
+            passed_rules=list(passed_rules) if passed_rules is not None else None,
+            summary=self.summary
+        )
+    
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are plain results, detached from the response
+        plain = self.materialize()
+        return (ValidationResult, (
+            plain.valid, plain.errors, plain.warnings, plain.metadata,
+            plain.svrl, plain.passed_rules, plain.summary
+        ))
+
+
+def materialize(result: ValidationResult) -> ValidationResult:
+    """Return ``result`` with every lazy field decoded into plain lists"""
+    if isinstance(result, LazyValidationResult):
+        return result.materialize()
+    return result
@@ -0,0 +1,180 @@
+# packages/python-sdk/ddex_workbench/local.py
+"""
+Local validation pipeline for hybrid (local-first) validation
+
+Runs the SDK's built-in structural checks and, when lxml and the DDEX
+schemas are available, XSD validation on a single shared parse. The
+clients use it to reject documents before spending an API call.
+"""
+
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple, Union
+
+from .document import DDEXDocument
+from .errors import ConfigurationError
+from .lazy import LazyValidationResult
+from .structural import StructuralValidator
+from .types import ValidationError, ValidationResult, ValidationWarning
+from .xsd import XSDValidator
+
+
+ENGINE_STRUCTURAL = "structural"
+ENGINE_XSD = "xsd"
+ENGINE_API = "api"
+
+
+class LocalValidator:
+    """
+    Structural + XSD validation without the network
+    
+    XSD validation is optional: with ``xsd=None`` it is used when lxml is
+    installed and schemas are found (``schema_dir`` or $DDEX_SCHEMA_DIR),
+    and silently skipped otherwise.
+    """
+    
+    def __init__(
+        self,
+        schema_dir: Optional[Union[str, Path]] = None,
+        xsd: Optional[bool] = None
+    ):
+        """
+        Initialize local validator
+        
+        Args:
+            schema_dir: XSD schema root (see ddex_workbench.xsd)
+            xsd: True to require XSD validation, False to disable it,
+                None to use it when available
+        """
+        self.schema_dir = schema_dir
+        self.xsd = xsd
+        self._structural: Dict[str, StructuralValidator] = {}
+        self._xsd: Dict[str, Optional[XSDValidator]] = {}
+    
+    def _structural_for(self, version: str) -> StructuralValidator:
+        validator = self._structural.get(version)
+        if validator is None:
+            validator = self._structural.setdefault(version, StructuralValidator(version))
+        return validator
+    
+    def _xsd_for(self, version: str) -> Optional[XSDValidator]:
+        if self.xsd is False:
+            return None
+        if version not in self._xsd:
+            try:
+                validator: Optional[XSDValidator] = XSDValidator(version, self.schema_dir)
+            except ConfigurationError:
+                if self.xsd:
+                    raise
+                validator = None
+            self._xsd[version] = validator
+        return self._xsd[version]
+    
+    def validate(
+        self,
+        content: Union[str, bytes, DDEXDocument],
+        version: str,
+        profile: Optional[str] = None
+    ) -> ValidationResult:
+        """
+        Run the local engines
+        
+        Structural checks run first; XSD validation only runs on
+        well-formed documents. Every error and warning records the engine
+        that produced it.
+        
+        Args:
+            content: XML content (``str`` or UTF-8 bytes-like, e.g. a
+                memory-mapped file) or DDEXDocument
+            version: ERN version
+            profile: Optional profile
+            
+        Returns:
+            ValidationResult with ``metadata['engines']`` listing the
+            engines that ran
+        """
+        start = time.perf_counter()
+        document = DDEXDocument.coerce(content)
+        engines = [ENGINE_STRUCTURAL]
+        
+        issues = self._structural_for(version).check(document, profile)
+        for issue in issues:
+            issue.engine = ENGINE_STRUCTURAL
+        
+        xsd = self._xsd_for(version) if document.root is not None else None
+        if xsd is not None:
+            engines.append(ENGINE_XSD)
+            for issue in xsd.check(document):
+                issue.engine = ENGINE_XSD
+                issues.append(issue)
+        
+        errors = [i for i in issues if i.severity == 'error']
+        warnings = [
+            ValidationWarning(
+                line=i.line, column=i.column, message=i.message, rule=i.rule, engine=i.engine
+            )
+            for i in issues if i.severity != 'error'
+        ]
+        return ValidationResult(
+            valid=not errors,
+            errors=errors,
+            warnings=warnings,
+            metadata={
+                'engines': engines,
+                'profile': profile,
+                'schemaVersion': f"ERN {version}",
+                'processingTime': round((time.perf_counter() - start) * 1000, 3),
+                'validatedAt': datetime.now(timezone.utc).isoformat(),
+                'errorCount': len(errors),
+                'warningCount': len(warnings)
+            }
+        )
+
+
+def _key(item: Union[ValidationError, ValidationWarning]) -> Tuple:
+    return (item.rule, item.message, item.line, item.column)
+
+
+def _reported_keys(remote: ValidationResult) -> Set[Tuple]:
+    """Keys of the remote errors and warnings, read from the raw response when possible"""
+    if isinstance(remote, LazyValidationResult):
+        response = remote.response
+        return {
+            (raw.get("rule"), raw.get("message"), raw.get("line", 0), raw.get("column", 0))
+            for raw in (response.get("errors") or []) + (response.get("warnings") or [])
+        }
+    # The server lists recommendations among its errors
+    return {_key(i) for i in list(remote.errors) + list(remote.warnings)}
+
+
+def merge_results(local: ValidationResult, remote: ValidationResult) -> ValidationResult:
+    """
+    Combine a local pre-validation with the API result
+    
+    The server repeats the structural and XSD steps, so local issues the
+    API also reported are not duplicated. Remote issues without an engine
+    are attributed to the API; lazily decoded remote entries are tagged
+    as they are decoded rather than all at once here.
+    
+    Args:
+        local: Result of LocalValidator.validate()
+        remote: Result of the /validate call
+        
+    Returns:
+        The remote result, extended with local-only issues
+    """
+    if isinstance(remote, LazyValidationResult):
+        remote.set_default_engine(ENGINE_API)
+    else:
+        for item in list(remote.errors) + list(remote.warnings):
+            if item.engine is None:
+                item.engine = ENGINE_API
+    if local.errors or local.warnings:
+        reported = _reported_keys(remote)
+        remote.errors.extend(i for i in local.errors if _key(i) not in reported)
+        remote.warnings.extend(i for i in local.warnings if _key(i) not in reported)
+    remote.valid = remote.valid and local.valid
+    remote.metadata['engines'] = list(local.metadata.get('engines', [])) + [ENGINE_API]
+    remote.metadata['localProcessingTime'] = local.metadata.get('processingTime')
+    return remote
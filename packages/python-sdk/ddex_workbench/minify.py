@@ -0,0 +1,223 @@
+# packages/python-sdk/ddex_workbench/minify.py
+"""
+Minified uploads with error-position remapping
+
+Pretty-printed, commented ERN messages carry a lot of bytes the validator
+does not need. MinifiedDocument drops comments and whitespace-only text
+between elements, keeping every line break so line numbers never change,
+and records where characters were removed so that columns reported
+against the minified text can be translated back to the original.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+# Matched only at a "<"; every alternative fails in one linear scan, so an
+# unterminated construct costs O(n) once instead of once per later "<"
+_TOKEN = re.compile(
+    r'(?P<comment><!--.*?-->)'
+    r'|(?P<cdata><!\[CDATA\[.*?\]\]>)'
+    r'|<\?.*?\?>'
+    r'|<!DOCTYPE(?:[^\[>]|\[[^\]]*\])*>'
+    r'|(?P<end></[^>]*>)'
+    r'|<(?:[^>"\']|"[^"]*"|\'[^\']*\')*>',
+    re.S
+)
+_PRESERVE = re.compile(r'xml:space\s*=\s*["\']preserve["\']')
+
+# Breakpoint keys pack (line, column) into one integer
+_LINE_SHIFT = 32
+
+
+class MinifiedDocument:
+    """
+    Minified form of an XML document and its column map
+    
+    Removed: comments, and whitespace-only text that is not the entire
+    content of an element (i.e. indentation between tags; ERN has no
+    mixed content). Whitespace is kept altogether when the document uses
+    ``xml:space="preserve"``. A document with an unterminated tag,
+    comment or CDATA section is malformed and is left as it is.
+    Every removed line break is written back, so line N of the minified
+    text is line N of the original; only columns move. For each place
+    characters were removed, the map stores the column at which the
+    minified line continues and how many characters of that line have
+    been removed so far, packed into two typed arrays.
+    """
+    
+    def __init__(self, content: Union[str, bytes]):
+        """
+        Minify a document
+        
+        Args:
+            content: XML content (bytes are decoded as UTF-8)
+        """
+        if not isinstance(content, str):
+            content = bytes(content).decode('utf-8')
+        self.original_size = len(content)
+        self._keys = array('q')
+        self._shifts = array('l')
+        minified = self._minify(content, strip_whitespace=not _PRESERVE.search(content))
+        if minified is None:
+            # Unterminated markup: upload the original, positions need no map
+            del self._keys[:], self._shifts[:]
+            minified = content
+        self.content = minified
+        self.size = len(self.content)
+    
+    def _minify(self, source: str, strip_whitespace: bool) -> Optional[str]:
+        parts: List[str] = []
+        keys, shifts = self._keys, self._shifts
+        line = 1            # current line (same in source and output)
+        column = 1          # output column of the next character
+        removed = 0         # characters removed so far on this line
+        pending: List[Tuple[int, int, bool]] = []  # text/comment runs awaiting a decision
+        previous_start = False  # last markup was a start tag
+        
+        def keep(start: int, end: int) -> None:
+            nonlocal line, column, removed
+            if start == end:
+                return
+            parts.append(source[start:end])
+            newlines = source.count('\n', start, end)
+            if newlines:
+                line += newlines
+                column = end - source.rfind('\n', start, end)
+                removed = 0
+            else:
+                column += end - start
+        
+        def drop(start: int, end: int) -> None:
+            nonlocal line, column, removed
+            position = start
+            while True:
+                newline = source.find('\n', position, end)
+                stop = end if newline < 0 else newline
+                if stop > position:
+                    removed += stop - position
+                    keys.append((line << _LINE_SHIFT) | column)
+                    shifts.append(removed)
+                if newline < 0:
+                    return
+                parts.append('\n')
+                line += 1
+                column = 1
+                removed = 0
+                position = newline + 1
+        
+        def settle(next_is_end: bool) -> None:
+            # A whitespace-only run is kept only as the whole content of an element
+            text = [(a, b) for a, b, is_comment in pending if not is_comment]
+            droppable = strip_whitespace and all(source[a:b].isspace() for a, b in text)
+            if droppable and previous_start and next_is_end and text:
+                droppable = False
+            for a, b, is_comment in pending:
+                if is_comment or droppable:
+                    drop(a, b)
+                else:
+                    keep(a, b)
+            pending.clear()
+        
+        position = 0
+        while True:
+            start = source.find('<', position)
+            if start < 0:
+                break
+            match = _TOKEN.match(source, start)
+            if match is None:
+                return None
+            end = match.end()
+            if start > position:
+                pending.append((position, start, False))
+            position = end
+            if match.group('comment') is not None:
+                pending.append((start, end, True))
+                continue
+            if match.group('cdata') is not None:
+                # Character data: never whitespace-only, so its run is kept
+                pending.append((start, end, False))
+                continue
+            is_end = match.group('end') is not None
+            settle(is_end)
+            keep(start, end)
+            previous_start = not is_end and source[end - 2] != '/' and source[start + 1] not in '?!'
+        if position < len(source):
+            pending.append((position, len(source), False))
+        previous_start = False
+        settle(False)
+        return ''.join(parts)
+    
+    @property
+    def saved(self) -> int:
+        """Characters removed"""
+        return self.original_size - self.size
+    
+    def to_original(self, line: int, column: int) -> Tuple[int, int]:
+        """
+        Translate a minified position to the original document
+        
+        Args:
+            line: 1-based line (unchanged by minification)
+            column: 1-based column in the minified text (0 means unknown)
+            
+        Returns:
+            (line, column) in the original document
+        """
+        if not line or not column:
+            return line, column
+        index = bisect_right(self._keys, (line << _LINE_SHIFT) | column) - 1
+        if index < 0 or self._keys[index] >> _LINE_SHIFT != line:
+            return line, column
+        return line, column + self._shifts[index]
+    
+    def remap_issue(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy of one error/warning dict with its position in the original
+        
+        Args:
+            item: Error or warning from a response for the minified content
+            
+        Returns:
+            The item itself if it has no column, otherwise a remapped copy
+        """
+        if not item.get("column"):
+            return item
+        item = dict(item)
+        item["line"], item["column"] = self.to_original(item.get("line") or 0, item["column"])
+        return item
+    
+    def remap_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy of a /validate response with positions in the original document
+        
+        Args:
+            response: Response for the minified content
+            
+        Returns:
+            Response with every error and warning line/column translated
+        """
+        remapped = dict(response)
+        for kind in ("errors", "warnings"):
+            items = response.get(kind)
+            if items:
+                remapped[kind] = [self.remap_issue(item) for item in items]
+        metadata = dict(response.get("metadata") or {})
+        metadata["minified"] = {"originalSize": self.original_size, "uploadSize": self.size}
+        remapped["metadata"] = metadata
+        return remapped
+
+
+def minify(content: Union[str, bytes]) -> str:
+    """
+    Strip comments and indentation from an XML document
+    
+    Args:
+        content: XML content
+        
+    Returns:
+        Minified XML with the original line structure
+    """
+    return MinifiedDocument(content).content
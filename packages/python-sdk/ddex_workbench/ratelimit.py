@@ -0,0 +1,210 @@
+# packages/python-sdk/ddex_workbench/ratelimit.py
+"""Client-side rate limiting for DDEX Workbench SDK"""
+
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+
+# Budgets enforced by functions/middleware/rateLimiter.js
+API_KEY_LIMIT = 60
+ANONYMOUS_LIMIT = 10
+DEFAULT_WINDOW = 60.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or invalid
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _header_number(headers: Any, *names: str) -> Optional[float]:
+    """Return the first numeric header among ``names``"""
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(str(value).split(',')[0].strip())
+        except ValueError:
+            continue
+    return None
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket matched to the server's per-minute budgets
+
+    Tokens refill continuously at ``limit / window`` per second up to
+    ``limit``. Callers reserve a token before each request; if the bucket
+    is empty the reservation is queued so that concurrent threads are
+    paced one refill interval apart instead of racing into 429 responses.
+    The bucket is re-seeded from the server's rate limit headers and paused
+    by ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        limit: int = ANONYMOUS_LIMIT,
+        window: float = DEFAULT_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            limit: Requests allowed per window
+            window: Window length in seconds
+            clock: Monotonic clock (injectable for testing)
+            sleep: Sleep function (injectable for testing)
+        """
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self.limit = limit
+        self.window = window
+        self._tokens = float(limit)
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Token refill rate in requests per second"""
+        return self.limit / self.window
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (negative when requests are queued)"""
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update (lock must be held)"""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(float(self.limit), self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Reserve a token without blocking
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0
+            if self._tokens < 0:
+                wait = -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def set_limit(self, limit: int, window: Optional[float] = None) -> None:
+        """
+        Change the budget, keeping the current fill level where possible
+
+        Args:
+            limit: Requests allowed per window
+            window: Optional new window length in seconds
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self.limit = limit
+            if window:
+                self.window = window
+            self._tokens = min(self._tokens, float(limit))
+
+    def pause(self, seconds: Optional[float] = None) -> None:
+        """
+        Stop issuing tokens for a while, e.g. after a 429 response
+
+        Args:
+            seconds: Pause length (defaults to one refill interval)
+        """
+        if seconds is None:
+            seconds = 1 / self.rate
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+    def update_from_headers(self, headers: Any) -> None:
+        """
+        Re-seed the bucket from rate limit response headers
+
+        Understands both the legacy ``X-RateLimit-*`` headers and the
+        IETF draft ``RateLimit-*``/``RateLimit-Policy`` headers sent by
+        express-rate-limit.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        limit = _header_number(headers, 'X-RateLimit-Limit', 'RateLimit-Limit')
+        remaining = _header_number(headers, 'X-RateLimit-Remaining', 'RateLimit-Remaining')
+        reset = _header_number(headers, 'X-RateLimit-Reset', 'RateLimit-Reset')
+
+        window = None
+        policy = headers.get('RateLimit-Policy')
+        if policy:
+            match = re.search(r'w=(\d+)', policy)
+            if match:
+                window = float(match.group(1))
+
+        if limit is None and remaining is None:
+            return
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if limit and (limit != self.limit or (window and window != self.window)):
+                self.limit = int(limit)
+                if window:
+                    self.window = window
+                self._tokens = min(self._tokens, float(self.limit))
+            if remaining is not None:
+                # The server's count wins; never assume more than it grants
+                self._tokens = min(self._tokens, remaining)
+                if remaining <= 0 and reset:
+                    # X-RateLimit-Reset may be an epoch timestamp
+                    delay = reset - time.time() if reset > 1e9 else reset
+                    if delay > 0:
+                        self._blocked_until = max(self._blocked_until, now + delay)
@@ -0,0 +1,543 @@
+# packages/python-sdk/ddex_workbench/schematron.py
+"""
+Local Schematron-style business rule validation for ERN messages
+
+Network-free counterpart of the server's Schematron step
+(functions/validators/schematronValidator.js). Rules are written the
+Schematron way, as an assertion (an XPath 1.0 expression) evaluated on
+every element matching a context, and are reported under the server's
+``Schematron-<name>`` rule IDs. Like the server, rules see element names
+without namespaces, so prefixed and default-namespace messages are
+checked alike. Requires lxml
+(``pip install ddex-workbench[schematron]``).
+
+Each version/profile rule set is compiled once per process. Evaluation is
+a single walk over the document: every element is looked up by local name
+in the rule set's context index and only the assertions for that context
+are evaluated.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+
+from .document import DDEXDocument
+from .errors import ConfigurationError, UnsupportedVersionError
+from .types import (
+    PassedRule,
+    ValidationError,
+    ValidationOptions,
+    ValidationResult,
+    ValidationSummary,
+    ValidationWarning,
+)
+
+
+ENGINE = "schematron"
+
+# EXSLT regular expressions, available as re:test() in assertions
+XPATH_NAMESPACES = {'re': 'http://exslt.org/regular-expressions'}
+
+_ISRC = "re:test(normalize-space(.), '^[A-Z]{2}[A-Z0-9]{3}[0-9]{7}$')"
+_DURATION = "re:test(normalize-space(.), '^P([0-9]+Y)?([0-9]+M)?([0-9]+D)?(T([0-9]+H)?([0-9]+M)?([0-9]+(\\.[0-9]+)?S)?)?$')"
+_DATE = "re:test(normalize-space(.), '^[0-9]{4}(-[0-9]{2}(-[0-9]{2})?)?$')"
+_CHRONOLOGY = (
+    "not(StartDate and EndDate) or "
+    "number(translate(StartDate, '-', '')) <= number(translate(EndDate, '-', ''))"
+)
+
+# Assertions shared by every version: (name, context, test, message, severity, suggestion)
+_COMMON_RULES = (
+    ('MessageId', 'MessageHeader', "normalize-space(MessageId) != ''",
+     'MessageHeader must contain a non-empty MessageId', 'error',
+     'Add a unique MessageId to the MessageHeader'),
+    ('MessageCreatedDateTime', 'MessageHeader', 'MessageCreatedDateTime',
+     'MessageHeader must contain MessageCreatedDateTime', 'error',
+     'Add the creation time in ISO 8601 format, e.g. 2024-01-01T00:00:00Z'),
+    ('MessageSender', 'MessageHeader', 'MessageSender/PartyId or MessageSender/PartyName',
+     'MessageSender should identify the sender by PartyId or PartyName', 'warning',
+     'Add MessageSender with the DPID of the sending party'),
+    ('ISRC-Format', 'ISRC', _ISRC,
+     'ISRC must be 12 characters: country code, registrant code, year and designation code', 'error',
+     'Use the format CC-XXX-YY-NNNNN without hyphens, e.g. USRC17607839'),
+    ('ICPN-Format', 'ICPN', "re:test(normalize-space(.), '^[0-9]{12,14}$')",
+     'ICPN (UPC/EAN) must be 12 to 14 digits', 'error', None),
+    ('Duration-Format', 'Duration', _DURATION,
+     'Duration must be an ISO 8601 duration such as PT3M45S', 'error', None),
+    ('ResourceReference', 'SoundRecording', "normalize-space(ResourceReference) != ''",
+     'Each SoundRecording must have a ResourceReference', 'error', None),
+    ('ReleaseReference', 'Release', "normalize-space(ReleaseReference) != ''",
+     'Each Release must have a ReleaseReference', 'error', None),
+    ('ReleaseType', 'Release', 'ReleaseType',
+     'Release should declare a ReleaseType', 'warning', None),
+    ('DealReleaseReference', 'ReleaseDeal', 'DealReleaseReference',
+     'ReleaseDeal must reference at least one Release', 'error', None),
+    ('DealTerms', 'Deal', 'DealTerms',
+     'Deal must contain DealTerms', 'error', None),
+    ('DealTerritory', 'DealTerms', 'TerritoryCode or ExcludedTerritoryCode',
+     'DealTerms must specify TerritoryCode or ExcludedTerritoryCode', 'error',
+     "Use 'Worldwide' to make the deal available in all territories"),
+    ('TerritoryCode-Format', 'TerritoryCode',
+     "re:test(normalize-space(.), '^(Worldwide|[A-Z]{2}(-[A-Z0-9]{1,3})?|[0-9]{3})$')",
+     'TerritoryCode must be an ISO 3166 code or Worldwide', 'error', None),
+    ('ValidityPeriod-Chronology', 'ValidityPeriod', _CHRONOLOGY,
+     'ValidityPeriod StartDate must not be after EndDate', 'error', None),
+    ('StartDate-Format', 'StartDate', _DATE,
+     'StartDate must be an ISO 8601 date', 'error', None),
+    ('PLine-Year', 'PLine', "not(Year) or re:test(normalize-space(Year), '^[0-9]{4}$')",
+     'PLine Year must be a four-digit year', 'error', None),
+    ('CLine-Year', 'CLine', "not(Year) or re:test(normalize-space(Year), '^[0-9]{4}$')",
+     'CLine Year must be a four-digit year', 'error', None),
+)
+
+_VERSION_RULES = {
+    '4.3': (
+        ('DisplayTitleText', 'Release', 'DisplayTitleText or DisplayTitle',
+         'Release should have a DisplayTitleText', 'warning', None),
+        ('IsMainRelease', 'Release',
+         "not(@IsMainRelease) or @IsMainRelease = 'true' or @IsMainRelease = 'false'",
+         'IsMainRelease must be true or false', 'error', None),
+        ('DisplayArtist', 'SoundRecording', 'DisplayArtist or DisplayArtistName',
+         'SoundRecording should credit a DisplayArtist', 'warning', None),
+    ),
+    '4.2': (
+        ('DisplayTitleText', 'Release', 'DisplayTitleText or DisplayTitle',
+         'Release should have a DisplayTitleText', 'warning', None),
+        ('DisplayArtist', 'SoundRecording', 'DisplayArtist or DisplayArtistName',
+         'SoundRecording should credit a DisplayArtist', 'warning', None),
+    ),
+    '3.8.2': (
+        ('ReferenceTitle', 'Release', 'ReferenceTitle/TitleText',
+         'Release must have a ReferenceTitle', 'error', None),
+        ('ReleaseDetailsByTerritory', 'Release', 'ReleaseDetailsByTerritory',
+         'Release should contain ReleaseDetailsByTerritory', 'warning', None),
+        ('IsMainRelease', 'Release',
+         "not(@IsMainRelease) or @IsMainRelease = 'true' or @IsMainRelease = 'false'",
+         'IsMainRelease must be true or false', 'error', None),
+    ),
+}
+
+_PROFILE_RULES = {
+    'AudioAlbum': (
+        ('AudioAlbum-SoundRecording', 'NewReleaseMessage', 'ResourceList/SoundRecording',
+         'AudioAlbum profile requires at least one SoundRecording', 'error', None),
+    ),
+    'AudioSingle': (
+        ('AudioSingle-SoundRecording', 'NewReleaseMessage', 'ResourceList/SoundRecording',
+         'AudioSingle profile requires at least one SoundRecording', 'error', None),
+        ('AudioSingle-TrackCount', 'ResourceList', 'count(SoundRecording) <= 3',
+         'AudioSingle profile should contain at most three SoundRecordings', 'warning', None),
+    ),
+    'Video': (
+        ('Video-Resource', 'NewReleaseMessage', 'ResourceList/Video',
+         'Video profile requires at least one Video resource', 'error', None),
+        ('Video-Duration', 'Video', 'Duration',
+         'Video resources should declare a Duration', 'warning', None),
+    ),
+    'Classical': (
+        ('Classical-Composer', 'SoundRecording',
+         ".//*[local-name() = 'Role' or contains(local-name(), 'ContributorRole')][. = 'Composer']",
+         'Classical recordings should credit a Composer', 'warning', None),
+    ),
+    'Ringtone': (
+        ('Ringtone-Duration', 'SoundRecording',
+         "not(Duration) or not(re:test(Duration, '[0-9]+[HD]|[1-9][0-9]*M'))",
+         'Ringtones should be shorter than one minute', 'warning', None),
+    ),
+}
+
+# Cross-reference checks: (name, context, target XPath from the root, message)
+_REFERENCE_RULES = (
+    ('DealReleaseReference-Integrity', 'DealReleaseReference', 'ReleaseList/Release/ReleaseReference',
+     'DealReleaseReference does not match any ReleaseReference'),
+    ('ReleaseResourceReference-Integrity', 'ReleaseResourceReference', 'ResourceList/*/ResourceReference',
+     'ReleaseResourceReference does not match any ResourceReference'),
+)
+
+# Requested profile -> ReleaseProfileVersionId values that satisfy it (as on the server)
+_PROFILE_ALIASES = {
+    'AudioAlbum': ('Audio', 'AudioAlbum'),
+    'AudioSingle': ('AudioSingle', 'SimpleAudioSingle'),
+    'Video': ('Video', 'SimpleVideo'),
+    'Classical': ('Classical', 'SimpleClassical'),
+    'Ringtone': ('Ringtone', 'SimpleRingtone'),
+    'Mixed': ('Mixed', 'MixedMedia'),
+    'DJ': ('DJ', 'DJMix', 'DjMix'),
+}
+
+_rule_sets: Dict[Tuple[str, Optional[str]], "RuleSet"] = {}
+_rule_sets_lock = threading.Lock()
+
+
+def _require_lxml() -> None:
+    if etree is None:
+        raise ConfigurationError(
+            "Local Schematron validation requires lxml. "
+            "Install it with: pip install ddex-workbench[schematron]",
+            config_key="lxml"
+        )
+
+
+def _local_name(tag) -> Optional[str]:
+    if not isinstance(tag, str):
+        return None
+    return tag.rpartition('}')[2]
+
+
+def _strip_namespaces(root: "etree._Element") -> List[Tuple["etree._Element", str]]:
+    """
+    Rename every element to its local name, as the server's parser does
+    
+    The rules are written against unqualified names; without this a
+    default-namespace message (``xmlns="http://ddex.net/xml/ern/43"``)
+    would fail assertions that pass for the same message with an ``ern:``
+    prefix on the root only.
+    
+    Returns:
+        (element, original tag) pairs, for restoring the names afterwards
+    """
+    renamed = []
+    for elem in root.iter():
+        tag = elem.tag
+        if isinstance(tag, str) and tag[0] == '{':
+            renamed.append((elem, tag))
+            elem.tag = tag.rpartition('}')[2]
+    return renamed
+
+
+class Rule:
+    """A compiled assertion"""
+    
+    __slots__ = ("name", "context", "test", "message", "severity", "suggestion", "xpath", "target")
+    
+    def __init__(
+        self,
+        name: str,
+        context: str,
+        test: str,
+        message: str,
+        severity: str = 'error',
+        suggestion: Optional[str] = None,
+        target: Optional[str] = None
+    ):
+        self.name = name
+        self.context = context
+        self.test = test
+        self.message = message
+        self.severity = severity
+        self.suggestion = suggestion
+        # Reference rules hold the XPath of their targets instead of an assertion
+        self.target = target
+        self.xpath = etree.XPath(target or test, namespaces=XPATH_NAMESPACES)
+    
+    @property
+    def rule_id(self) -> str:
+        """Rule ID as reported by the server"""
+        return f"Schematron-{self.name}"
+    
+    def __repr__(self) -> str:
+        return f"Rule({self.name!r}, context={self.context!r})"
+
+
+class RuleSet:
+    """
+    Compiled rules for one version and profile, indexed by context
+    
+    lxml XPath evaluators are not shared between threads, so evaluation
+    holds the rule set's lock.
+    """
+    
+    def __init__(self, version: str, profile: Optional[str], rules: List[Rule]):
+        self.version = version
+        self.profile = profile
+        self.rules = rules
+        self.by_context: Dict[str, List[Rule]] = {}
+        for rule in rules:
+            self.by_context.setdefault(rule.context, []).append(rule)
+        self.lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+def load_rules(version: str, profile: Optional[str] = None) -> RuleSet:
+    """
+    Compile the rules for a version and profile, or return the cached set
+    
+    Args:
+        version: ERN version
+        profile: Optional profile; adds the profile-specific rules
+        
+    Returns:
+        Compiled rule set shared by the whole process
+        
+    Raises:
+        ConfigurationError: If lxml is not installed
+        UnsupportedVersionError: If the version is not supported
+    """
+    _require_lxml()
+    if version not in _VERSION_RULES:
+        raise UnsupportedVersionError(version, list(_VERSION_RULES))
+    key = (version, profile)
+    rule_set = _rule_sets.get(key)
+    if rule_set is not None:
+        return rule_set
+    
+    with _rule_sets_lock:
+        rule_set = _rule_sets.get(key)
+        if rule_set is None:
+            definitions = _COMMON_RULES + _VERSION_RULES[version] + _PROFILE_RULES.get(profile, ())
+            rules = [Rule(*definition) for definition in definitions]
+            rules.extend(
+                Rule(name, context, f". = /*/{target}", message, target=f"/*/{target}")
+                for name, context, target, message in _REFERENCE_RULES
+            )
+            rule_set = _rule_sets[key] = RuleSet(version, profile, rules)
+    return rule_set
+
+
+def clear_rule_cache() -> None:
+    """Drop all compiled rule sets"""
+    with _rule_sets_lock:
+        _rule_sets.clear()
+
+
+class SchematronValidator:
+    """
+    Evaluate Schematron-style business rules locally with lxml
+    
+    Failures carry the server's rule IDs plus the line and XPath of the
+    element the assertion failed on.
+    """
+    
+    def __init__(self, version: str = '4.3'):
+        """
+        Initialize validator
+        
+        Args:
+            version: ERN version ("4.3", "4.2" or "3.8.2")
+            
+        Raises:
+            ConfigurationError: If lxml is not installed
+            UnsupportedVersionError: If the version is not supported
+        """
+        _require_lxml()
+        if version not in _VERSION_RULES:
+            raise UnsupportedVersionError(version, list(_VERSION_RULES))
+        self.version = version
+        self._local = threading.local()
+    
+    def _parser(self) -> "etree.XMLParser":
+        """Per-thread document parser (lxml parsers are not thread-safe)"""
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = etree.XMLParser(
+                no_network=True, resolve_entities=False, huge_tree=True
+            )
+        return parser
+    
+    def _parse(self, content: Union[str, bytes, Path, DDEXDocument]) -> "etree._ElementTree":
+        if isinstance(content, Path):
+            return etree.parse(str(content), self._parser())
+        if isinstance(content, DDEXDocument):
+            parser = self._parser()
+            for chunk in content.iter_bytes():
+                parser.feed(chunk)
+            return etree.ElementTree(parser.close())
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return etree.ElementTree(etree.fromstring(content, self._parser()))
+    
+    def check(
+        self,
+        content: Union[str, bytes, Path, DDEXDocument],
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> Tuple[List[ValidationError], Optional[List[PassedRule]]]:
+        """
+        Evaluate the rules in a single pass over the document
+        
+        Evaluation stops as soon as ``options.max_errors`` errors have been
+        found. Passed rules are only reported for complete evaluations.
+        
+        Args:
+            content: XML content, DDEXDocument or file path
+            profile: Optional profile
+            options: Validation options (max_errors, include_passed_rules)
+            
+        Returns:
+            Tuple of (issues, passed rules); passed rules are None unless
+            ``options.include_passed_rules`` is set
+        """
+        options = options or ValidationOptions()
+        rule_set = load_rules(self.version, profile)
+        try:
+            tree = self._parse(content)
+        except etree.XMLSyntaxError as e:
+            line, column = e.position if e.position else (0, 0)
+            return [self._issue(str(e), 'XML Well-formedness', line=line or 0, column=column or 0)], None
+        
+        root = tree.getroot()
+        if 'NewReleaseMessage' not in (_local_name(root.tag) or ''):
+            return [self._issue(
+                'Could not find NewReleaseMessage root element', 'Schematron-Parse'
+            )], None
+        renamed = _strip_namespaces(root)
+        
+        issues: List[ValidationError] = []
+        mismatch = self._profile_mismatch(root, profile)
+        if mismatch:
+            issues.append(mismatch)
+        
+        max_errors = options.max_errors
+        error_count = 0
+        truncated = False
+        fired: Set[str] = set()
+        failed: Set[str] = set()
+        targets: Dict[str, Set[str]] = {}
+        located: List[Tuple[ValidationError, "etree._Element"]] = []
+        context = f"Profile: {profile}"
+        
+        with rule_set.lock:
+            for elem in root.iter():
+                rules = rule_set.by_context.get(_local_name(elem.tag))
+                if not rules:
+                    continue
+                for rule in rules:
+                    fired.add(rule.name)
+                    if rule.target is not None:
+                        # Resolve each reference target set once per document
+                        values = targets.get(rule.name)
+                        if values is None:
+                            values = targets[rule.name] = {
+                                (node.text or '').strip() for node in rule.xpath(root)
+                            }
+                        passed = (elem.text or '').strip() in values
+                    else:
+                        passed = bool(rule.xpath(elem))
+                    if passed:
+                        continue
+                    failed.add(rule.name)
+                    issue = ValidationError(
+                        line=elem.sourceline or 0,
+                        column=0,
+                        message=rule.message,
+                        severity=rule.severity,
+                        rule=rule.rule_id,
+                        context=context,
+                        suggestion=rule.suggestion,
+                        engine=ENGINE
+                    )
+                    issues.append(issue)
+                    located.append((issue, elem))
+                    if rule.severity == 'error':
+                        error_count += 1
+                        if max_errors and error_count >= max_errors:
+                            truncated = True
+                            break
+                if truncated:
+                    break
+        
+        # XPaths are reported with the document's own names
+        for elem, tag in renamed:
+            elem.tag = tag
+        for issue, elem in located:
+            issue.xpath = tree.getpath(elem)
+        
+        passed_rules = None
+        if options.include_passed_rules:
+            passed_rules = [] if truncated else [
+                PassedRule(rule=rule.rule_id, test=rule.test, profile=profile, description=rule.message)
+                for rule in rule_set.rules
+                if rule.name in fired and rule.name not in failed
+            ]
+        return issues, passed_rules
+    
+    def validate(
+        self,
+        content: Union[str, bytes, Path, DDEXDocument],
+        profile: Optional[str] = None,
+        options: Optional[ValidationOptions] = None
+    ) -> ValidationResult:
+        """
+        Validate and build a ValidationResult
+        
+        Args:
+            content: XML content, DDEXDocument or file path
+            profile: Optional profile
+            options: Validation options (max_errors, include_passed_rules)
+            
+        Returns:
+            ValidationResult; recommendations are returned as warnings and
+            the summary counts rules that fired
+        """
+        start = time.perf_counter()
+        issues, passed_rules = self.check(content, profile, options)
+        errors = [i for i in issues if i.severity == 'error']
+        warnings = [
+            ValidationWarning(
+                line=i.line, column=i.column, message=i.message, rule=i.rule, engine=ENGINE
+            )
+            for i in issues if i.severity != 'error'
+        ]
+        
+        summary = None
+        if passed_rules is not None:
+            failed_rules = len({i.rule for i in issues if i.rule != 'Schematron-ProfileMismatch'})
+            total = len(passed_rules) + failed_rules
+            summary = ValidationSummary(
+                total_rules=total,
+                passed_rules=len(passed_rules),
+                failed_rules=failed_rules,
+                pass_rate=round(len(passed_rules) / total * 100, 2) if total else 100.0,
+                profile=profile,
+                schematron_errors=len(errors)
+            )
+        
+        return ValidationResult(
+            valid=not errors,
+            errors=errors,
+            warnings=warnings,
+            metadata={
+                'engine': ENGINE,
+                'profile': profile,
+                'schemaVersion': f"ERN {self.version}",
+                'processingTime': round((time.perf_counter() - start) * 1000, 3),
+                'validatedAt': datetime.now(timezone.utc).isoformat(),
+                'errorCount': len(errors),
+                'warningCount': len(warnings)
+            },
+            passed_rules=passed_rules,
+            summary=summary
+        )
+    
+    @staticmethod
+    def _issue(message: str, rule: str, line: int = 0, column: int = 0) -> ValidationError:
+        return ValidationError(
+            line=line, column=column, message=message, severity='error', rule=rule, engine=ENGINE
+        )
+    
+    @staticmethod
+    def _profile_mismatch(root: "etree._Element", profile: Optional[str]) -> Optional[ValidationError]:
+        """Warn if the message declares a different profile than requested"""
+        declared = root.get('ReleaseProfileVersionId')
+        if not profile or not declared:
+            return None
+        if any(alias in declared for alias in _PROFILE_ALIASES.get(profile, (profile,))):
+            return None
+        return ValidationError(
+            line=root.sourceline or 0,
+            column=0,
+            message=f'Message profile "{declared}" does not match requested profile "{profile}"',
+            severity='warning',
+            rule='Schematron-ProfileMismatch',
+            context=f"Profile: {profile}",
+            engine=ENGINE
+        )
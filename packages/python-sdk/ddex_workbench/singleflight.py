@@ -0,0 +1,119 @@
+# packages/python-sdk/ddex_workbench/singleflight.py
+"""Coalescing of identical concurrent requests"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class _Call:
+    """An in-flight call and its outcome"""
+    
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group
+    
+    Concurrent ``do()`` calls with the same key share one execution of
+    ``fn``: the first caller runs it, the others block until it finishes
+    and receive the same result or exception. Once a call completes its
+    key is forgotten, so later calls run ``fn`` again (this is not a cache).
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn`` once for all concurrent callers with ``key``
+        
+        Args:
+            key: Identity of the call
+            fn: Function to run
+            
+        Returns:
+            Tuple of (result, shared); ``shared`` is True for callers that
+            received another caller's result
+            
+        Raises:
+            Whatever ``fn`` raised, in every caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+    
+    def __len__(self) -> int:
+        """Number of keys currently in flight"""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    asyncio single-flight group
+    
+    Same semantics as SingleFlight for coroutines on one event loop. The
+    shared call runs as its own task, so a cancelled caller does not
+    cancel the request for the others.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Future"] = {}
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await ``fn()`` once for all concurrent callers with ``key``
+        
+        Args:
+            key: Identity of the call
+            fn: Coroutine function to run
+            
+        Returns:
+            Tuple of (result, shared)
+            
+        Raises:
+            Whatever ``fn`` raised, in every caller
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            return await asyncio.shield(task), True
+        
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), False
+    
+    def _forget(self, key: str, task: "asyncio.Future") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+    
+    def __len__(self) -> int:
+        """Number of keys currently in flight"""
+        return len(self._calls)
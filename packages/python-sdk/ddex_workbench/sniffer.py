@@ -0,0 +1,239 @@
+# packages/python-sdk/ddex_workbench/sniffer.py
+"""
+Constant-time ERN version and profile sniffing
+
+Reads only as far as the root start-tag, so detection cost does not grow
+with the size of the message.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, TextIO, Union
+from xml.parsers import expat
+
+
+DEFAULT_CHUNK_SIZE = 8192
+# Root start-tags are small; give up rather than scan a whole file
+DEFAULT_MAX_BYTES = 64 * 1024
+
+Source = Union[str, bytes, Path, BinaryIO, TextIO]
+
+# ReleaseProfileVersionId fragments, checked in order
+_PROFILE_HINTS = (
+    ('audioalbum', 'AudioAlbum'),
+    ('audiosingle', 'AudioSingle'),
+    ('video', 'Video'),
+    ('classical', 'Classical'),
+    ('ringtone', 'Ringtone'),
+    ('dj', 'DJ'),
+    ('mixed', 'Mixed'),
+    ('releasebyrelease', 'ReleaseByRelease'),
+)
+
+# Loose namespace/MessageSchemaVersionId fragments per version
+_VERSION_FRAGMENTS = (
+    ('4.3', ('43', '4.3')),
+    ('4.2', ('42', '4.2')),
+    ('3.8.2', ('382', '3.8')),
+)
+
+
+def version_from_text(text: str) -> Optional[str]:
+    """
+    Map an ERN namespace or MessageSchemaVersionId value to a version
+    
+    Args:
+        text: Namespace URI, schema version id or raw XML prefix
+        
+    Returns:
+        "4.3", "4.2", "3.8.2" or None
+    """
+    if 'ern/43' in text or 'ern/4.3' in text:
+        return '4.3'
+    elif 'ern/42' in text or 'ern/4.2' in text:
+        return '4.2'
+    elif 'ern/382' in text or 'ern/3.8' in text:
+        return '3.8.2'
+    return None
+
+
+def profile_from_attribute(value: str) -> Optional[str]:
+    """
+    Map a ReleaseProfileVersionId value to a profile name
+    
+    Args:
+        value: Attribute value
+        
+    Returns:
+        Profile name or None
+    """
+    value = value.lower()
+    for hint, profile in _PROFILE_HINTS:
+        if hint in value:
+            return profile
+    return None
+
+
+class _RootFound(Exception):
+    """Raised from the expat handler to stop at the first start event"""
+
+
+class SniffResult:
+    """Root element information of an XML message"""
+    
+    __slots__ = ("tag", "namespace", "attrib", "version", "profile", "error")
+    
+    def __init__(
+        self,
+        tag: Optional[str] = None,
+        namespace: str = "",
+        attrib: Optional[Dict[str, str]] = None,
+        version: Optional[str] = None,
+        profile: Optional[str] = None,
+        error: Optional[str] = None
+    ):
+        self.tag = tag
+        self.namespace = namespace
+        self.attrib = attrib or {}
+        self.version = version
+        self.profile = profile
+        self.error = error
+    
+    def __repr__(self) -> str:
+        return (
+            f"SniffResult(tag={self.tag!r}, version={self.version!r}, "
+            f"profile={self.profile!r})"
+        )
+
+
+def root_version(namespace: str, attrib: Dict[str, str]) -> Optional[str]:
+    """
+    Detect the ERN version from a root element
+    
+    Args:
+        namespace: Root namespace URI
+        attrib: Root attributes
+        
+    Returns:
+        Detected version string or None
+    """
+    version = version_from_text(namespace)
+    if version:
+        return version
+    schema_version = attrib.get('MessageSchemaVersionId', '')
+    version = version_from_text(schema_version)
+    if version:
+        return version
+    # Looser matches, e.g. MessageSchemaVersionId="4.3"
+    for text in (namespace, schema_version):
+        for candidate, fragments in _VERSION_FRAGMENTS:
+            if any(f in text for f in fragments):
+                return candidate
+    return None
+
+
+def _chunks(source: Source, chunk_size: int):
+    """Yield successive chunks of ``source`` (str or bytes)"""
+    if isinstance(source, (str, bytes)):
+        for i in range(0, len(source), chunk_size):
+            yield source[i:i + chunk_size]
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def sniff(
+    source: Source,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> SniffResult:
+    """
+    Read the root start-tag of an XML message
+    
+    Parsing stops at the first start event, so at most ``max_bytes`` are
+    read regardless of document size. Paths are opened in binary mode;
+    file objects are read from their current position.
+    
+    Args:
+        source: XML content (str or bytes), a file path, or a file object
+        max_bytes: Maximum number of bytes/characters to read
+        chunk_size: Read size
+        
+    Returns:
+        SniffResult; ``tag`` is None if no root element was found, in
+        which case ``error`` explains why
+    """
+    if isinstance(source, Path):
+        with open(source, 'rb') as f:
+            return sniff(f, max_bytes=max_bytes, chunk_size=chunk_size)
+    
+    result = SniffResult()
+    parser = expat.ParserCreate()
+    
+    def start(name: str, attrs: Dict[str, str]) -> None:
+        prefix = name.partition(':')[0] if ':' in name else ''
+        namespace = attrs.get('xmlns:' + prefix if prefix else 'xmlns', '')
+        result.tag = name
+        result.namespace = namespace
+        result.attrib = attrs
+        result.version = root_version(namespace, attrs)
+        result.profile = profile_from_attribute(attrs.get('ReleaseProfileVersionId', ''))
+        raise _RootFound()
+    
+    parser.StartElementHandler = start
+    
+    consumed = 0
+    head = []
+    try:
+        for chunk in _chunks(source, chunk_size):
+            head.append(chunk)
+            parser.Parse(chunk, False)
+            consumed += len(chunk)
+            if consumed >= max_bytes:
+                result.error = f"No root element in the first {consumed} bytes"
+                break
+        else:
+            parser.Parse(b"", True)
+            result.error = "No root element found"
+    except _RootFound:
+        pass
+    except expat.ExpatError as e:
+        result.error = str(e)
+    
+    if result.tag is None:
+        # Malformed prolog: fall back to a string check on what was read
+        text = "".join(
+            c.decode('utf-8', 'replace') if isinstance(c, bytes) else c for c in head
+        )
+        result.version = version_from_text(text)
+    return result
+
+
+def sniff_version(source: Source, max_bytes: int = DEFAULT_MAX_BYTES) -> Optional[str]:
+    """
+    Detect the ERN version from the root start-tag
+    
+    Args:
+        source: XML content, a file path, or a file object
+        max_bytes: Maximum number of bytes to read
+        
+    Returns:
+        Detected version string or None
+    """
+    return sniff(source, max_bytes=max_bytes).version
+
+
+def sniff_profile(source: Source, max_bytes: int = DEFAULT_MAX_BYTES) -> Optional[str]:
+    """
+    Detect the profile from the root ReleaseProfileVersionId attribute
+    
+    Args:
+        source: XML content, a file path, or a file object
+        max_bytes: Maximum number of bytes to read
+        
+    Returns:
+        Detected profile string or None
+    """
+    return sniff(source, max_bytes=max_bytes).profile
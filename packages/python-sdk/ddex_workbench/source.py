@@ -0,0 +1,102 @@
+# packages/python-sdk/ddex_workbench/source.py
+"""Single-pass, bytes-first reading of XML files for upload"""
+
+import codecs
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from .errors import FileError
+
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Slice size for hashing, UTF-8 checking and JSON escaping
+CHUNK_SIZE = 1024 * 1024
+
+
+class FileSource:
+    """
+    The bytes of a file, read once
+    
+    ``data`` is either ``bytes`` or a read-only ``mmap`` (large files),
+    both of which the clients send without decoding to ``str``.
+    ``digests`` holds the hex digests requested from read_file(), all
+    computed in the same pass that checks the content is UTF-8.
+    Close the source (or use it as a context manager) to release the map.
+    """
+    
+    def __init__(self, path: Path, data: Union[bytes, mmap.mmap], digests: Dict[str, str]):
+        self.path = path
+        self.data = data
+        self.size = len(data)
+        self.digests = digests
+    
+    @property
+    def mapped(self) -> bool:
+        """True if the content is memory-mapped"""
+        return isinstance(self.data, mmap.mmap)
+    
+    def close(self) -> None:
+        """Release the memory map, if any"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def read_file(
+    filepath: Union[str, Path],
+    digests: Iterable[str] = (),
+    mmap_threshold: Optional[int] = MMAP_THRESHOLD
+) -> FileSource:
+    """
+    Read an XML file as bytes in a single pass
+    
+    Args:
+        filepath: Path to XML file
+        digests: hashlib algorithm names to compute (e.g. "md5", "sha256")
+        mmap_threshold: Size from which the file is memory-mapped
+            (None to always read into memory)
+        
+    Returns:
+        FileSource
+        
+    Raises:
+        FileError: If the file is missing, unreadable or not UTF-8
+    """
+    filepath = Path(filepath)
+    if not filepath.exists():
+        raise FileError(f"File not found: {filepath}", filepath=str(filepath))
+    
+    hashes = {name: hashlib.new(name) for name in digests}
+    data: Union[bytes, mmap.mmap, None] = None
+    try:
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if mmap_threshold is not None and size >= mmap_threshold and size > 0:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = f.read()
+        
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for start in range(0, len(data), CHUNK_SIZE):
+            chunk = data[start:start + CHUNK_SIZE]
+            for digest in hashes.values():
+                digest.update(chunk)
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except Exception as e:
+        if isinstance(data, mmap.mmap):
+            data.close()
+        raise FileError(f"Failed to read file: {e}", filepath=str(filepath))
+    
+    return FileSource(filepath, data, {name: h.hexdigest() for name, h in hashes.items()})
+
@@ -0,0 +1,265 @@
+# packages/python-sdk/ddex_workbench/structural.py
+"""
+Offline structural pre-validation for ERN messages
+
+Port of the server's ERNValidator (functions/validators/ernValidator.js):
+root element, required top-level composites per version and the
+AudioAlbum, AudioSingle, Video, Mixed and ReleaseByRelease profile checks,
+reported under the same rule IDs. Runs locally in microseconds, so broken
+files can be rejected without a network round trip.
+"""
+
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Union
+
+from .document import DDEXDocument, split_tag
+from .errors import UnsupportedVersionError
+from .types import ValidationError, ValidationResult, ValidationWarning
+
+
+# Required top-level elements per version: (element, severity, message)
+ERN_CONFIGS: Dict[str, Dict] = {
+    '4.3': {
+        'required': (
+            ('MessageHeader', 'error', 'MessageHeader is required in ERN 4.3'),
+            ('ReleaseList', 'error', 'ReleaseList is required in ERN 4.3'),
+            ('ResourceList', 'error', 'ResourceList is required in ERN 4.3'),
+            ('DealList', 'error', 'DealList is required in ERN 4.3'),
+        ),
+        'profiles': ('AudioAlbum', 'AudioSingle', 'Video', 'Mixed'),
+    },
+    '4.2': {
+        'required': (
+            ('MessageHeader', 'error', 'MessageHeader is required in ERN 4.2'),
+            ('ReleaseList', 'error', 'ReleaseList is required in ERN 4.2'),
+        ),
+        'profiles': ('AudioAlbum', 'AudioSingle', 'Video', 'Mixed'),
+    },
+    '3.8.2': {
+        'required': (
+            ('MessageHeader', 'error', 'MessageHeader is required in ERN 3.8.2'),
+            ('UpdateIndicator', 'warning', 'UpdateIndicator is recommended but not required in ERN 3.8.2'),
+            ('ReleaseList', 'error', 'ReleaseList is required in ERN 3.8.2'),
+            ('ResourceList', 'error', 'ResourceList is required in ERN 3.8.2'),
+        ),
+        'profiles': ('AudioAlbum', 'AudioSingle', 'Video', 'Mixed', 'ReleaseByRelease'),
+    },
+}
+
+_RULE_PREFIX = {'4.3': 'ERN43', '4.2': 'ERN42', '3.8.2': 'ERN382'}
+
+
+def _issue(message: str, rule: str, severity: str = 'error', line: int = 0, column: int = 0) -> ValidationError:
+    return ValidationError(line=line, column=column, message=message, severity=severity, rule=rule)
+
+
+def _present(elem: Optional[ET.Element]) -> bool:
+    """True if an element exists and is not empty (as fast-xml-parser sees it)"""
+    if elem is None:
+        return False
+    return bool(len(elem) or elem.attrib or (elem.text and elem.text.strip()))
+
+
+class StructuralValidator:
+    """
+    Local equivalent of the server's ERN structural checks
+    
+    Checks are cheap lookups on the root's direct children, so the cost is
+    dominated by the (shared) parse of the document.
+    """
+    
+    def __init__(self, version: str = '4.3'):
+        """
+        Initialize validator for one ERN version
+        
+        Args:
+            version: ERN version ("4.3", "4.2" or "3.8.2")
+            
+        Raises:
+            UnsupportedVersionError: If the version is not supported
+        """
+        if version not in ERN_CONFIGS:
+            raise UnsupportedVersionError(version, list(ERN_CONFIGS))
+        self.version = version
+        self.config = ERN_CONFIGS[version]
+    
+    def check(
+        self,
+        content: Union[str, bytes, DDEXDocument],
+        profile: Optional[str] = None
+    ) -> List[ValidationError]:
+        """
+        Run the checks and return every issue found
+        
+        Issues carry the server's rule IDs; recommendations have
+        ``severity="warning"``.
+        
+        Args:
+            content: XML content or DDEXDocument
+            profile: Optional profile to check against
+            
+        Returns:
+            List of ValidationError details
+        """
+        document = DDEXDocument.coerce(content)
+        root = document.root
+        if root is None:
+            line, column = document.parse_position or (0, 0)
+            return [_issue(document.parse_error, 'XML Well-formedness', line=line, column=column)]
+        
+        issues: List[ValidationError] = []
+        namespace, local = split_tag(root.tag)
+        if 'NewReleaseMessage' not in local:
+            issues.append(_issue(
+                f"Invalid root element. Expected 'NewReleaseMessage', found '{local}'",
+                'Root Element', line=1, column=1
+            ))
+            return issues
+        
+        children = self._children(root, namespace)
+        prefix = _RULE_PREFIX[self.version]
+        for name, severity, message in self.config['required']:
+            if not _present(children.get(name)):
+                issues.append(_issue(message, f"{prefix}-{name}", severity))
+        
+        if profile:
+            self._check_profile(children, namespace, profile, issues)
+        return issues
+    
+    def validate(
+        self,
+        content: Union[str, bytes, DDEXDocument],
+        profile: Optional[str] = None
+    ) -> ValidationResult:
+        """
+        Validate content and build a ValidationResult
+        
+        Args:
+            content: XML content or DDEXDocument
+            profile: Optional profile to check against
+            
+        Returns:
+            ValidationResult; recommendations are returned as warnings
+        """
+        start = time.perf_counter()
+        issues = self.check(content, profile)
+        errors = [i for i in issues if i.severity == 'error']
+        warnings = [
+            ValidationWarning(line=i.line, column=i.column, message=i.message, rule=i.rule)
+            for i in issues if i.severity != 'error'
+        ]
+        return ValidationResult(
+            valid=not errors,
+            errors=errors,
+            warnings=warnings,
+            metadata={
+                'engine': 'structural',
+                'profile': profile,
+                'schemaVersion': f"ERN {self.version}",
+                'processingTime': round((time.perf_counter() - start) * 1000, 3),
+                'validatedAt': datetime.now(timezone.utc).isoformat(),
+                'errorCount': len(errors),
+                'warningCount': len(warnings)
+            }
+        )
+    
+    @staticmethod
+    def _children(elem: ET.Element, namespace: str) -> Dict[str, ET.Element]:
+        """Map local name to first direct child (unqualified or in ``namespace``)"""
+        children: Dict[str, ET.Element] = {}
+        for child in elem:
+            if not isinstance(child.tag, str):
+                continue
+            child_namespace, local = split_tag(child.tag)
+            if child_namespace in ('', namespace):
+                children.setdefault(local, child)
+        return children
+    
+    def _check_profile(
+        self,
+        children: Dict[str, ET.Element],
+        namespace: str,
+        profile: str,
+        issues: List[ValidationError]
+    ) -> None:
+        """Profile-specific checks"""
+        release_list = children.get('ReleaseList')
+        resource_list = children.get('ResourceList')
+        
+        if profile in ('AudioAlbum', 'AudioSingle'):
+            releases = []
+            if _present(release_list):
+                releases = [
+                    r for r in release_list
+                    if isinstance(r.tag, str) and split_tag(r.tag) in (('', 'Release'), (namespace, 'Release'))
+                ]
+            if not releases:
+                issues.append(_issue(
+                    f"ReleaseList with at least one Release is required for {profile} profile",
+                    f"{profile}-ReleaseList"
+                ))
+                return
+            if profile == 'AudioAlbum':
+                release_type = self._children(releases[0], namespace).get('ReleaseType')
+                value = (release_type.text or '').strip() if release_type is not None else ''
+                if value and value not in ('Album', 'EP'):
+                    issues.append(_issue(
+                        f"AudioAlbum profile expects ReleaseType 'Album' or 'EP', found '{value}'",
+                        'AudioAlbum-ReleaseType', 'warning'
+                    ))
+            elif len(releases) > 1:
+                issues.append(_issue(
+                    'AudioSingle profile should contain only one main Release',
+                    'AudioSingle-SingleRelease', 'warning'
+                ))
+        
+        elif profile in ('Video', 'Mixed'):
+            if not _present(resource_list):
+                issues.append(_issue(
+                    f"ResourceList is required for {profile} profile",
+                    f"{profile}-ResourceList"
+                ))
+                return
+            if profile == 'Video' and not any(
+                'Video' in name for name in self._children(resource_list, namespace)
+            ):
+                issues.append(_issue(
+                    'Video profile requires at least one Video resource',
+                    'Video-VideoResource'
+                ))
+        
+        elif profile == 'ReleaseByRelease' and not self.version.startswith('3.'):
+            issues.append(_issue(
+                "Profile 'ReleaseByRelease' is only available in ERN 3.x versions",
+                'Profile-Version-Mismatch'
+            ))
+
+
+_validators: Dict[str, StructuralValidator] = {}
+
+
+def validate_structure(
+    content: Union[str, bytes, DDEXDocument],
+    version: str,
+    profile: Optional[str] = None
+) -> ValidationResult:
+    """
+    Run the structural checks for a version
+    
+    Args:
+        content: XML content or DDEXDocument
+        version: ERN version
+        profile: Optional profile
+        
+    Returns:
+        ValidationResult
+        
+    Raises:
+        UnsupportedVersionError: If the version is not supported
+    """
+    validator = _validators.get(version)
+    if validator is None:
+        validator = _validators.setdefault(version, StructuralValidator(version))
+    return validator.validate(content, profile)
@@ -0,0 +1,560 @@
+# packages/python-sdk/ddex_workbench/testing.py
+"""
+Local stand-in for the DDEX Workbench API
+
+Mocking single calls says nothing about how a client behaves under
+concurrency. StandInServer is a real HTTP server on localhost that
+implements /validate, /health, /formats and /api-keys with configurable
+latency, payload-size-dependent processing time, the server's 60/10
+req/min rate limits (functions/middleware/rateLimiter.js) and injectable
+5xx faults, so clients can be load-tested and benchmarked offline::
+
+    with StandInServer(latency=lognormal(0.05), processing_per_mb=0.2) as server:
+        client = DDEXClient(base_url=server.url, max_retries=0)
+        client.validate(content, "4.3")
+        print(server.stats)
+    
+/validate runs the structural checks (see structural.py) unless another
+validator is given.
+"""
+
+import gzip
+import json
+import math
+import random
+import secrets
+import threading
+import time
+import zlib
+from dataclasses import asdict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+from .compression import REQUEST_ENCODINGS
+from .errors import UnsupportedVersionError
+from .ratelimit import ANONYMOUS_LIMIT, API_KEY_LIMIT, DEFAULT_WINDOW
+from .structural import ERN_CONFIGS, validate_structure
+from .types import ValidationResult
+
+
+# Reported by /health, as in functions/index.js
+SERVER_VERSION = "1.0.2"
+
+# Keys a user may hold at once (functions/api/keys.js)
+MAX_API_KEYS = 5
+
+_MB = 1024 * 1024
+
+# A latency is a fixed number of seconds or a sampler drawing from a distribution
+Latency = Union[float, Callable[[random.Random], float]]
+
+
+def constant(seconds: float) -> Callable[[random.Random], float]:
+    """Always ``seconds``"""
+    return lambda rng: seconds
+
+
+def uniform(low: float, high: float) -> Callable[[random.Random], float]:
+    """Uniformly distributed between ``low`` and ``high`` seconds"""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """
+    Log-normally distributed around ``median`` seconds
+    
+    The long right tail is typical of real API latencies; ``sigma`` sets
+    how heavy it is (p99 is about ``median * exp(2.33 * sigma)``).
+    """
+    mu = math.log(median) if median > 0 else float("-inf")
+    return lambda rng: rng.lognormvariate(mu, sigma) if median > 0 else 0.0
+
+
+def exponential(mean: float) -> Callable[[random.Random], float]:
+    """Exponentially distributed with the given mean, in seconds"""
+    return lambda rng: rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+
+def _error(message: str, **fields: Any) -> Dict[str, Any]:
+    return {"error": dict(fields, message=message)}
+
+
+def _issue(issue: Any) -> Dict[str, Any]:
+    """Serialize a ValidationError/ValidationWarning as the API does"""
+    data = asdict(issue)
+    data.pop("engine", None)
+    return {key: value for key, value in data.items() if value is not None}
+
+
+class _Window:
+    """Fixed rate limit window for one client (express-rate-limit's MemoryStore)"""
+    
+    __slots__ = ("hits", "reset_at")
+    
+    def __init__(self, reset_at: float):
+        self.hits = 0
+        self.reset_at = reset_at
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to the StandInServer"""
+    
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; don't let Nagle hold the body
+    disable_nagle_algorithm = True
+    server: "StandInServer"
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_GET(self):
+        self.server._dispatch(self)
+    
+    def do_POST(self):
+        self.server._dispatch(self)
+    
+    def do_DELETE(self):
+        self.server._dispatch(self)
+    
+    def read_body(self) -> bytes:
+        """Read a Content-Length or chunked request body"""
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            parts = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    # Skip trailers
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(parts)
+                parts.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+    
+    def reply(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """
+    In-process HTTP server emulating the DDEX Workbench API
+    
+    Each request is served on its own thread. Responses are delayed by a
+    latency sample plus, for /validate, ``processing_per_mb`` seconds per
+    MB of content. Clients are rate limited per API key (``api_key_limit``
+    per ``window``) or per IP when anonymous (``anonymous_limit``); /health
+    is exempt. Keys are created with create_key() or POST /api-keys.
+    """
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Latency = 0.0,
+        processing_per_mb: float = 0.0,
+        rate_limit: bool = True,
+        api_key_limit: int = API_KEY_LIMIT,
+        anonymous_limit: int = ANONYMOUS_LIMIT,
+        window: float = DEFAULT_WINDOW,
+        fault_rate: float = 0.0,
+        fault_statuses: Iterable[int] = (500, 502, 503),
+        seed: Optional[int] = None,
+        validator: Optional[Callable[[str, str, Optional[str]], ValidationResult]] = None
+    ):
+        """
+        Create (and bind) a stand-in server
+        
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+            latency: Seconds added to every response, or a sampler such
+                as lognormal(0.05)
+            processing_per_mb: Extra /validate time per MB of content
+            rate_limit: Enforce the per-minute request budgets
+            api_key_limit: Requests per window with an API key
+            anonymous_limit: Requests per window without one
+            window: Rate limit window in seconds
+            fault_rate: Probability of answering with a random 5xx
+            fault_statuses: Statuses random faults are drawn from
+            seed: Seed for latency and fault sampling
+            validator: Called as ``validator(content, version, profile)``
+                to produce /validate results (default: structural checks)
+        """
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.processing_per_mb = processing_per_mb
+        self.rate_limit = rate_limit
+        self.api_key_limit = api_key_limit
+        self.anonymous_limit = anonymous_limit
+        self.window = window
+        self.fault_rate = fault_rate
+        self.fault_statuses = tuple(fault_statuses)
+        self.validator = validator or validate_structure
+        
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._windows: Dict[str, _Window] = {}
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._key_ids: Dict[str, str] = {}
+        self._next_key_id = 1
+        self._pending_faults = []
+        self._in_flight = 0
+        self._thread: Optional[threading.Thread] = None
+        self.reset_stats()
+    
+    @property
+    def url(self) -> str:
+        """Base URL to pass to a client"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "StandInServer":
+        """Serve requests on a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+    
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+    
+    # Test controls
+    
+    def create_key(self, name: str = "stand-in") -> str:
+        """
+        Register an API key
+        
+        Args:
+            name: Name for the key
+            
+        Returns:
+            The key, for ``DDEXClient(api_key=...)``
+        """
+        return self._add_key(name)["key"]
+    
+    def inject_faults(self, count: int = 1, status: int = 503) -> None:
+        """
+        Fail the next ``count`` requests with ``status``
+        
+        Args:
+            count: Number of requests to fail
+            status: HTTP status to answer with
+        """
+        with self._lock:
+            self._pending_faults.extend([status] * count)
+    
+    def reset_stats(self) -> None:
+        """Clear the request counters"""
+        with self._lock:
+            self._stats = {
+                "requests": 0,
+                "routes": {},
+                "statuses": {},
+                "rate_limited": 0,
+                "faults": 0,
+                "bytes_received": 0,
+                "peak_concurrency": 0,
+            }
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Counters since start (or reset_stats())
+        
+        ``requests`` and ``bytes_received`` (after decompression), per-route
+        and per-status counts, ``rate_limited`` and ``faults`` responses and
+        the ``peak_concurrency`` of requests being handled at once.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["routes"] = dict(stats["routes"])
+            stats["statuses"] = dict(stats["statuses"])
+            return stats
+    
+    # Request handling
+    
+    def _dispatch(self, handler: _Handler) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self._stats["peak_concurrency"] = max(self._stats["peak_concurrency"], self._in_flight)
+        try:
+            status, body, headers = self._handle(handler)
+            with self._lock:
+                statuses = self._stats["statuses"]
+                statuses[status] = statuses.get(status, 0) + 1
+            handler.reply(status, body, headers)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+    
+    def _handle(self, handler: _Handler) -> Tuple[int, Any, Dict[str, str]]:
+        """Run a request through auth, rate limiting, faults and routing"""
+        raw = handler.read_body()
+        path = handler.path.split("?", 1)[0].rstrip("/") or "/"
+        for prefix in ("/api", "/v1"):
+            if path.startswith(prefix + "/"):
+                path = path[len(prefix):]
+        route = "/" + path.split("/")[1]
+        if route == "/keys":
+            route = "/api-keys"
+        
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["routes"][route] = self._stats["routes"].get(route, 0) + 1
+            delay = self._sample_latency()
+        if delay > 0:
+            time.sleep(delay)
+        
+        encoding = (handler.headers.get("Content-Encoding") or "identity").lower()
+        if encoding not in ("identity",) + REQUEST_ENCODINGS:
+            return 415, _error(f"Unsupported Content-Encoding: {encoding}",
+                               supported=list(REQUEST_ENCODINGS)), {}
+        try:
+            if encoding == "gzip":
+                raw = gzip.decompress(raw)
+            elif encoding == "deflate":
+                raw = zlib.decompress(raw)
+            payload = json.loads(raw) if raw else {}
+        except (OSError, zlib.error, ValueError):
+            return 400, _error("Invalid request body"), {}
+        with self._lock:
+            self._stats["bytes_received"] += len(raw)
+        
+        # functions/middleware/apiKeyAuth.js
+        credential = handler.headers.get("X-API-Key")
+        authorization = handler.headers.get("Authorization") or ""
+        if not credential and authorization.startswith("Bearer "):
+            credential = authorization[len("Bearer "):]
+        key_id = None
+        if credential and (credential.startswith("ddex_") or route != "/api-keys"):
+            key_id = self._lookup_key(credential)
+            if key_id is None:
+                message = ("Invalid API key format" if not credential.startswith("ddex_")
+                           else "Invalid or revoked API key")
+                return 401, _error(message, code="INVALID_API_KEY"), {}
+        
+        headers: Dict[str, str] = {}
+        if self.rate_limit and route != "/health":
+            identity = f"key:{key_id}" if key_id else f"ip:{handler.client_address[0]}"
+            limited = self._check_rate_limit(identity, key_id is not None, headers)
+            if limited is not None:
+                return 429, limited, headers
+        
+        fault = self._draw_fault()
+        if fault is not None:
+            return fault, _error("Injected fault"), headers
+        
+        method = handler.command
+        if route == "/health" and method == "GET":
+            return 200, self._health(), headers
+        if route == "/formats" and method == "GET":
+            return 200, self._formats(), headers
+        if route == "/validate" and method == "POST":
+            status, body = self._validate(payload)
+            return status, body, headers
+        if route == "/api-keys":
+            if not credential:
+                return 401, _error("Unauthorized"), headers
+            status, body = self._api_keys(method, path, payload)
+            return status, body, headers
+        return 404, _error("Endpoint not found", path=path), headers
+    
+    def _sample_latency(self) -> float:
+        """Draw a latency in seconds (lock must be held)"""
+        if callable(self.latency):
+            return max(0.0, float(self.latency(self._random)))
+        return max(0.0, float(self.latency))
+    
+    def _check_rate_limit(
+        self,
+        identity: str,
+        has_key: bool,
+        headers: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Count a hit and set RateLimit headers; returns the 429 body when over the limit"""
+        limit = self.api_key_limit if has_key else self.anonymous_limit
+        now = time.time()
+        with self._lock:
+            window = self._windows.get(identity)
+            if window is None or window.reset_at <= now:
+                window = self._windows[identity] = _Window(now + self.window)
+            window.hits += 1
+            hits, reset_at = window.hits, window.reset_at
+            if hits > limit:
+                self._stats["rate_limited"] += 1
+        
+        reset = max(0, math.ceil(reset_at - now))
+        headers["RateLimit-Policy"] = f"{limit};w={int(self.window)}"
+        headers["RateLimit-Limit"] = str(limit)
+        headers["RateLimit-Remaining"] = str(max(0, limit - hits))
+        headers["RateLimit-Reset"] = str(reset)
+        if hits <= limit:
+            return None
+        headers["Retry-After"] = str(reset)
+        message = ("API key rate limit exceeded (60 req/min)" if has_key else
+                   "Rate limit exceeded. Sign in or use an API key for higher limits (10 req/min)")
+        if limit != (API_KEY_LIMIT if has_key else ANONYMOUS_LIMIT):
+            message = f"Rate limit exceeded ({limit} req/{int(self.window)}s)"
+        # Like the real handler, retryAfter is the reset time in epoch seconds
+        return _error(message, code="RATE_LIMIT_EXCEEDED", retryAfter=round(reset_at))
+    
+    def _draw_fault(self) -> Optional[int]:
+        """Status for an injected or random fault, if this request gets one"""
+        with self._lock:
+            if self._pending_faults:
+                status = self._pending_faults.pop(0)
+            elif self.fault_rate and self._random.random() < self.fault_rate:
+                status = self._random.choice(self.fault_statuses)
+            else:
+                return None
+            self._stats["faults"] += 1
+            return status
+    
+    # Routes
+    
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    
+    def _health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "timestamp": self._now(),
+            "service": "DDEX Workbench API",
+            "version": SERVER_VERSION,
+            "requestEncodings": list(REQUEST_ENCODINGS),
+        }
+    
+    @staticmethod
+    def _formats() -> Dict[str, Any]:
+        return {
+            "types": ["ERN"],
+            "versions": [
+                {
+                    "version": version,
+                    "profiles": list(config["profiles"]),
+                    "status": "recommended" if version == "4.3" else "supported",
+                }
+                for version, config in ERN_CONFIGS.items()
+            ],
+        }
+    
+    def _validate(self, payload: Dict[str, Any]) -> Tuple[int, Any]:
+        """functions/api/validate.js"""
+        content = payload.get("content")
+        version = payload.get("version")
+        profile = payload.get("profile")
+        if not content:
+            return 400, _error("XML content is required")
+        if payload.get("type") != "ERN":
+            return 400, _error("Only ERN validation is currently supported")
+        if not version:
+            return 400, _error("Version is required")
+        
+        start = time.perf_counter()
+        if self.processing_per_mb > 0:
+            time.sleep(self.processing_per_mb * len(content.encode("utf-8")) / _MB)
+        try:
+            result = self.validator(content, version, profile)
+        except UnsupportedVersionError as e:
+            return 400, _error(str(e))
+        
+        errors = [_issue(error) for error in result.errors]
+        warnings = [_issue(warning) for warning in result.warnings]
+        return 200, {
+            "valid": not errors,
+            "errors": errors,
+            "warnings": warnings,
+            "svrl": None,
+            "metadata": {
+                "processingTime": round((time.perf_counter() - start) * 1000),
+                "schemaVersion": f"ERN {version}",
+                "profile": profile,
+                "validatedAt": self._now(),
+                "errorCount": len(errors),
+                "warningCount": len(warnings),
+                "validationSteps": [],
+            },
+        }
+    
+    def _api_keys(self, method: str, path: str, payload: Dict[str, Any]) -> Tuple[int, Any]:
+        """functions/api/keys.js, shaped as the SDK's ApiKey expects"""
+        parts = path.strip("/").split("/")
+        if method == "GET" and len(parts) == 1:
+            with self._lock:
+                keys = [self._public(key) for key in self._keys.values()]
+            return 200, {"keys": keys}
+        if method == "POST" and len(parts) == 1:
+            name = str(payload.get("name") or "").strip()
+            if not name:
+                return 400, _error("Key name is required")
+            if len(self._keys) >= MAX_API_KEYS:
+                return 400, _error(f"Maximum number of API keys reached ({MAX_API_KEYS})")
+            record = self._add_key(name)
+            return 200, dict(self._public(record), key=record["key"])
+        if method == "DELETE" and len(parts) == 2:
+            with self._lock:
+                record = self._keys.pop(parts[1], None)
+                if record is not None:
+                    del self._key_ids[record["key"]]
+            if record is None:
+                return 404, _error("API key not found")
+            return 200, {"success": True}
+        return 404, _error("Endpoint not found", path=path)
+    
+    def _add_key(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            key_id = f"key_{self._next_key_id}"
+            self._next_key_id += 1
+            record = {
+                "id": key_id,
+                "name": name,
+                "key": "ddex_" + secrets.token_hex(32),
+                "created_at": self._now(),
+                "last_used": None,
+                "request_count": 0,
+            }
+            self._keys[key_id] = record
+            self._key_ids[record["key"]] = key_id
+            return record
+    
+    def _lookup_key(self, key: str) -> Optional[str]:
+        """Key id for a valid key, recording its use"""
+        with self._lock:
+            record = self._keys.get(self._key_ids.get(key))
+            if record is None:
+                return None
+            record["last_used"] = self._now()
+            record["request_count"] += 1
+            return record["id"]
+    
+    @staticmethod
+    def _public(record: Dict[str, Any]) -> Dict[str, Any]:
+        """A key record without the key itself"""
+        return {name: value for name, value in record.items() if name != "key"}
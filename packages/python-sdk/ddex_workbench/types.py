@@ -1,7 +1,8 @@
 # packages/python-sdk/ddex_workbench/types.py
 """Type definitions for DDEX Workbench SDK"""
 
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
@@ -26,6 +27,23 @@ class ERNProfile(str, Enum):
     RELEASE_BY_RELEASE = "ReleaseByRelease"
 
 
+def _slotted(cls):
+    """
+    Rebuild a dataclass with ``__slots__``
+    
+    Issues are created by the million in large batches; without a
+    per-instance ``__dict__`` each takes roughly half the memory.
+    (``dataclass(slots=True)`` needs Python 3.10.)
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names}
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class ValidationError:
     """Validation error detail"""
@@ -37,8 +55,10 @@ class ValidationError:
     context: Optional[str] = None
     suggestion: Optional[str] = None
     xpath: Optional[str] = None
+    engine: Optional[str] = None  # "structural", "xsd", "schematron" or "api"
 
 
+@_slotted
 @dataclass
 class ValidationWarning:
     """Validation warning (distinct from error)"""
@@ -47,8 +67,10 @@ class ValidationWarning:
     message: str
     rule: Optional[str] = None
     context: Optional[str] = None
+    engine: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class PassedRule:
     """Successfully passed validation rule"""
@@ -113,6 +135,68 @@ class BatchValidationResult:
     processing_time: float
 
 
+class BatchAccumulator:
+    """
+    Running totals for a stream of validation results
+    
+    Builds a BatchValidationResult incrementally, so a batch can be
+    summarised without holding every ValidationResult in memory.
+    Retained results are compacted: lazy results are decoded and repeated
+    strings (rule IDs, messages) are shared across the batch.
+    """
+    
+    def __init__(self, keep_results: bool = False, error_table: Optional[Any] = None):
+        """
+        Initialize accumulator
+        
+        Args:
+            keep_results: Keep every result in ``results`` (as
+                validate_batch() does); otherwise only counts are kept
+            error_table: ErrorTable that collects every error and warning
+                in columnar form (works with ``keep_results=False``)
+        """
+        from .compact import StringPool
+        
+        self.keep_results = keep_results
+        self.error_table = error_table
+        self.total_files = 0
+        self.valid_files = 0
+        self.error_count = 0
+        self.warning_count = 0
+        self.results: List[ValidationResult] = []
+        self._pool = StringPool() if keep_results else None
+        self._start = time.time()
+    
+    @property
+    def invalid_files(self) -> int:
+        return self.total_files - self.valid_files
+    
+    def add(self, result: ValidationResult) -> ValidationResult:
+        """Count a result and return it (compacted when retained)"""
+        self.total_files += 1
+        if result.valid:
+            self.valid_files += 1
+        self.error_count += len(result.errors)
+        self.warning_count += len(result.warnings)
+        if self.error_table is not None:
+            self.error_table.add(result)
+        if self.keep_results:
+            from .compact import compact_result
+            result = compact_result(result, self._pool)
+            self.results.append(result)
+        return result
+    
+    def result(self) -> BatchValidationResult:
+        """Snapshot of the totals so far"""
+        return BatchValidationResult(
+            total_files=self.total_files,
+            valid_files=self.valid_files,
+            invalid_files=self.invalid_files,
+            results=list(self.results),
+            processing_time=time.time() - self._start
+        )
+
+
 @dataclass
 class HealthStatus:
     """API health status - flexible to handle different response formats"""
@@ -121,6 +205,7 @@ class HealthStatus:
     timestamp: str
     service: Optional[str] = None  # Single service field
     services: Optional[Dict[str, bool]] = None  # Multiple services
+    request_encodings: List[str] = field(default_factory=list)  # Accepted Content-Encodings
     
     def __post_init__(self):
         """Handle both 'service' and 'services' fields"""
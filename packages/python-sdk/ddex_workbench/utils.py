@@ -5,85 +5,46 @@ import hashlib
 import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import BinaryIO, Optional, List, Dict, Any, Tuple, Union
 import json
 import csv
 from datetime import datetime
 
+from .document import DDEXDocument
+from .sniffer import sniff_version
 
-def detect_ern_version(xml_content: str) -> Optional[str]:
+
+def detect_ern_version(xml_content: Union[str, bytes, Path, BinaryIO, DDEXDocument]) -> Optional[str]:
     """
     Detect ERN version from XML content
     
+    Reads only up to the root start-tag (namespace and
+    MessageSchemaVersionId), so large files are not scanned.
+    
     Args:
-        xml_content: XML content as string
+        xml_content: XML content, a DDEXDocument, a file path or a binary stream
         
     Returns:
         Detected version string or None
     """
-    # Quick string checks first
-    version_patterns = {
-        "4.3": [
-            'xmlns:ern="http://ddex.net/xml/ern/43"',
-            'MessageSchemaVersionId="ern/43"'
-        ],
-        "4.2": [
-            'xmlns:ern="http://ddex.net/xml/ern/42"',
-            'MessageSchemaVersionId="ern/42"'
-        ],
-        "3.8.2": [
-            'xmlns:ern="http://ddex.net/xml/ern/382"',
-            'MessageSchemaVersionId="ern/382"'
-        ]
-    }
-    
-    for version, patterns in version_patterns.items():
-        for pattern in patterns:
-            if pattern in xml_content:
-                return version
-    
-    # Try parsing XML for more thorough check
-    try:
-        root = ET.fromstring(xml_content)
-        
-        # Check namespaces
-        for ns_url in root.attrib.values():
-            if "ddex.net/xml/ern/" in ns_url:
-                version_match = re.search(r'/ern/(\d+)', ns_url)
-                if version_match:
-                    version_num = version_match.group(1)
-                    if version_num == "43":
-                        return "4.3"
-                    elif version_num == "42":
-                        return "4.2"
-                    elif version_num == "382":
-                        return "3.8.2"
-        
-        # Check MessageSchemaVersionId attribute
-        schema_version = root.get("MessageSchemaVersionId", "")
-        if "ern/43" in schema_version:
-            return "4.3"
-        elif "ern/42" in schema_version:
-            return "4.2"
-        elif "ern/382" in schema_version:
-            return "3.8.2"
-            
-    except ET.ParseError:
-        pass
-    
-    return None
+    if isinstance(xml_content, DDEXDocument):
+        return xml_content.version
+    return sniff_version(xml_content)
 
 
-def validate_xml_structure(xml_content: str) -> Tuple[bool, Optional[str]]:
+def validate_xml_structure(xml_content: Union[str, DDEXDocument]) -> Tuple[bool, Optional[str]]:
     """
     Basic XML structure validation
     
     Args:
-        xml_content: XML content as string
+        xml_content: XML content as string, or a DDEXDocument
         
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if isinstance(xml_content, DDEXDocument):
+        return xml_content.root is not None, xml_content.parse_error
+    
     try:
         ET.fromstring(xml_content)
         return True, None
@@ -91,16 +52,19 @@ def validate_xml_structure(xml_content: str) -> Tuple[bool, Optional[str]]:
         return False, str(e)
 
 
-def extract_message_id(xml_content: str) -> Optional[str]:
+def extract_message_id(xml_content: Union[str, DDEXDocument]) -> Optional[str]:
     """
     Extract MessageId from ERN XML
     
     Args:
-        xml_content: XML content as string
+        xml_content: XML content as string, or a DDEXDocument
         
     Returns:
         MessageId or None if not found
     """
+    if isinstance(xml_content, DDEXDocument):
+        return xml_content.message_id
+    
     try:
         root = ET.fromstring(xml_content)
         
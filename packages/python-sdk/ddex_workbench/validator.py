@@ -2,12 +2,12 @@
 """High-level validation helpers for DDEX Workbench"""
 
 # Standard library imports
-import hashlib
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any, Union
 from urllib.parse import urlparse
 
 # XML parsing from standard library
@@ -17,8 +17,15 @@ import xml.etree.ElementTree as ET
 import requests
 
 # Local imports - be careful with circular imports
+from .compact import ErrorTable
+from .concurrency import AdaptiveConcurrency, controlling, resolve_controller
+from .document import DDEXDocument, stream_metadata
 from .errors import ValidationError, FileError, ParseError
+from .journal import KEY_HASH, CheckpointJournal
+from .sniffer import sniff
+from .source import FileSource, read_file
 from .types import (
+    BatchAccumulator,
     BatchValidationResult,
     ValidationError as ValidationErrorDetail,
     ValidationOptions,
@@ -27,6 +34,43 @@ from .types import (
 )
 
 
+def _file_error_result(filepath: Path, error: Exception) -> ValidationResult:
+    """Result standing in for a file that could not be validated"""
+    return ValidationResult(
+        valid=False,
+        errors=[ValidationErrorDetail(
+            line=0,
+            column=0,
+            message=f"Failed to validate {filepath.name}: {str(error)}",
+            severity="error",
+            rule="FILE_ERROR"
+        )],
+        warnings=[],
+        metadata={"file": str(filepath), "error": str(error)}
+    )
+
+
+def _journal_key(
+    journal: Optional[CheckpointJournal],
+    filepath: Path,
+    version: str,
+    profile: Optional[str]
+) -> Optional[str]:
+    """
+    Stat-mode journal key for a file, or None if there is none or it is unreadable
+    
+    Hash-mode keys are left to the workers, which compute them from the
+    bytes they read for upload.
+    """
+    if journal is None or journal.key_mode == KEY_HASH:
+        return None
+    try:
+        return journal.key(filepath, version, profile)
+    except OSError:
+        # Let validate_file() report the problem
+        return None
+
+
 class DDEXValidator:
     """
     High-level validation helper for DDEX documents
@@ -102,7 +146,7 @@ class DDEXValidator:
     
     def validate_auto(
         self,
-        content: str,
+        content: Union[str, DDEXDocument],
         profile: Optional[str] = None,
         options: Optional[ValidationOptions] = None
     ) -> ValidationResult:
@@ -110,7 +154,7 @@ class DDEXValidator:
         Auto-detect version and validate
         
         Args:
-            content: XML content to validate
+            content: XML content or DDEXDocument to validate
             profile: Optional profile (auto-detected if not provided)
             options: Optional validation options
             
@@ -120,87 +164,208 @@ class DDEXValidator:
         Raises:
             ValidationError: If version cannot be detected
         """
-        version = self.detect_version(content)
+        document = DDEXDocument.coerce(content)
+        version = document.version
         if not version:
             raise ValidationError("Could not detect ERN version from XML content")
         
         if not profile:
-            profile = self.detect_profile(content)
+            profile = document.profile
         
-        return self.client.validate(content, version=version, profile=profile, options=options)
+        return self.client.validate(document.content, version=version, profile=profile, options=options)
     
     def validate_batch(
         self,
-        files: List[Path],
+        files: Iterable[Union[str, Path]],
         version: str,
         profile: Optional[str] = None,
         max_workers: int = 4,
-        options: Optional[ValidationOptions] = None
+        options: Optional[ValidationOptions] = None,
+        keep_results: bool = True,
+        adaptive: Union[bool, AdaptiveConcurrency] = False,
+        journal: Optional[CheckpointJournal] = None,
+        error_table: Optional[ErrorTable] = None
     ) -> BatchValidationResult:
         """
         Batch process multiple XML files with concurrency control
         
         Args:
-            files: List of file paths to validate
+            files: File paths to validate (any iterable)
             version: ERN version
             profile: Optional profile
             max_workers: Maximum concurrent validations
             options: Optional validation options
+            keep_results: Keep every ValidationResult in ``results``; set
+                to False for large batches that only need the totals
+            adaptive: Tune concurrency from latency and 429/5xx responses
+                (True, or an AdaptiveConcurrency to configure/observe it)
+            journal: Checkpoint journal; files validated by an earlier
+                run are not validated again
+            error_table: ErrorTable to collect every error and warning in
+                compact columnar form
             
         Returns:
             BatchValidationResult with all results
         """
-        results = []
-        start_time = time.time()
+        batch = BatchAccumulator(keep_results=keep_results, error_table=error_table)
+        results = self.iter_validate(
+            files, version, profile, max_workers, options, adaptive=adaptive, journal=journal
+        )
+        for result in results:
+            batch.add(result)
+        return batch.result()
+    
+    def iter_validate(
+        self,
+        files: Iterable[Union[str, Path]],
+        version: str,
+        profile: Optional[str] = None,
+        max_workers: int = 4,
+        options: Optional[ValidationOptions] = None,
+        window: Optional[int] = None,
+        adaptive: Union[bool, AdaptiveConcurrency] = False,
+        journal: Optional[CheckpointJournal] = None
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate files concurrently, yielding results as they complete
+        
+        ``files`` is consumed lazily and at most ``window`` validations are
+        submitted at a time, so memory stays bounded however many files
+        there are (e.g. ``Path("catalog").rglob("*.xml")``). Results are
+        yielded in completion order with ``metadata['file']`` set; files
+        that fail are yielded as FILE_ERROR results.
+        
+        In adaptive mode ``max_workers`` is only the starting point: the
+        controller raises the number of in-flight validations while
+        latency stays flat and cuts it on 429/5xx responses, timeouts or
+        rising latency (see AdaptiveConcurrency).
+        
+        With a ``journal``, files already validated in an earlier run are
+        not re-validated; their stored results are yielded with
+        ``metadata['resumed']`` set. New results are journaled as they
+        complete (FILE_ERROR results are not, so those files are retried).
+        
+        Args:
+            files: File paths to validate (any iterable)
+            version: ERN version
+            profile: Optional profile
+            max_workers: Maximum concurrent validations
+            options: Optional validation options
+            window: Maximum submitted but unconsumed validations
+                (defaults to twice ``max_workers``)
+            adaptive: True, or an AdaptiveConcurrency whose ``on_change``
+                callback reports the current limit
+            journal: Checkpoint journal for resumable runs
+            
+        Yields:
+            ValidationResult for each file
+        """
+        controller = resolve_controller(adaptive, max_workers)
+        validate, validate_source = self.validate_file, self._validate_source
+        if controller is not None:
+            max_workers = controller.max_limit
+            validate = partial(self._validate_timed, controller, validate)
+            validate_source = partial(self._validate_timed, controller, validate_source)
+        hashed = journal is not None and journal.key_mode == KEY_HASH
+        ensure_connections = getattr(self.client, 'ensure_connections', None)
+        if callable(ensure_connections):
+            # One pooled keep-alive connection per worker
+            ensure_connections(max_workers)
+        window = max(window or max_workers * 2, 1)
+        files = iter(files)
+        exhausted = False
+        pending: Dict[Future, Tuple[Path, Optional[str]]] = {}
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self.validate_file, 
-                    file, 
-                    version, 
-                    profile,
-                    False,
-                    options
-                ): file
-                for file in files
-            }
-            
-            for future in as_completed(futures):
-                filepath = futures[future]
-                try:
-                    result = future.result()
-                    result.metadata['file'] = str(filepath)
-                    results.append(result)
-                except Exception as e:
-                    # Create error result for failed file
-                    error_result = ValidationResult(
-                        valid=False,
-                        errors=[ValidationErrorDetail(
-                            line=0,
-                            column=0,
-                            message=f"Failed to validate {filepath.name}: {str(e)}",
-                            severity="error",
-                            rule="FILE_ERROR"
-                        )],
-                        warnings=[],
-                        metadata={"file": str(filepath), "error": str(e)}
-                    )
-                    results.append(error_result)
-        
-        valid_count = sum(1 for r in results if r.valid)
-        return BatchValidationResult(
-            total_files=len(files),
-            valid_files=valid_count,
-            invalid_files=len(files) - valid_count,
-            results=results,
-            processing_time=time.time() - start_time
-        )
+            try:
+                while True:
+                    limit = min(window, controller.limit) if controller else window
+                    while not exhausted and len(pending) < limit:
+                        file = next(files, None)
+                        if file is None:
+                            exhausted = True
+                            break
+                        filepath = Path(file)
+                        key = _journal_key(journal, filepath, version, profile)
+                        stored = journal.get(key) if key is not None else None
+                        if stored is not None:
+                            stored.metadata['file'] = str(filepath)
+                            yield stored
+                            continue
+                        if hashed:
+                            future = executor.submit(
+                                self._validate_journaled, journal, validate_source,
+                                filepath, version, profile, options
+                            )
+                        else:
+                            future = executor.submit(validate, filepath, version, profile, False, options)
+                        pending[future] = (filepath, key)
+                    if not pending:
+                        return
+                    
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        filepath, key = pending.pop(future)
+                        try:
+                            result = future.result()
+                            result.metadata['file'] = str(filepath)
+                        except Exception as e:
+                            result = _file_error_result(filepath, e)
+                        else:
+                            if key is not None:
+                                journal.record(key, filepath, result)
+                        yield result
+            finally:
+                # Abandoned generator: drop work that has not started
+                for future in pending:
+                    future.cancel()
+                if journal is not None:
+                    journal.flush()
     
-    def validate_file(
+    def _validate_journaled(
         self,
+        journal: CheckpointJournal,
+        validate: Callable[..., ValidationResult],
         filepath: Path,
         version: str,
+        profile: Optional[str],
+        options: Optional[ValidationOptions]
+    ) -> ValidationResult:
+        """
+        Worker for hash-keyed journals: read the file once, key it by the
+        SHA-256 of those bytes, and validate and record it unless stored
+        """
+        with read_file(filepath, ('sha256',)) as source:
+            key = journal.digest_key(source.digests['sha256'], version, profile)
+            stored = journal.get(key)
+            if stored is not None:
+                return stored
+            result = validate(source, version, profile, False, options)
+        result.metadata['file'] = str(filepath)
+        journal.record(key, filepath, result)
+        return result
+    
+    @staticmethod
+    def _validate_timed(
+        controller: AdaptiveConcurrency,
+        validate: Callable[..., ValidationResult],
+        *args: Any
+    ) -> ValidationResult:
+        """Run a validation, reporting latency and failures to ``controller``"""
+        start = time.perf_counter()
+        try:
+            with controlling(controller):
+                result = validate(*args)
+        except Exception as e:
+            controller.record(time.perf_counter() - start, e)
+            raise
+        controller.record(time.perf_counter() - start)
+        return result
+    
+    def validate_file(
+        self,
+        filepath: Union[Path, DDEXDocument],
+        version: str,
         profile: Optional[str] = None,
         generate_hash: bool = False,
         options: Optional[ValidationOptions] = None
@@ -208,11 +373,16 @@ class DDEXValidator:
         """
         Validate file with optional hash generation
         
+        Paths are read once as bytes (memory-mapped when large) and sent
+        without decoding to ``str``; the hashes are computed in the same
+        pass, so peak memory is about one request body per file.
+        
         Args:
-            filepath: Path to XML file
+            filepath: Path to XML file, or a DDEXDocument read with
+                DDEXDocument.from_file()
             version: ERN version
             profile: Optional profile
-            generate_hash: Whether to generate MD5 hash
+            generate_hash: Whether to add MD5 and SHA-256 hashes of the file
             options: Optional validation options
             
         Returns:
@@ -221,30 +391,51 @@ class DDEXValidator:
         Raises:
             FileError: If file cannot be read
         """
-        filepath = Path(filepath)
-        if not filepath.exists():
-            raise FileError(f"File not found: {filepath}", filepath=str(filepath))
-        
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            raise FileError(f"Failed to read file: {e}", filepath=str(filepath))
-        
-        result = self.client.validate(content, version, profile, options)
+        digests = ('md5', 'sha256') if generate_hash else ()
+        if not isinstance(filepath, DDEXDocument):
+            with read_file(filepath, digests) as source:
+                return self._validate_source(source, version, profile, generate_hash, options)
+        
+        document = filepath
+        if document.path is None:
+            raise FileError("DDEXDocument was not read from a file")
+        filepath = document.path
+        result = self.client.validate(document.content, version, profile, options)
+        file_size = filepath.stat().st_size
+        hashes: Dict[str, str] = {}
+        if digests:
+            # Hash the file as stored; the document's text has normalised newlines
+            with read_file(filepath, digests) as source:
+                hashes = source.digests
         
         result.metadata['file_path'] = str(filepath)
         result.metadata['file_name'] = filepath.name
-        result.metadata['file_size'] = filepath.stat().st_size
+        result.metadata['file_size'] = file_size
         
         if generate_hash:
-            hash_md5 = hashlib.md5(content.encode()).hexdigest()
-            hash_sha256 = hashlib.sha256(content.encode()).hexdigest()
-            result.metadata['file_hash_md5'] = hash_md5
-            result.metadata['file_hash_sha256'] = hash_sha256
+            result.metadata['file_hash_md5'] = hashes['md5']
+            result.metadata['file_hash_sha256'] = hashes['sha256']
         
         return result
     
+    def _validate_source(
+        self,
+        source: FileSource,
+        version: str,
+        profile: Optional[str] = None,
+        generate_hash: bool = False,
+        options: Optional[ValidationOptions] = None
+    ) -> ValidationResult:
+        """validate_file() for a file already read with read_file()"""
+        result = self.client.validate(source.data, version, profile, options)
+        result.metadata['file_path'] = str(source.path)
+        result.metadata['file_name'] = source.path.name
+        result.metadata['file_size'] = source.size
+        if generate_hash:
+            result.metadata['file_hash_md5'] = source.digests['md5']
+            result.metadata['file_hash_sha256'] = source.digests['sha256']
+        return result
+    
     def validate_url(
         self,
         url: str,
@@ -493,180 +684,62 @@ class DDEXValidator:
             
             return "\n".join(lines)
     
-    def detect_version(self, content: str) -> Optional[str]:
+    def detect_version(self, content: Union[str, Path, BinaryIO, DDEXDocument]) -> Optional[str]:
         """
         Auto-detect ERN version from XML content
         
+        Only the root start-tag is read, so this takes constant time for
+        any document size.
+        
         Args:
-            content: XML content
+            content: XML content, DDEXDocument, file path or binary stream
             
         Returns:
             Detected version string or None
         """
-        # Quick string checks first
-        if 'ern/43' in content or 'ern/4.3' in content:
-            return '4.3'
-        elif 'ern/42' in content or 'ern/4.2' in content:
-            return '4.2'
-        elif 'ern/382' in content or 'ern/3.8' in content:
-            return '3.8.2'
-        
-        # Try parsing for more accurate detection
-        try:
-            root = ET.fromstring(content)
-            
-            # Check namespace
-            namespace = root.tag.split('}')[0].strip('{') if '}' in root.tag else ''
-            if '43' in namespace or '4.3' in namespace:
-                return '4.3'
-            elif '42' in namespace or '4.2' in namespace:
-                return '4.2'
-            elif '382' in namespace or '3.8' in namespace:
-                return '3.8.2'
-            
-            # Check schema version attribute
-            schema_version = root.get('MessageSchemaVersionId', '')
-            if '4.3' in schema_version or '43' in schema_version:
-                return '4.3'
-            elif '4.2' in schema_version or '42' in schema_version:
-                return '4.2'
-            elif '3.8' in schema_version or '382' in schema_version:
-                return '3.8.2'
-            
-        except ET.ParseError:
-            pass
-        except Exception:
-            pass
-        
-        return None
+        if isinstance(content, DDEXDocument):
+            return content.version
+        return sniff(content).version
     
-    def detect_profile(self, content: str) -> Optional[str]:
+    def detect_profile(self, content: Union[str, Path, BinaryIO, DDEXDocument]) -> Optional[str]:
         """
         Auto-detect profile from XML content
         
+        Content and documents fall back to guessing from the resource
+        types present. File paths and streams are only sniffed for the
+        root ReleaseProfileVersionId attribute, in constant time.
+        
         Args:
-            content: XML content
+            content: XML content, DDEXDocument, file path or binary stream
             
         Returns:
             Detected profile string or None
         """
-        try:
-            root = ET.fromstring(content)
-            
-            # Look for ReleaseProfileVersionId attribute
-            profile = root.get('ReleaseProfileVersionId', '')
-            
-            # Map common profile indicators
-            profile_lower = profile.lower()
-            if 'audioalbum' in profile_lower:
-                return 'AudioAlbum'
-            elif 'audiosingle' in profile_lower:
-                return 'AudioSingle'
-            elif 'video' in profile_lower and 'musicvideo' not in profile_lower:
-                return 'Video'
-            elif 'musicvideo' in profile_lower:
-                return 'Video'
-            elif 'classical' in profile_lower:
-                return 'Classical'
-            elif 'ringtone' in profile_lower:
-                return 'Ringtone'
-            elif 'dj' in profile_lower:
-                return 'DJ'
-            elif 'mixed' in profile_lower:
-                return 'Mixed'
-            elif 'releasebyrelease' in profile_lower:
-                return 'ReleaseByRelease'
-            
-            # Try to detect from content structure
-            ns_map = {'ern': root.tag.split('}')[0].strip('{') if '}' in root.tag else ''}
-            
-            # Check for video resources
-            video_resources = root.findall('.//ern:Video', ns_map) if ns_map else []
-            sound_resources = root.findall('.//ern:SoundRecording', ns_map) if ns_map else []
-            
-            if video_resources and not sound_resources:
-                return 'Video'
-            elif sound_resources and not video_resources:
-                # Check release count for single vs album
-                releases = root.findall('.//ern:Release', ns_map) if ns_map else []
-                if len(releases) == 1:
-                    # Could be single or album, check track count
-                    return 'AudioSingle'  # Default to single
-                return 'AudioAlbum'
-            
-        except ET.ParseError:
-            pass
-        except Exception:
-            pass
-        
-        return None
+        if isinstance(content, (str, bytes, DDEXDocument)):
+            return DDEXDocument.coerce(content).profile
+        return sniff(content).profile
     
-    def extract_metadata(self, content: str) -> Dict[str, Any]:
+    def extract_metadata(self, content: Union[str, DDEXDocument, Path, BinaryIO]) -> Dict[str, Any]:
         """
         Extract message ID, creation date, and release count
         
+        Content and documents are parsed once; version, profile, header
+        fields and counts all come from the same tree. File paths and
+        binary streams are processed incrementally with bounded memory,
+        which suits multi-gigabyte messages.
+        
         Args:
-            content: XML content
+            content: XML content, DDEXDocument, file path or binary stream
             
         Returns:
             Dictionary with extracted metadata
         """
-        metadata: Dict[str, Any] = {}
-        
         try:
-            root = ET.fromstring(content)
-            
-            # Get namespace
-            ns = root.tag.split('}')[0].strip('{') if '}' in root.tag else ''
-            ns_map = {'ern': ns} if ns else {}
-            
-            # Extract version
-            metadata['version'] = self.detect_version(content)
-            metadata['profile'] = self.detect_profile(content)
-            
-            # Find MessageHeader
-            header = root.find('.//ern:MessageHeader', ns_map) if ns_map else root.find('.//MessageHeader')
-            if header is not None:
-                # Message ID
-                msg_id_elem = header.find('ern:MessageId', ns_map) if ns_map else header.find('MessageId')
-                if msg_id_elem is not None and msg_id_elem.text:
-                    metadata['message_id'] = msg_id_elem.text
-                
-                # Creation date
-                created_elem = header.find('ern:MessageCreatedDateTime', ns_map) if ns_map else header.find('MessageCreatedDateTime')
-                if created_elem is not None and created_elem.text:
-                    metadata['created_date'] = created_elem.text
-                
-                # Sender
-                sender = header.find('ern:MessageSender', ns_map) if ns_map else header.find('MessageSender')
-                if sender is not None:
-                    party_name = sender.find('.//ern:PartyName', ns_map) if ns_map else sender.find('.//PartyName')
-                    if party_name is not None:
-                        full_name = party_name.find('ern:FullName', ns_map) if ns_map else party_name.find('FullName')
-                        if full_name is not None and full_name.text:
-                            metadata['sender'] = full_name.text
-            
-            # Count releases
-            releases = root.findall('.//ern:Release', ns_map) if ns_map else root.findall('.//Release')
-            metadata['release_count'] = len(releases)
-            
-            # Count resources
-            sound_recordings = root.findall('.//ern:SoundRecording', ns_map) if ns_map else root.findall('.//SoundRecording')
-            videos = root.findall('.//ern:Video', ns_map) if ns_map else root.findall('.//Video')
-            metadata['sound_recording_count'] = len(sound_recordings)
-            metadata['video_count'] = len(videos)
-            metadata['total_resources'] = len(sound_recordings) + len(videos)
-            
-            # Count deals
-            deals = root.findall('.//ern:ReleaseDeal', ns_map) if ns_map else root.findall('.//ReleaseDeal')
-            metadata['deal_count'] = len(deals)
-            
-        except ET.ParseError as e:
-            metadata['parse_error'] = str(e)
+            if not isinstance(content, (str, bytes, DDEXDocument)):
+                return stream_metadata(content)
+            return DDEXDocument.coerce(content).metadata()
         except Exception as e:
-            metadata['extraction_error'] = str(e)
-        
-        return metadata
+            return {'extraction_error': str(e)}
     
     def is_valid(
         self,
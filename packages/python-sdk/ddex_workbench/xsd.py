@@ -0,0 +1,269 @@
+# packages/python-sdk/ddex_workbench/xsd.py
+"""
+Local XSD validation for ERN messages
+
+Network-free counterpart of the server's XSD step
+(functions/validators/xsdValidator.js). Requires lxml
+(``pip install ddex-workbench[xsd]``) and a local copy of the DDEX
+schemas, laid out like the server's ``schemas`` directory::
+
+    <schema_dir>/ern/4.3/release-notification.xsd
+    <schema_dir>/ern/4.3/allowed-value-sets.xsd
+    
+(``<schema_dir>/4.3/...`` is accepted too.) Each schema is compiled once
+per process and shared by every XSDValidator.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+
+from .document import DDEXDocument
+from .errors import ConfigurationError, UnsupportedVersionError
+from .types import ValidationError, ValidationResult
+
+
+SCHEMA_DIR_ENV = "DDEX_SCHEMA_DIR"
+MAIN_SCHEMA = "release-notification.xsd"
+
+# Allowed value set schema imported by each release-notification.xsd
+AVS_FILENAMES = {
+    '3.8.2': 'avs_20161006.xsd',
+    '4.2': 'avs20200518.xsd',
+    '4.3': 'allowed-value-sets.xsd'
+}
+
+_schemas: Dict[Tuple[str, str], "_CompiledSchema"] = {}
+_schemas_lock = threading.Lock()
+
+
+if etree is not None:
+    class _LocalSchemaResolver(etree.Resolver):
+        """Serve http(s) schemaLocation imports from the local version directory"""
+        
+        def __init__(self, directory: Path, avs_filename: str):
+            super().__init__()
+            self.directory = directory
+            self.avs_filename = avs_filename
+        
+        def resolve(self, url, pubid, context):
+            if not url or not url.startswith(('http://', 'https://')):
+                return None
+            if 'allowed-value-sets' in url:
+                filename = self.avs_filename
+            else:
+                filename = url.rstrip('/').rsplit('/', 1)[-1]
+            path = self.directory / filename
+            if path.exists():
+                return self.resolve_filename(str(path), context)
+            return None
+
+
+class _CompiledSchema:
+    """A compiled XMLSchema plus the lock guarding its error log"""
+    
+    __slots__ = ("schema", "lock")
+    
+    def __init__(self, schema: "etree.XMLSchema"):
+        self.schema = schema
+        self.lock = threading.Lock()
+
+
+def _require_lxml() -> None:
+    if etree is None:
+        raise ConfigurationError(
+            "Local XSD validation requires lxml. "
+            "Install it with: pip install ddex-workbench[xsd]",
+            config_key="lxml"
+        )
+
+
+def find_schema(version: str, schema_dir: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Locate release-notification.xsd for a version
+    
+    Args:
+        version: ERN version
+        schema_dir: Schema root (defaults to $DDEX_SCHEMA_DIR)
+        
+    Returns:
+        Path to the main schema file
+        
+    Raises:
+        UnsupportedVersionError: If the version is not supported
+        ConfigurationError: If the schema cannot be found
+    """
+    if version not in AVS_FILENAMES:
+        raise UnsupportedVersionError(version, list(AVS_FILENAMES))
+    schema_dir = schema_dir or os.environ.get(SCHEMA_DIR_ENV)
+    if not schema_dir:
+        raise ConfigurationError(
+            f"No XSD schema directory configured. Pass schema_dir or set {SCHEMA_DIR_ENV}",
+            config_key="schema_dir"
+        )
+    root = Path(schema_dir).expanduser()
+    for candidate in (root / 'ern' / version / MAIN_SCHEMA, root / version / MAIN_SCHEMA):
+        if candidate.exists():
+            return candidate
+    raise ConfigurationError(
+        f"{MAIN_SCHEMA} for ERN {version} not found under {root}",
+        config_key="schema_dir"
+    )
+
+
+def load_schema(version: str, schema_dir: Optional[Union[str, Path]] = None) -> "_CompiledSchema":
+    """
+    Compile the schema for a version, or return the cached compilation
+    
+    Args:
+        version: ERN version
+        schema_dir: Schema root (defaults to $DDEX_SCHEMA_DIR)
+        
+    Returns:
+        Compiled schema shared by the whole process
+    """
+    _require_lxml()
+    path = find_schema(version, schema_dir)
+    key = (str(path.resolve()), version)
+    compiled = _schemas.get(key)
+    if compiled is not None:
+        return compiled
+    
+    with _schemas_lock:
+        compiled = _schemas.get(key)
+        if compiled is None:
+            parser = etree.XMLParser(no_network=True)
+            parser.resolvers.add(_LocalSchemaResolver(path.parent, AVS_FILENAMES[version]))
+            try:
+                schema = etree.XMLSchema(etree.parse(str(path), parser))
+            except (etree.XMLSchemaParseError, etree.XMLSyntaxError) as e:
+                raise ConfigurationError(
+                    f"Failed to compile XSD for ERN {version}: {e}",
+                    config_key="schema_dir"
+                )
+            compiled = _schemas[key] = _CompiledSchema(schema)
+    return compiled
+
+
+def clear_schema_cache() -> None:
+    """Drop all compiled schemas (e.g. after updating the schema files)"""
+    with _schemas_lock:
+        _schemas.clear()
+
+
+class XSDValidator:
+    """
+    Validate ERN messages against the DDEX XSDs with lxml
+    
+    Errors use the server's rule ID (``XSD-Schema``) and carry line,
+    column and the XPath of the offending element.
+    """
+    
+    def __init__(self, version: str = '4.3', schema_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize validator, compiling the schema if not cached yet
+        
+        Args:
+            version: ERN version ("4.3", "4.2" or "3.8.2")
+            schema_dir: Schema root (defaults to $DDEX_SCHEMA_DIR)
+            
+        Raises:
+            ConfigurationError: If lxml or the schema files are missing
+            UnsupportedVersionError: If the version is not supported
+        """
+        self.version = version
+        self._compiled = load_schema(version, schema_dir)
+        self._local = threading.local()
+    
+    def _parser(self) -> "etree.XMLParser":
+        """Per-thread document parser (lxml parsers are not thread-safe)"""
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = etree.XMLParser(
+                no_network=True, resolve_entities=False, huge_tree=True
+            )
+        return parser
+    
+    def check(self, content: Union[str, bytes, Path, DDEXDocument]) -> List[ValidationError]:
+        """
+        Validate and return the schema violations
+        
+        Args:
+            content: XML content, DDEXDocument or file path
+            
+        Returns:
+            List of ValidationError details (empty if valid)
+        """
+        try:
+            if isinstance(content, Path):
+                tree = etree.parse(str(content), self._parser())
+            elif isinstance(content, DDEXDocument):
+                parser = self._parser()
+                for chunk in content.iter_bytes():
+                    parser.feed(chunk)
+                tree = parser.close()
+            else:
+                if isinstance(content, str):
+                    content = content.encode('utf-8')
+                tree = etree.fromstring(content, self._parser())
+        except etree.XMLSyntaxError as e:
+            line, column = e.position if e.position else (0, 0)
+            return [ValidationError(
+                line=line or 0,
+                column=column or 0,
+                message=str(e),
+                severity='error',
+                rule='XML Well-formedness'
+            )]
+        
+        compiled = self._compiled
+        with compiled.lock:
+            if compiled.schema.validate(tree):
+                return []
+            log = list(compiled.schema.error_log)
+        
+        return [
+            ValidationError(
+                line=entry.line or 0,
+                column=entry.column or 0,
+                message=entry.message,
+                severity='error',
+                rule='XSD-Schema',
+                xpath=entry.path or None
+            )
+            for entry in log
+        ]
+    
+    def validate(self, content: Union[str, bytes, Path, DDEXDocument]) -> ValidationResult:
+        """
+        Validate and build a ValidationResult
+        
+        Args:
+            content: XML content, DDEXDocument or file path
+            
+        Returns:
+            ValidationResult
+        """
+        start = time.perf_counter()
+        errors = self.check(content)
+        return ValidationResult(
+            valid=not errors,
+            errors=errors,
+            warnings=[],
+            metadata={
+                'engine': 'xsd',
+                'schemaVersion': f"ERN {self.version}",
+                'processingTime': round((time.perf_counter() - start) * 1000, 3),
+                'validatedAt': datetime.now(timezone.utc).isoformat(),
+                'errorCount': len(errors),
+                'warningCount': 0
+            }
+        )
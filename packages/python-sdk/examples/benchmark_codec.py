@@ -0,0 +1,108 @@
+# examples/benchmark_codec.py
+"""
+Benchmark the JSON codecs used for API traffic
+
+Measures encoding of /validate payloads for ERN documents of several
+sizes, and decoding of responses with large error arrays, for every
+codec installed (install orjson with ``pip install ddex-workbench[fast]``).
+
+    python examples/benchmark_codec.py
+    python examples/benchmark_codec.py --sizes 1 10 50 --errors 1000 100000
+"""
+
+import argparse
+import json
+import time
+
+from ddex_workbench.codec import available_codecs, get_codec
+
+RELEASE = (
+    "<Release><ReleaseReference>R{i}</ReleaseReference>"
+    "<DisplayTitleText>Track \"{i}\" &amp; friends – été</DisplayTitleText>"
+    "<ReleaseType>TrackRelease</ReleaseType></Release>\n"
+)
+
+
+def make_document(megabytes: float) -> str:
+    """ERN-like XML of roughly the given size"""
+    target = int(megabytes * 1024 * 1024)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<ern:NewReleaseMessage>\n<ReleaseList>\n']
+    size = len(parts[0])
+    i = 0
+    while size < target:
+        part = RELEASE.format(i=i)
+        parts.append(part)
+        size += len(part)
+        i += 1
+    parts.append("</ReleaseList>\n</ern:NewReleaseMessage>\n")
+    return "".join(parts)
+
+
+def make_response(errors: int) -> bytes:
+    """A /validate response body with the given number of errors"""
+    return json.dumps({
+        "valid": False,
+        "errors": [
+            {
+                "line": i,
+                "column": 5,
+                "message": f"Element 'ReleaseId' is missing in Release R{i}",
+                "severity": "error",
+                "rule": "ERN-RELEASE-001",
+                "context": "ReleaseList/Release",
+                "xpath": f"/NewReleaseMessage/ReleaseList/Release[{i}]"
+            }
+            for i in range(errors)
+        ],
+        "warnings": [],
+        "metadata": {"processingTime": 120, "errorCount": errors}
+    }).encode("utf-8")
+
+
+def best_of(fn, repeat: int) -> float:
+    """Fastest of ``repeat`` runs, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def baseline_encode(payload):
+    """What requests does with json=: dumps to str, then encode"""
+    return json.dumps(payload).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.1, 1, 10, 50],
+                        help="document sizes in MB")
+    parser.add_argument("--errors", type=int, nargs="+", default=[100, 10000, 100000],
+                        help="error counts for response decoding")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    codecs = [get_codec(name) for name in available_codecs()]
+    names = ["requests json="] + [c.name for c in codecs]
+    header = f"{'':>18}" + "".join(f"{n:>16}" for n in names)
+    
+    print("Encode /validate payload (ms)")
+    print(header)
+    for megabytes in args.sizes:
+        payload = {"content": make_document(megabytes), "type": "ERN", "version": "4.3"}
+        timings = [best_of(lambda: baseline_encode(payload), args.repeat)]
+        timings += [best_of(lambda c=c: c.encode(payload), args.repeat) for c in codecs]
+        print(f"{megabytes:>15g} MB" + "".join(f"{t:>16.2f}" for t in timings))
+    
+    print("\nDecode /validate response (ms)")
+    print(header)
+    for count in args.errors:
+        body = make_response(count)
+        timings = [best_of(lambda: json.loads(body.decode("utf-8")), args.repeat)]
+        timings += [best_of(lambda c=c: c.decode(body), args.repeat) for c in codecs]
+        print(f"{count:>11} errors" + "".join(f"{t:>16.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# examples/load_test.py
+"""
+Load-test batch validation against the local stand-in server
+
+Runs DDEXValidator.validate_batch over generated ERN files at several
+concurrency levels against StandInServer, which emulates the API's
+latency, processing time, rate limits and 5xx faults, so no network or
+API key is needed.
+
+    python examples/load_test.py
+    python examples/load_test.py --files 200 --workers 1 4 16 --latency 0.08 --fault-rate 0.02
+    python examples/load_test.py --rate-limit --adaptive
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from ddex_workbench import DDEXClient
+from ddex_workbench.testing import StandInServer, lognormal
+
+RELEASE = (
+    "<Release><ReleaseReference>R{i}</ReleaseReference>"
+    "<ReleaseType>Album</ReleaseType></Release>\n"
+)
+
+
+def make_document(releases: int) -> str:
+    """A small ERN 4.3 message with the given number of releases"""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<ern:NewReleaseMessage xmlns:ern="http://ddex.net/xml/ern/43">\n'
+        "<MessageHeader><MessageId>LOAD</MessageId></MessageHeader>\n"
+        "<ReleaseList>\n" + "".join(RELEASE.format(i=i) for i in range(releases)) + "</ReleaseList>\n"
+        "<ResourceList><SoundRecording/></ResourceList>\n"
+        "<DealList><ReleaseDeal/></DealList>\n"
+        "</ern:NewReleaseMessage>\n"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--releases", type=int, default=500, help="releases per document")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--latency", type=float, default=0.05, help="median latency in seconds")
+    parser.add_argument("--processing", type=float, default=0.2, help="processing seconds per MB")
+    parser.add_argument("--fault-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", action="store_true", help="enforce the 60 req/min API key budget")
+    parser.add_argument("--adaptive", action="store_true", help="let the batch tune its concurrency")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        document = make_document(args.releases)
+        files = []
+        for i in range(args.files):
+            path = Path(directory) / f"release_{i}.xml"
+            path.write_text(document.replace("LOAD", f"LOAD{i}"), encoding="utf-8")
+            files.append(path)
+        print(f"{args.files} files of {len(document.encode()) / 1024:.0f} KB, "
+              f"latency ~{args.latency * 1000:.0f} ms, {args.processing} s/MB processing\n")
+        print(f"{'workers':>8}{'seconds':>10}{'files/s':>10}{'valid':>8}{'429s':>6}{'5xx':>6}{'peak':>6}")
+        
+        for workers in args.workers:
+            server = StandInServer(
+                latency=lognormal(args.latency),
+                processing_per_mb=args.processing,
+                rate_limit=args.rate_limit,
+                fault_rate=args.fault_rate,
+                seed=args.seed
+            )
+            with server:
+                client = DDEXClient(
+                    base_url=server.url,
+                    api_key=server.create_key("load-test"),
+                    rate_limit=args.rate_limit,
+                    retry_delay=0.05
+                )
+                start = time.perf_counter()
+                batch = client.validator.validate_batch(
+                    files, "4.3", max_workers=workers, keep_results=False, adaptive=args.adaptive
+                )
+                elapsed = time.perf_counter() - start
+                client.close()
+                stats = server.stats
+            faults = sum(count for status, count in stats["statuses"].items() if status >= 500)
+            print(f"{workers:>8}{elapsed:>10.2f}{batch.total_files / elapsed:>10.1f}"
+                  f"{batch.valid_files:>8}{stats['rate_limited']:>6}{faults:>6}"
+                  f"{stats['peak_concurrency']:>6}")
+
+
+if __name__ == "__main__":
+    main()
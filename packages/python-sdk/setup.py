@@ -79,6 +79,24 @@ setup(
             "wheel>=0.38.0",
             "build>=0.10.0",
         ],
+        "async": [
+            "httpx>=0.24.0",
+        ],
+        "xsd": [
+            "lxml>=4.6.0",
+        ],
+        "schematron": [
+            "lxml>=4.6.0",
+        ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "msgspec": [
+            "msgspec>=0.18.0",
+        ],
+        "stream": [
+            "ijson>=3.1.0",
+        ],
         "docs": [
             "sphinx>=5.0.0",
             "sphinx-rtd-theme>=1.2.0",
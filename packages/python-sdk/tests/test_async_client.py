@@ -0,0 +1,323 @@
+# packages/python-sdk/tests/test_async_client.py
+"""Tests for AsyncDDEXClient"""
+
+import asyncio
+import json
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from ddex_workbench import AsyncDDEXClient, LocalValidator, ValidationCache, ValidationOptions
+from ddex_workbench.errors import (
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError
+)
+from tests import VALID_ERN_43_XML, INVALID_XML
+
+
+def make_client(handler, **kwargs):
+    """Create a client whose requests are answered by ``handler``"""
+    kwargs.setdefault("retry_delay", 0)
+    return AsyncDDEXClient(transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestAsyncDDEXClient:
+    """Test AsyncDDEXClient class"""
+    
+    @pytest.mark.asyncio
+    async def test_validate_success(self):
+        """Test successful validation and request payload"""
+        seen = {}
+        
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["body"] = json.loads(request.content)
+            seen["api_key"] = request.headers.get("X-API-Key")
+            return httpx.Response(200, json={
+                "valid": False,
+                "errors": [{
+                    "line": 5,
+                    "column": 10,
+                    "message": "Missing required element",
+                    "severity": "error",
+                    "rule": "ERN-001"
+                }],
+                "warnings": [],
+                "metadata": {"processingTime": 10}
+            })
+        
+        async with make_client(handler, api_key="test_key") as client:
+            options = ValidationOptions(generate_svrl=True)
+            result = await client.validate(INVALID_XML, "4.3", "AudioAlbum", options)
+        
+        assert seen["url"] == "https://api.ddex-workbench.org/validate"
+        assert seen["body"]["version"] == "4.3"
+        assert seen["body"]["profile"] == "AudioAlbum"
+        assert seen["body"]["generateSVRL"] is True
+        assert seen["api_key"] == "test_key"
+        assert result.valid is False
+        assert result.errors[0].line == 5
+        assert result.errors[0].rule == "ERN-001"
+    
+    @pytest.mark.asyncio
+    async def test_error_mapping(self):
+        """Test status codes map onto the same errors as DDEXClient"""
+        statuses = {"/health": 401, "/formats": 404}
+        
+        def handler(request):
+            return httpx.Response(statuses[request.url.path], json={})
+        
+        async with make_client(handler) as client:
+            with pytest.raises(AuthenticationError):
+                await client.health()
+            with pytest.raises(NotFoundError):
+                await client.formats()
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_retried_then_raised(self):
+        """Test 429 responses are retried before raising RateLimitError"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, headers={
+                "Retry-After": "0",
+                "X-RateLimit-Limit": "10",
+                "X-RateLimit-Remaining": "0"
+            })
+        
+        async with make_client(handler, max_retries=2) as client:
+            with pytest.raises(RateLimitError) as exc_info:
+                await client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert len(calls) == 3
+        assert exc_info.value.limit == 10
+    
+    @pytest.mark.asyncio
+    async def test_server_error_recovers(self):
+        """Test a transient 5xx is retried"""
+        responses = [
+            httpx.Response(503),
+            httpx.Response(200, json={"valid": True, "errors": [], "warnings": []})
+        ]
+        
+        async with make_client(lambda request: responses.pop(0)) as client:
+            result = await client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert result.valid is True
+        
+        async with make_client(lambda request: httpx.Response(500), max_retries=0) as client:
+            with pytest.raises(ServerError):
+                await client.validate(VALID_ERN_43_XML, "4.3")
+    
+    @pytest.mark.asyncio
+    async def test_local_first(self):
+        """Test local rejections skip the API"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"valid": True, "errors": [], "warnings": []})
+        
+        async with make_client(handler, local_first=LocalValidator(xsd=False)) as client:
+            rejected = await client.validate(INVALID_XML, "4.3")
+            accepted = await client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert len(calls) == 1
+        assert rejected.metadata["remote_skipped"] is True
+        assert rejected.errors[0].engine == "structural"
+        assert accepted.metadata["engines"] == ["structural", "api"]
+    
+    @pytest.mark.asyncio
+    async def test_blocking_work_off_event_loop(self):
+        """Test cache, local checks and minification run outside the event loop thread"""
+        loop_thread = threading.get_ident()
+        threads = set()
+        local = LocalValidator(xsd=False)
+        cache = ValidationCache()
+        
+        def recorded(method):
+            def wrapper(*args, **kwargs):
+                threads.add(threading.get_ident())
+                return method(*args, **kwargs)
+            return wrapper
+        
+        local.validate = recorded(local.validate)
+        cache.prepare = recorded(cache.prepare)
+        cache.store = recorded(cache.store)
+        handler = lambda request: httpx.Response(200, json={"valid": True, "errors": [], "warnings": []})
+        
+        async with make_client(handler, local_first=local, cache=cache, minify=True) as client:
+            result = await client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert result.valid is True
+        assert threads and loop_thread not in threads
+    
+    @pytest.mark.asyncio
+    async def test_api_keys(self):
+        """Test API key management endpoints"""
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, json={"keys": [
+                    {"id": "k1", "name": "CI", "created_at": "2024-01-01"}
+                ]})
+            return httpx.Response(200, json={})
+        
+        async with make_client(handler) as client:
+            keys = await client.list_api_keys()
+            assert keys[0].name == "CI"
+            assert await client.delete_api_key("k1") is True
+            
+            client.set_api_key("new_key")
+            assert client.session.headers["X-API-Key"] == "new_key"
+            client.clear_api_key()
+            assert "X-API-Key" not in client.session.headers
+    
+    @pytest.mark.asyncio
+    async def test_validate_batch_bounded_concurrency(self):
+        """Test batch validation never exceeds max_concurrency"""
+        state = {"in_flight": 0, "peak": 0}
+        
+        async def handler(request):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            valid = "MessageHeader" in json.loads(request.content)["content"]
+            return httpx.Response(200, json={"valid": valid, "errors": [], "warnings": []})
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = []
+            for i in range(12):
+                path = Path(tmpdir) / f"file{i}.xml"
+                path.write_text(VALID_ERN_43_XML if i % 3 else "<root/>")
+                files.append(path)
+            files.append(Path(tmpdir) / "missing.xml")
+            
+            async with make_client(handler) as client:
+                batch = await client.validate_batch(files, "4.3", max_concurrency=3)
+        
+        assert state["peak"] <= 3
+        assert batch.total_files == 13
+        assert batch.valid_files == 8
+        assert batch.invalid_files == 5
+        missing = [r for r in batch.results if r.metadata["file"].endswith("missing.xml")]
+        assert missing[0].errors[0].rule == "FILE_ERROR"
+    
+    @pytest.mark.asyncio
+    async def test_iter_validate_lazy(self):
+        """Test iter_validate pulls files lazily and streams results"""
+        pulled = []
+        
+        def handler(request):
+            return httpx.Response(200, json={"valid": True, "errors": [], "warnings": []})
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.xml"
+            path.write_text(VALID_ERN_43_XML)
+            
+            def files():
+                for i in range(10):
+                    pulled.append(i)
+                    yield path
+            
+            async with make_client(handler) as client:
+                stream = client.iter_validate(files(), "4.3", max_concurrency=2)
+                first = await stream.__anext__()
+                assert len(pulled) <= 3
+                rest = [result async for result in stream]
+        
+        assert first.valid is True
+        assert len(rest) == 9
+    
+    @pytest.mark.asyncio
+    async def test_iter_validate_walks_off_loop(self):
+        """Test iter_validate advances the file iterator off the event loop thread"""
+        threads = []
+        
+        def handler(request):
+            return httpx.Response(200, json={"valid": True, "errors": [], "warnings": []})
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.xml"
+            path.write_text(VALID_ERN_43_XML)
+            
+            def files():
+                for _ in range(3):
+                    threads.append(threading.get_ident())
+                    yield path
+            
+            async with make_client(handler) as client:
+                results = [r async for r in client.iter_validate(files(), "4.3")]
+        
+        assert len(results) == 3
+        assert threading.get_ident() not in threads
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_validate_coalesced(self):
+        """Test identical concurrent validate() calls share one request"""
+        calls = []
+        
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"valid": True, "errors": [], "warnings": []})
+        
+        async with make_client(handler) as client:
+            results = await asyncio.gather(*[
+                client.validate(VALID_ERN_43_XML, "4.3") for _ in range(5)
+            ])
+            other = await client.validate(VALID_ERN_43_XML, "4.2")
+        
+        assert calls == ["/validate", "/validate"]
+        assert all(r.valid for r in results)
+        assert sum(1 for r in results if r.metadata.get("coalesced")) == 4
+        assert "coalesced" not in other.metadata
+    
+    @pytest.mark.asyncio
+    async def test_coalesced_error_reaches_every_caller(self):
+        """Test a failed shared request raises in every caller"""
+        calls = []
+        
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(404, json={})
+        
+        async with make_client(handler) as client:
+            outcomes = await asyncio.gather(
+                *[client.validate(VALID_ERN_43_XML, "4.3") for _ in range(3)],
+                return_exceptions=True
+            )
+        
+        assert len(calls) == 1
+        assert all(isinstance(o, NotFoundError) for o in outcomes)
+    
+    @pytest.mark.asyncio
+    async def test_validate_file_sends_bytes_body(self):
+        """Test validate_file streams the file's JSON body with a Content-Length"""
+        seen = {}
+        
+        async def handler(request):
+            body = await request.aread()
+            seen["body"] = json.loads(body)
+            seen["length"] = request.headers.get("Content-Length")
+            seen["size"] = len(body)
+            return httpx.Response(200, json={"valid": True, "errors": [], "warnings": []})
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.xml"
+            path.write_bytes(VALID_ERN_43_XML.encode("utf-8"))
+            
+            async with make_client(handler) as client:
+                result = await client.validate_file(path, "4.3")
+        
+        assert seen["body"]["content"] == VALID_ERN_43_XML
+        assert seen["length"] == str(seen["size"])
+        assert result.metadata["file_size"] == len(VALID_ERN_43_XML.encode("utf-8"))
@@ -0,0 +1,232 @@
+# packages/python-sdk/tests/test_cache.py
+"""Tests for validation result caching"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import responses
+
+from ddex_workbench import DDEXClient, ValidationOptions
+from ddex_workbench.cache import DiskCache, MemoryCache, ValidationCache, make_cache_key
+from tests import VALID_ERN_43_XML, INVALID_XML
+
+
+VALIDATE_URL = "https://api.ddex-workbench.org/validate"
+RESPONSE = {
+    "valid": False,
+    "errors": [{"line": 3, "column": 1, "message": "Missing", "rule": "ERN-001"}],
+    "warnings": [],
+    "metadata": {"processingTime": 12}
+}
+
+
+class TestCacheKey:
+    """Test cache key construction"""
+    
+    def test_key_covers_request(self):
+        """Test every request parameter changes the key"""
+        base = make_cache_key(VALID_ERN_43_XML, "4.3")
+        
+        assert base == make_cache_key(VALID_ERN_43_XML.encode("utf-8"), "4.3")
+        assert base != make_cache_key(INVALID_XML, "4.3")
+        assert base != make_cache_key(VALID_ERN_43_XML, "4.2")
+        assert base != make_cache_key(VALID_ERN_43_XML, "4.3", "AudioAlbum")
+        assert base != make_cache_key(
+            VALID_ERN_43_XML, "4.3", options=ValidationOptions(verbose=True)
+        )
+
+
+class TestMemoryCache:
+    """Test MemoryCache LRU"""
+    
+    def test_lru_eviction_by_count(self):
+        """Test least recently used entries are evicted first"""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", {"v": 1}, 10)
+        cache.set("b", {"v": 2}, 10)
+        cache.get("a")
+        cache.set("c", {"v": 3}, 10)
+        
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("b") is None
+        assert len(cache) == 2
+    
+    def test_eviction_by_size(self):
+        """Test the byte bound is enforced"""
+        cache = MemoryCache(max_entries=100, max_bytes=25)
+        cache.set("a", {}, 10)
+        cache.set("b", {}, 10)
+        cache.set("c", {}, 10)
+        cache.set("huge", {}, 100)
+        
+        assert cache.get("a") is None
+        assert cache.get("huge") is None
+        assert cache.size == 20
+
+
+class TestDiskCache:
+    """Test DiskCache SQLite tier"""
+    
+    def test_persistence_and_ttl(self):
+        """Test entries survive reopening and expire after the TTL"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache.db"
+            cache = DiskCache(path, ttl=3600)
+            cache.set("a", RESPONSE, 100)
+            cache.close()
+            
+            reopened = DiskCache(path, ttl=3600)
+            assert reopened.get("a") == RESPONSE
+            assert reopened.size == 100
+            
+            reopened.ttl = -1
+            assert reopened.get("a") is None
+            assert len(reopened) == 0
+            reopened.close()
+    
+    def test_size_eviction(self):
+        """Test least recently accessed entries are evicted over the bound"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(Path(tmpdir) / "cache.db", max_bytes=250)
+            cache.set("a", {"v": 1}, 100)
+            time.sleep(0.01)
+            cache.set("b", {"v": 2}, 100)
+            time.sleep(0.01)
+            cache.get("a")
+            cache.set("c", {"v": 3}, 100)
+            
+            assert cache.get("b") is None
+            assert cache.get("a") == {"v": 1}
+            assert cache.size == 200
+            cache.close()
+
+
+class TestClientCache:
+    """Test DDEXClient.validate caching"""
+    
+    @responses.activate
+    def test_repeat_validation_hits_cache(self):
+        """Test a repeated request is served without a second API call"""
+        responses.add(responses.POST, VALIDATE_URL, json=RESPONSE)
+        client = DDEXClient(cache=True)
+        
+        first = client.validate(VALID_ERN_43_XML, "4.3")
+        first.metadata["file_path"] = "mutated"
+        second = client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert len(responses.calls) == 1
+        assert second.errors == first.errors
+        assert second.metadata["cached"] is True
+        assert "file_path" not in second.metadata
+        assert client.cache.stats()["hits"] == 1
+        
+        # Different options are a different request
+        client.validate(VALID_ERN_43_XML, "4.3", options=ValidationOptions(verbose=True))
+        assert len(responses.calls) == 2
+    
+    @responses.activate
+    def test_disk_tier_shared_between_clients(self):
+        """Test a persistent cache serves results to a new client"""
+        responses.add(responses.POST, VALIDATE_URL, json=RESPONSE)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache.db"
+            cache = ValidationCache.with_disk(path)
+            DDEXClient(cache=cache).validate(INVALID_XML, "4.3")
+            cache.close()
+            
+            cache = ValidationCache.with_disk(path)
+            result = DDEXClient(cache=cache).validate(INVALID_XML, "4.3")
+            cache.close()
+        
+        assert len(responses.calls) == 1
+        assert result.errors[0].rule == "ERN-001"
+    
+    @responses.activate
+    def test_failures_not_cached(self):
+        """Test error responses are not cached"""
+        responses.add(responses.POST, VALIDATE_URL, json={"error": "bad"}, status=400)
+        responses.add(responses.POST, VALIDATE_URL, json=RESPONSE)
+        client = DDEXClient(cache=True)
+        
+        try:
+            client.validate(INVALID_XML, "4.3")
+        except Exception:
+            pass
+        result = client.validate(INVALID_XML, "4.3")
+        
+        assert result.valid is False
+        assert len(responses.calls) == 2
+
+
+PRETTY_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<ern:NewReleaseMessage xmlns:ern="http://ddex.net/xml/ern/43" MessageSchemaVersionId="ern/43" LanguageAndScriptCode="en">
+    <!-- generated by label system -->
+    <MessageHeader>
+        <MessageId>MSG_TEST_001</MessageId>
+    </MessageHeader>
+    <ReleaseList>
+        <Release>
+            <ReleaseReference>R0</ReleaseReference>
+        </Release>
+    </ReleaseList>
+</ern:NewReleaseMessage>"""
+
+# Same message: no indentation, attributes reordered, different prefix
+COMPACT_XML = (
+    '<ddex:NewReleaseMessage LanguageAndScriptCode="en" MessageSchemaVersionId="ern/43" '
+    'xmlns:ddex="http://ddex.net/xml/ern/43"><MessageHeader><MessageId>MSG_TEST_001</MessageId>'
+    '</MessageHeader><ReleaseList><Release><ReleaseReference>R0</ReleaseReference></Release>'
+    '</ReleaseList></ddex:NewReleaseMessage>'
+)
+
+
+class TestCanonicalCache:
+    """Test canonicalized cache keys and position remapping"""
+    
+    def test_fingerprint_ignores_layout(self):
+        """Test layout variants share a fingerprint but content changes do not"""
+        from ddex_workbench.canonical import fingerprint
+        
+        assert fingerprint(PRETTY_XML) == fingerprint(COMPACT_XML)
+        assert fingerprint(PRETTY_XML).startswith("c14n:")
+        assert fingerprint(PRETTY_XML) != fingerprint(COMPACT_XML.replace("R0", "R1"))
+        assert fingerprint("<unclosed>").startswith("raw:")
+    
+    def test_fingerprint_keeps_whitespace_content(self):
+        """Test whitespace that is an element's whole content is significant"""
+        from ddex_workbench.canonical import fingerprint
+        
+        assert fingerprint("<A><X> </X></A>") != fingerprint("<A><X/></A>")
+        assert fingerprint("<A><X> <!-- c --> </X></A>") == fingerprint("<A><X>  </X></A>")
+        assert fingerprint("<A>\n  <X/>\n</A>") == fingerprint("<A><X/></A>")
+    
+    @responses.activate
+    def test_variant_hits_with_remapped_positions(self):
+        """Test a layout variant is served from cache with its own positions"""
+        # Error reported on the <Release> start tag of PRETTY_XML (line 8)
+        responses.add(responses.POST, VALIDATE_URL, json={
+            "valid": False,
+            "errors": [
+                {"line": 8, "column": 0, "message": "Release incomplete", "rule": "XSD-Schema"},
+                {"line": 0, "column": 0, "message": "Profile missing", "rule": "ERN43-Profile"}
+            ],
+            "warnings": [{"line": 9, "column": 13, "message": "Odd reference"}]
+        })
+        client = DDEXClient(cache=ValidationCache(canonicalize=True))
+        
+        original = client.validate(PRETTY_XML, "4.3")
+        variant = client.validate(COMPACT_XML, "4.3")
+        again = client.validate(PRETTY_XML, "4.3")
+        
+        assert len(responses.calls) == 1
+        assert variant.metadata["cached"] is True
+        # COMPACT_XML is a single line
+        assert (variant.errors[0].line, variant.errors[0].column) == (1, 0)
+        assert (variant.errors[1].line, variant.errors[1].column) == (0, 0)
+        assert variant.warnings[0].line == 1
+        assert variant.warnings[0].column == COMPACT_XML.index("<ReleaseReference>") + 1
+        # The original text gets its original positions back
+        assert again.errors == original.errors
+        assert again.warnings == original.warnings
@@ -1,11 +1,16 @@
 # packages/python-sdk/tests/test_client.py
 """Tests for DDEXClient"""
 
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
 import pytest
 import responses
 from unittest.mock import Mock, patch
 
-from ddex_workbench import DDEXClient, ValidationOptions
+from ddex_workbench import DDEXClient, ValidationOptions, ValidationResult
 from ddex_workbench.errors import (
     RateLimitError,
     AuthenticationError,
@@ -175,6 +180,41 @@ class TestDDEXClient:
         with pytest.raises((ServerError, NetworkError)):
             client.validate(VALID_ERN_43_XML, version="4.3")
     
+    @responses.activate
+    def test_exhausted_retries_raise_server_error(self):
+        """Test a 5xx that outlasts every retry raises ServerError, not NetworkError"""
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json={"error": "Service unavailable"},
+            status=503
+        )
+        
+        client = DDEXClient(max_retries=2, retry_delay=0)
+        with pytest.raises(ServerError) as exc_info:
+            client.validate(VALID_ERN_43_XML, version="4.3")
+        
+        assert exc_info.value.status_code == 503
+        assert len(responses.calls) == 3
+    
+    @responses.activate
+    def test_exhausted_retries_raise_rate_limit_error(self):
+        """Test a 429 that outlasts every retry raises RateLimitError, not NetworkError"""
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json={"error": "Rate limit exceeded"},
+            status=429,
+            headers={"Retry-After": "0", "X-RateLimit-Limit": "100"}
+        )
+        
+        client = DDEXClient(max_retries=2, retry_delay=0)
+        with pytest.raises(RateLimitError) as exc_info:
+            client.validate(VALID_ERN_43_XML, version="4.3")
+        
+        assert exc_info.value.limit == 100
+        assert len(responses.calls) == 3
+    
     @responses.activate
     def test_health_check(self):
         """Test health check endpoint"""
@@ -280,4 +320,154 @@ class TestDDEXClient:
         result, svrl = client.validate_with_svrl(VALID_ERN_43_XML, version="4.3")
         
         assert result.valid is True
-        assert svrl == "<svrl>test</svrl>"
\ No newline at end of file
+        assert svrl == "<svrl>test</svrl>"
+
+
+class _CountingServer(socketserver.ThreadingTCPServer):
+    """HTTP server that counts accepted connections"""
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), BaseHTTPRequestHandler)
+        self.accepted = 0
+    
+    def verify_request(self, request, client_address):
+        self.accepted += 1
+        return True
+    
+    def wait_accepted(self, count, timeout=2.0):
+        """Wait for accept() to catch up with the client's connects"""
+        deadline = time.monotonic() + timeout
+        while self.accepted < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.accepted
+
+
+class TestConnectionPool:
+    """Test connection pool sizing and warm-up"""
+    
+    def test_pool_size(self):
+        """Test max_connections sizes the adapter pool"""
+        client = DDEXClient(max_connections=25)
+        
+        assert client.session.get_adapter("https://api.ddex-workbench.org")._pool_maxsize == 25
+    
+    def test_ensure_connections_only_grows(self):
+        """Test the pool grows to a batch's concurrency but never shrinks"""
+        client = DDEXClient()
+        client.ensure_connections(32)
+        client.ensure_connections(4)
+        
+        assert client.max_connections == 32
+        assert client.session.get_adapter("https://api.ddex-workbench.org")._pool_maxsize == 32
+    
+    def test_batch_grows_pool(self, tmp_path):
+        """Test validate_batch sizes the pool to max_workers"""
+        client = DDEXClient()
+        client.validate = Mock(return_value=ValidationResult(valid=True, errors=[], warnings=[], metadata={}))
+        path = tmp_path / "file.xml"
+        path.write_text(VALID_ERN_43_XML)
+        
+        client.validator.validate_batch([path], "4.3", max_workers=16)
+        
+        assert client.max_connections == 16
+    
+    def test_warm_up(self):
+        """Test warm_up opens keep-alive connections ahead of time"""
+        server = _CountingServer()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = DDEXClient(base_url=f"http://127.0.0.1:{server.server_address[1]}", max_connections=4)
+            
+            assert client.warm_up(3) == 3
+            assert server.wait_accepted(3) == 3
+            assert client.warm_up() == 4
+            assert server.wait_accepted(4) == 4
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestCoalescing:
+    """Test identical concurrent validate() calls share one request"""
+    
+    def _run_concurrently(self, client, count=5):
+        results, errors = [], []
+        
+        def call():
+            try:
+                results.append(client.validate(VALID_ERN_43_XML, version="4.3"))
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+    
+    def test_concurrent_calls_share_request(self):
+        """Test one HTTP request serves every concurrent caller"""
+        client = DDEXClient()
+        release = threading.Event()
+        calls = []
+        
+        def request(method, endpoint, **kwargs):
+            calls.append(endpoint)
+            release.wait(2)
+            return {"valid": True, "errors": [], "warnings": [], "metadata": {}}
+        
+        client._request = request
+        threads, results, errors = self._run_concurrently(client)
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert calls == ["/validate"]
+        assert not errors
+        assert len(results) == 5
+        assert sum(1 for r in results if r.metadata.get("coalesced")) == 4
+        assert len(client._flights) == 0
+    
+    def test_error_reaches_every_caller(self):
+        """Test a failed shared request raises in every caller"""
+        client = DDEXClient()
+        release = threading.Event()
+        calls = []
+        
+        def request(method, endpoint, **kwargs):
+            calls.append(endpoint)
+            release.wait(2)
+            raise ServerError("boom", status_code=503)
+        
+        client._request = request
+        threads, results, errors = self._run_concurrently(client, count=3)
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert len(calls) == 1
+        assert not results
+        assert len(errors) == 3
+        assert all(isinstance(e, ServerError) for e in errors)
+    
+    def test_sequential_calls_not_coalesced(self):
+        """Test completed requests are not reused"""
+        client = DDEXClient()
+        client._request = Mock(return_value={"valid": True, "errors": [], "warnings": []})
+        
+        client.validate(VALID_ERN_43_XML, version="4.3")
+        client.validate(VALID_ERN_43_XML, version="4.3")
+        
+        assert client._request.call_count == 2
+    
+    def test_coalesce_disabled(self):
+        """Test coalesce=False sends every call"""
+        client = DDEXClient(coalesce=False)
+        
+        assert client._flights is None
+        assert client.get_config()["coalesce"] is False
@@ -0,0 +1,231 @@
+# packages/python-sdk/tests/test_codec.py
+"""Tests for pluggable JSON codecs"""
+
+import io
+import json
+
+import pytest
+import responses
+
+from ddex_workbench import DDEXClient
+from ddex_workbench.codec import (
+    DocumentBody,
+    StdlibCodec,
+    available_codecs,
+    encode_document_body,
+    escape_json_bytes,
+    get_codec,
+)
+from ddex_workbench.source import read_file
+from ddex_workbench.errors import ConfigurationError, DDEXError
+from tests import VALID_ERN_43_XML
+
+
+PAYLOAD = {
+    "content": VALID_ERN_43_XML + '<!-- "quotes", \\backslash\\, tab\t, é, 🎵 -->',
+    "type": "ERN",
+    "version": "4.3",
+    "generateSVRL": False
+}
+
+
+@pytest.fixture(params=available_codecs())
+def codec(request):
+    """Every codec installed here"""
+    return get_codec(request.param)
+
+
+class TestCodecs:
+    """Test codec round trips"""
+    
+    def test_encode_matches_stdlib(self, codec):
+        """Test every codec encodes to bytes the stdlib can read back"""
+        body = codec.encode(PAYLOAD)
+        
+        assert isinstance(body, bytes)
+        assert json.loads(body) == PAYLOAD
+        assert codec.decode(body) == PAYLOAD
+    
+    def test_decode_error_is_value_error(self, codec):
+        """Test invalid JSON raises ValueError for every codec"""
+        with pytest.raises(ValueError):
+            codec.decode(b"{not json")
+    
+    def test_auto_prefers_fastest(self):
+        """Test auto selection picks the first available codec"""
+        assert get_codec().name == available_codecs()[0]
+        assert get_codec("auto").name == available_codecs()[0]
+        assert available_codecs()[-1] == "json"
+    
+    def test_unknown_codec(self):
+        """Test unknown names raise ConfigurationError"""
+        with pytest.raises(ConfigurationError) as exc_info:
+            get_codec("yaml")
+        assert exc_info.value.config_key == "json_codec"
+    
+    def test_instance_passthrough(self):
+        """Test codec instances are used as given"""
+        codec = StdlibCodec()
+        assert get_codec(codec) is codec
+
+
+class TestByteEscaping:
+    """Test JSON encoding of UTF-8 documents without decoding them"""
+    
+    def test_escape_matches_json(self):
+        """Test escaped bytes decode back to the original text"""
+        text = PAYLOAD["content"] + "\x00\x01\x1f\x7f\r\n"
+        escaped = escape_json_bytes(text.encode("utf-8"))
+        
+        assert json.loads(b'"' + escaped + b'"') == text
+    
+    def test_document_body(self, codec):
+        """Test the body equals the JSON of the equivalent payload"""
+        fields = {k: v for k, v in PAYLOAD.items() if k != "content"}
+        
+        body = encode_document_body(codec, fields, PAYLOAD["content"].encode("utf-8"), chunk_size=7)
+        
+        assert json.loads(body) == PAYLOAD
+        assert json.loads(encode_document_body(codec, {}, b"<a/>")) == {"content": "<a/>"}
+    
+    def test_mapped_file_body(self, codec, tmp_path):
+        """Test a memory-mapped file is encoded directly"""
+        path = tmp_path / "release.xml"
+        path.write_bytes(PAYLOAD["content"].encode("utf-8"))
+        
+        with read_file(path, digests=("sha256",), mmap_threshold=0) as source:
+            assert source.mapped
+            body = encode_document_body(codec, {"version": "4.3"}, source.data)
+        
+        assert json.loads(body) == {"content": PAYLOAD["content"], "version": "4.3"}
+
+
+class TestDocumentBody:
+    """Test the streamed /validate body"""
+    
+    FIELDS = {"type": "ERN", "version": "4.3"}
+    EXPECTED = {"content": PAYLOAD["content"], "type": "ERN", "version": "4.3"}
+    
+    def test_sources(self, codec):
+        """Test every kind of source streams to the same JSON"""
+        text = PAYLOAD["content"]
+        data = text.encode("utf-8")
+        sources = [
+            text,
+            data,
+            io.BytesIO(data),
+            io.StringIO(text),
+            [data[:10], data[10:]],
+            (chunk for chunk in [text[:5], text[5:]]),
+        ]
+        for source in sources:
+            body = DocumentBody(codec, self.FIELDS, source, chunk_size=16)
+            assert json.loads(b"".join(body)) == self.EXPECTED
+    
+    def test_streams_in_slices(self, codec):
+        """Test the document is yielded slice by slice, never whole"""
+        data = PAYLOAD["content"].encode("utf-8")
+        
+        parts = list(DocumentBody(codec, {}, io.BytesIO(data), chunk_size=16))
+        
+        assert max(len(part) for part in parts) < 40
+        assert len(parts) > len(data) // 16
+    
+    def test_replay(self, codec):
+        """Test seekable files rewind and one-shot iterators refuse to replay"""
+        stream = io.BytesIO(b"<a/>")
+        body = DocumentBody(codec, {}, stream)
+        assert b"".join(body) == b"".join(body) == b'{"content":"<a/>"}'
+        
+        once = DocumentBody(codec, {}, iter([b"<a/>"]))
+        b"".join(once)
+        with pytest.raises(DDEXError):
+            b"".join(once)
+    
+    def test_size_hint(self, codec, tmp_path):
+        """Test the size is known for buffers, lists and regular files"""
+        path = tmp_path / "release.xml"
+        path.write_bytes(b"<a/>" * 10)
+        
+        assert DocumentBody(codec, {}, b"<a/>").size_hint == 4
+        assert DocumentBody(codec, {}, [b"<a/>", b"<b/>"]).size_hint == 8
+        with open(path, "rb") as f:
+            assert DocumentBody(codec, {}, f).size_hint == 40
+        assert DocumentBody(codec, {}, iter([b"<a/>"])).size_hint is None
+
+
+class _RecordingCodec(StdlibCodec):
+    name = "recording"
+    
+    def __init__(self):
+        super().__init__()
+        self.encoded = []
+        self.decoded = []
+    
+    def encode(self, obj):
+        self.encoded.append(obj)
+        return super().encode(obj)
+    
+    def decode(self, data):
+        self.decoded.append(data)
+        return super().decode(data)
+
+
+class TestClientCodec:
+    """Test the client sends and reads bodies through its codec"""
+    
+    @responses.activate
+    def test_request_and_response_use_codec(self):
+        """Test payloads are pre-encoded bytes and responses decoded from bytes"""
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json={"valid": True, "errors": [], "warnings": []},
+            status=200
+        )
+        codec = _RecordingCodec()
+        client = DDEXClient(json_codec=codec)
+        
+        result = client.validate(VALID_ERN_43_XML, version="4.3")
+        
+        request = responses.calls[0].request
+        assert isinstance(request.body, bytes)
+        assert json.loads(request.body)["content"] == VALID_ERN_43_XML
+        assert request.headers["Content-Type"] == "application/json"
+        assert codec.encoded[0]["version"] == "4.3"
+        assert isinstance(codec.decoded[0], bytes)
+        assert result.valid is True
+        assert client.get_config()["json_codec"] == "recording"
+    
+    @responses.activate
+    def test_bytes_content(self):
+        """Test bytes content is posted as an escaped JSON body"""
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json={"valid": True, "errors": [], "warnings": []},
+            status=200
+        )
+        client = DDEXClient()
+        
+        client.validate(PAYLOAD["content"].encode("utf-8"), version="4.3", profile="AudioAlbum")
+        
+        request = responses.calls[0].request
+        assert json.loads(bytes(request.body)) == {
+            "content": PAYLOAD["content"], "type": "ERN", "version": "4.3", "profile": "AudioAlbum"
+        }
+        assert request.headers["Content-Length"] == str(len(request.body))
+    
+    @responses.activate
+    def test_invalid_json_response(self):
+        """Test undecodable responses raise DDEXError"""
+        responses.add(
+            responses.GET,
+            "https://api.ddex-workbench.org/health",
+            body=b"<html>oops</html>",
+            status=200
+        )
+        client = DDEXClient(json_codec="json")
+        
+        with pytest.raises(DDEXError, match="Invalid JSON response"):
+            client.health()
@@ -0,0 +1,130 @@
+# packages/python-sdk/tests/test_compact.py
+"""Tests for compact issue storage"""
+
+import pickle
+from unittest.mock import Mock
+
+from ddex_workbench import (
+    BatchAccumulator,
+    DDEXClient,
+    DDEXValidator,
+    ErrorTable,
+    LazyValidationResult,
+    StringPool,
+    ValidationResult,
+)
+from ddex_workbench.compact import compact_result
+from ddex_workbench.types import PassedRule, ValidationError as ValidationErrorDetail, ValidationWarning
+from tests import VALID_ERN_43_XML
+
+
+def make_response(file_no):
+    return {
+        "valid": False,
+        "errors": [
+            {"line": i, "column": 2, "message": "Missing ReleaseId", "severity": "error", "rule": "ERN-001"}
+            for i in range(3)
+        ] + [{"line": 9, "column": 1, "message": "Check title", "severity": "warning", "rule": "W-2"}],
+        "warnings": [{"line": 4, "column": 1, "message": "Deprecated", "rule": "W-1"}],
+        "metadata": {"file": f"file{file_no}.xml"}
+    }
+
+
+def make_result(file_no=0):
+    return LazyValidationResult(make_response(file_no), DDEXClient._parse_error, DDEXClient._parse_warning)
+
+
+class TestSlottedTypes:
+    """Test issue types are slotted"""
+    
+    def test_no_instance_dict(self):
+        """Test errors, warnings and passed rules have no __dict__"""
+        for item in (
+            ValidationErrorDetail(line=1, column=1, message="m"),
+            ValidationWarning(line=1, column=1, message="m"),
+            PassedRule(rule="r", test="t")
+        ):
+            assert not hasattr(item, "__dict__")
+    
+    def test_dataclass_behaviour_kept(self):
+        """Test defaults, equality, mutation and pickling still work"""
+        error = ValidationErrorDetail(line=1, column=2, message="m")
+        
+        assert error.severity == "error"
+        assert error == ValidationErrorDetail(line=1, column=2, message="m")
+        error.engine = "api"
+        assert pickle.loads(pickle.dumps(error)) == error
+
+
+class TestStringPool:
+    """Test batch string interning"""
+    
+    def test_compact_result_shares_strings(self):
+        """Test identical strings across results become one object"""
+        pool = StringPool()
+        first = compact_result(make_result(0), pool)
+        second = compact_result(make_result(1), pool)
+        
+        assert type(first) is ValidationResult
+        assert first.errors[0].message is second.errors[2].message
+        assert first.warnings[0].rule is second.warnings[0].rule
+        assert len(pool) == 8
+    
+    def test_accumulator_compacts_retained_results(self):
+        """Test BatchAccumulator decodes and interns retained results"""
+        batch = BatchAccumulator(keep_results=True)
+        for i in range(3):
+            batch.add(make_result(i))
+        
+        results = batch.result().results
+        assert all(type(r) is ValidationResult for r in results)
+        assert results[0].errors[0].rule is results[2].errors[1].rule
+        assert batch.error_count == 12
+
+
+class TestErrorTable:
+    """Test columnar error table"""
+    
+    def test_add_and_rebuild(self):
+        """Test rows round-trip to issue objects"""
+        table = ErrorTable()
+        
+        assert table.add(make_result(0)) == 5
+        assert table.add(make_result(1)) == 5
+        assert len(table) == 10
+        assert table[0] == ValidationErrorDetail(
+            line=0, column=2, message="Missing ReleaseId", severity="error", rule="ERN-001"
+        )
+        assert table[4] == ValidationWarning(line=4, column=1, message="Deprecated", rule="W-1")
+        assert table[-1].message == "Deprecated"
+        assert table.row(5)["source"] == "file1.xml"
+    
+    def test_columns_and_counts(self):
+        """Test column access, grouping and selection"""
+        table = ErrorTable()
+        for i in range(4):
+            table.add(make_result(i))
+        
+        assert table.column("line")[:5] == [0, 1, 2, 9, 4]
+        assert table.counts("rule") == {"ERN-001": 12, "W-2": 4, "W-1": 4}
+        assert table.counts("severity")["warning"] == 8
+        assert list(table.select(rule="W-1", source="file2.xml")) == [14]
+        assert list(table.select(rule="unknown")) == []
+    
+    def test_validate_batch_fills_table(self, tmp_path):
+        """Test validate_batch collects issues without keeping results"""
+        client = Mock()
+        client.validate = Mock(side_effect=lambda *args, **kwargs: make_result())
+        validator = DDEXValidator(client)
+        files = []
+        for i in range(3):
+            path = tmp_path / f"file{i}.xml"
+            path.write_text(VALID_ERN_43_XML)
+            files.append(path)
+        
+        table = ErrorTable()
+        batch = validator.validate_batch(files, "4.3", keep_results=False, error_table=table)
+        
+        assert batch.results == []
+        assert len(table) == 15
+        assert set(table.column("source")) == {str(p) for p in files}
@@ -0,0 +1,210 @@
+# packages/python-sdk/tests/test_compression.py
+"""Tests for compressed request bodies"""
+
+import gzip
+import json
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from ddex_workbench import AsyncDDEXClient, DDEXClient, RateLimiter
+from ddex_workbench.compression import advertised_encodings, compress_body, resolve_compression
+from ddex_workbench.errors import ConfigurationError
+from tests import VALID_ERN_43_XML
+
+
+# Large enough to cross the default 64 KB threshold
+LARGE_XML = VALID_ERN_43_XML.replace(
+    "</ern:NewReleaseMessage>",
+    "<!-- padding -->\n" * 5000 + "</ern:NewReleaseMessage>"
+)
+
+VALID_RESPONSE = {"valid": True, "errors": [], "warnings": [], "metadata": {}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Stand-in for the Express API's /health and /validate routes"""
+    
+    def log_message(self, *args):
+        pass
+    
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, None, 0))
+        if self.server.health_failures:
+            self.server.health_failures -= 1
+            self._reply(503, {"error": {"message": "Service unavailable"}})
+            return
+        self._reply(200, {"status": "ok", "version": "1.0.2", "timestamp": "",
+                          "requestEncodings": self.server.encodings})
+    
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers["Content-Length"]))
+        encoding = self.headers.get("Content-Encoding")
+        self.server.requests.append(("POST", self.path, encoding, len(raw)))
+        if encoding and encoding not in self.server.accepts:
+            self._reply(415, {"error": {"message": f"Unsupported Content-Encoding: {encoding}"}})
+            return
+        if encoding == "gzip":
+            raw = gzip.decompress(raw)
+        elif encoding == "deflate":
+            raw = zlib.decompress(raw)
+        self.server.contents.append(json.loads(raw)["content"])
+        self._reply(200, VALID_RESPONSE)
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, encodings, accepts=None):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.encodings = encodings
+        self.accepts = encodings if accepts is None else accepts
+        self.requests = []
+        self.contents = []
+        self.health_failures = 0
+
+
+@pytest.fixture
+def server(request):
+    """Stand-in server; parametrize with (advertised, accepted) encodings"""
+    encodings, accepts = getattr(request, "param", (["gzip", "deflate"], None))
+    srv = _Server(encodings, accepts)
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def base_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+class TestCompressionHelpers:
+    """Test encoding selection and compression"""
+    
+    def test_resolve(self):
+        """Test settings normalise to False, "auto" or an encoding"""
+        assert resolve_compression(False) is False
+        assert resolve_compression(None) is False
+        assert resolve_compression(True) == "auto"
+        assert resolve_compression("deflate") == "deflate"
+        with pytest.raises(ConfigurationError):
+            resolve_compression("zstd")
+    
+    def test_advertised_encodings(self):
+        """Test only encodings the SDK can produce are picked up"""
+        assert advertised_encodings({"requestEncodings": ["br", "deflate", "gzip"]}) == ("gzip", "deflate")
+        assert advertised_encodings({"status": "ok"}) == ()
+    
+    def test_round_trip(self):
+        """Test gzip and deflate bodies decompress with the stdlib"""
+        body = LARGE_XML.encode()
+        
+        assert gzip.decompress(compress_body(body, "gzip")) == body
+        assert zlib.decompress(compress_body(bytearray(body), "deflate")) == body
+        assert len(compress_body(body)) * 10 < len(body)
+
+
+class TestClientCompression:
+    """Test request compression against a local stand-in server"""
+    
+    def test_large_body_negotiated_and_gzipped(self, server):
+        """Test /health is asked once and large bodies are sent gzipped"""
+        client = DDEXClient(base_url=base_url(server), compression="auto")
+        
+        client.validate(LARGE_XML, version="4.3")
+        client.validate(LARGE_XML + " ", version="4.3")
+        
+        methods = [(method, encoding) for method, _, encoding, _ in server.requests]
+        assert methods == [("GET", None), ("POST", "gzip"), ("POST", "gzip")]
+        assert server.requests[1][3] * 10 < len(LARGE_XML)
+        assert server.contents[0] == LARGE_XML
+    
+    def test_small_body_uncompressed(self, server):
+        """Test bodies under the threshold skip negotiation entirely"""
+        client = DDEXClient(base_url=base_url(server), compression="auto")
+        
+        client.validate(VALID_ERN_43_XML, version="4.3")
+        
+        assert [(m, e) for m, _, e, _ in server.requests] == [("POST", None)]
+    
+    @pytest.mark.parametrize("server", [([], None)], indirect=True)
+    def test_not_advertised(self, server):
+        """Test nothing is compressed when /health lists no encodings"""
+        client = DDEXClient(base_url=base_url(server), compression="auto")
+        
+        client.validate(LARGE_XML, version="4.3")
+        
+        assert [(m, e) for m, _, e, _ in server.requests] == [("GET", None), ("POST", None)]
+    
+    @pytest.mark.parametrize("server", [(["gzip"], [])], indirect=True)
+    def test_rejected_falls_back(self, server):
+        """Test a 415 resends uncompressed and turns compression off"""
+        client = DDEXClient(base_url=base_url(server), compression="gzip")
+        
+        result = client.validate(LARGE_XML, version="4.3")
+        client.validate(LARGE_XML + " ", version="4.3")
+        
+        assert result.valid is True
+        assert [e for _, _, e, _ in server.requests] == ["gzip", None, None]
+        assert client.get_config()["compression"] is False
+    
+    def test_disabled_by_default(self, server):
+        """Test large bodies are sent as-is, without a /health probe, by default"""
+        client = DDEXClient(base_url=base_url(server))
+        
+        client.validate(LARGE_XML, version="4.3")
+        
+        assert [(m, e) for m, _, e, _ in server.requests] == [("POST", None)]
+        assert client.get_config()["compression"] is False
+    
+    def test_negotiation_retried_after_transient_failure(self, server):
+        """Test a 503 from /health sends uncompressed for now, then asks again"""
+        client = DDEXClient(base_url=base_url(server), compression="auto", max_retries=0)
+        server.health_failures = 1
+        
+        client.validate(LARGE_XML, version="4.3")
+        client.validate(LARGE_XML + " ", version="4.3")
+        client._negotiate_after = 0.0
+        client.validate(LARGE_XML + "  ", version="4.3")
+        
+        methods = [(method, encoding) for method, _, encoding, _ in server.requests]
+        assert methods == [("GET", None), ("POST", None), ("POST", None), ("GET", None), ("POST", "gzip")]
+    
+    def test_probe_skips_rate_limiter(self, server):
+        """Test the /health probe does not take a rate limiter token"""
+        limiter = RateLimiter(limit=2, window=60, clock=lambda: 0.0)
+        client = DDEXClient(base_url=base_url(server), compression="auto", rate_limit=limiter)
+        
+        client.validate(LARGE_XML, version="4.3")
+        
+        assert [m for m, _, _, _ in server.requests] == ["GET", "POST"]
+        assert limiter.available == 1.0
+    
+    def test_health_reports_encodings(self, server):
+        """Test HealthStatus exposes the advertised encodings"""
+        client = DDEXClient(base_url=base_url(server))
+        
+        assert client.health().request_encodings == ["gzip", "deflate"]
+    
+    @pytest.mark.asyncio
+    async def test_async_client(self, server):
+        """Test the async client negotiates and compresses the same way"""
+        pytest.importorskip("httpx")
+        async with AsyncDDEXClient(base_url=base_url(server), compression="deflate") as client:
+            await client.validate(LARGE_XML, version="4.3")
+        
+        assert [(m, e) for m, _, e, _ in server.requests] == [("POST", "deflate")]
+        assert server.contents == [LARGE_XML]
@@ -0,0 +1,171 @@
+# packages/python-sdk/tests/test_concurrency.py
+"""Tests for adaptive concurrency control"""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from ddex_workbench import AdaptiveConcurrency, AsyncDDEXClient, DDEXClient, DDEXValidator, ValidationResult
+from ddex_workbench.errors import RateLimitError, ServerError
+from ddex_workbench.testing import StandInServer
+from tests import VALID_ERN_43_XML
+
+
+class FakeClock:
+    """Manually advanced clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveConcurrency:
+    """Test the AIMD controller"""
+    
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.changes = []
+        self.controller = AdaptiveConcurrency(
+            initial=4, max_limit=16, on_change=self.changes.append, clock=self.clock
+        )
+    
+    def test_additive_increase(self):
+        """Test the limit grows by about one per round of successes"""
+        for _ in range(5):
+            self.controller.record(0.1)
+        
+        assert self.controller.limit == 5
+        assert self.changes == [5]
+    
+    def test_capped_at_max(self):
+        """Test the limit never exceeds max_limit"""
+        for _ in range(1000):
+            self.controller.record(0.1)
+        
+        assert self.controller.limit == 16
+    
+    def test_overload_halves_once_per_round_trip(self):
+        """Test 429/5xx cut the limit, ignoring echoes from the same round"""
+        self.controller.record(0.1)
+        self.controller.record(0.1, ServerError("busy", 503))
+        self.controller.record(0.1, ServerError("busy", 503))
+        assert self.controller.limit == 2
+        
+        self.clock.now += 1
+        self.controller.record(0.1, RateLimitError("slow down"))
+        assert self.controller.limit == 1
+        assert self.changes == [2, 1]
+    
+    def test_file_errors_ignored(self):
+        """Test failures unrelated to load leave the limit alone"""
+        self.controller.record(0.1, ValueError("bad file"))
+        
+        assert self.controller.limit == 4
+    
+    def test_latency_inflation_cuts(self):
+        """Test rising latency is treated as congestion"""
+        self.controller.record(0.1)
+        for _ in range(10):
+            self.clock.now += 1
+            self.controller.record(1.0)
+        
+        assert self.controller.limit < 4
+    
+    def test_retry_after_holds_growth(self):
+        """Test Retry-After cuts the limit and freezes growth until it expires"""
+        self.controller.record(0.1, RateLimitError("slow down", retry_after=30))
+        assert self.controller.limit == 2
+        
+        for _ in range(10):
+            self.controller.record(0.1)
+        assert self.controller.limit == 2
+        
+        self.clock.now += 31
+        for _ in range(10):
+            self.controller.record(0.1)
+        assert self.controller.limit > 2
+
+
+class TestAdaptiveBatch:
+    """Test adaptive mode in DDEXValidator.iter_validate"""
+    
+    def test_in_flight_follows_limit(self):
+        """Test in-flight validations are bounded by the current limit"""
+        state = {"in_flight": 0, "peak": 0, "calls": 0}
+        lock = threading.Lock()
+        
+        def validate(*args, **kwargs):
+            with lock:
+                state["in_flight"] += 1
+                state["calls"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+                calls = state["calls"]
+            time.sleep(0.005)
+            with lock:
+                state["in_flight"] -= 1
+            if calls == 5:
+                raise ServerError("busy", 503)
+            return ValidationResult(valid=True, errors=[], warnings=[], metadata={})
+        
+        client = Mock()
+        client.validate.side_effect = validate
+        limits = []
+        controller = AdaptiveConcurrency(initial=2, max_limit=3, on_change=limits.append)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.xml"
+            path.write_text(VALID_ERN_43_XML)
+            batch = DDEXValidator(client).validate_batch(
+                [path] * 30, "4.3", adaptive=controller
+            )
+        
+        assert batch.total_files == 30
+        assert batch.invalid_files == 1
+        assert state["peak"] <= 3
+        assert limits and max(limits) <= 3
+    
+    def test_retried_attempts_reported(self, tmp_path):
+        """Test 5xx responses absorbed by the client's retries still cut the limit"""
+        path = tmp_path / "file.xml"
+        path.write_text(VALID_ERN_43_XML)
+        limits = []
+        controller = AdaptiveConcurrency(initial=8, on_change=limits.append)
+        
+        with StandInServer(rate_limit=False) as server:
+            client = DDEXClient(base_url=server.url, max_retries=2, retry_delay=0.01)
+            server.inject_faults(1, status=503)
+            batch = client.validator.validate_batch([path], "4.3", adaptive=controller)
+        
+        assert batch.valid_files == 1
+        assert limits[0] == 4
+    
+    @pytest.mark.asyncio
+    async def test_async_retried_attempts_reported(self):
+        """Test the async client reports retried 429s with their Retry-After"""
+        httpx = pytest.importorskip("httpx")
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"valid": True, "errors": [], "warnings": []})
+        ]
+        controller = AdaptiveConcurrency(initial=8)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.xml"
+            path.write_text(VALID_ERN_43_XML)
+            transport = httpx.MockTransport(lambda request: responses.pop(0))
+            async with AsyncDDEXClient(transport=transport, retry_delay=0) as client:
+                results = [r async for r in client.iter_validate([path], "4.3", adaptive=controller)]
+        
+        assert results[0].valid is True
+        assert controller.limit == 4
+    
+    def test_invalid_settings(self):
+        """Test the decrease factor is validated"""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(decrease=1.5)
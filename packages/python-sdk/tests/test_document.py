@@ -0,0 +1,222 @@
+# packages/python-sdk/tests/test_document.py
+"""Tests for DDEXDocument"""
+
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import pytest
+from unittest.mock import Mock, patch
+
+from ddex_workbench import DDEXClient, DDEXDocument
+from ddex_workbench.document import stream_metadata
+from ddex_workbench.errors import FileError
+from ddex_workbench.source import read_file
+from ddex_workbench.types import ValidationResult
+from ddex_workbench.utils import detect_ern_version, extract_message_id, validate_xml_structure
+from ddex_workbench.validator import DDEXValidator
+from tests import VALID_ERN_43_XML, MALFORMED_XML
+
+
+SENDER_XML = """<?xml version="1.0"?>
+<ern:NewReleaseMessage xmlns:ern="http://ddex.net/xml/ern/42" ReleaseProfileVersionId="CommonReleaseTypes/14/AudioAlbumMusicOnly">
+    <MessageHeader>
+        <MessageId>MSG_42</MessageId>
+        <MessageSender>
+            <PartyId>PADPIDA0000000001</PartyId>
+            <PartyName><FullName>Example Label</FullName></PartyName>
+        </MessageSender>
+        <MessageRecipient>
+            <PartyName><FullName>Example DSP</FullName></PartyName>
+        </MessageRecipient>
+    </MessageHeader>
+    <ResourceList>
+        <Video><ResourceReference>A1</ResourceReference></Video>
+    </ResourceList>
+</ern:NewReleaseMessage>"""
+
+
+class TestDDEXDocument:
+    """Test DDEXDocument class"""
+    
+    def test_metadata(self):
+        """Test metadata from a single walk"""
+        document = DDEXDocument(VALID_ERN_43_XML)
+        
+        assert document.metadata() == {
+            'version': '4.3',
+            'profile': 'AudioSingle',
+            'message_id': 'MSG_TEST_001',
+            'created_date': '2024-01-01T00:00:00Z',
+            'release_count': 1,
+            'sound_recording_count': 1,
+            'video_count': 0,
+            'total_resources': 1,
+            'deal_count': 1
+        }
+    
+    def test_header_and_profile_attribute(self):
+        """Test sender lookup and ReleaseProfileVersionId mapping"""
+        document = DDEXDocument(SENDER_XML.encode('utf-8'))
+        
+        assert document.version == '4.2'
+        assert document.profile == 'AudioAlbum'
+        assert document.sender == 'Example Label'
+        assert document.message_id == 'MSG_42'
+        assert document.collector.counts['video_count'] == 1
+    
+    def test_parses_once(self):
+        """Test all properties share one parse"""
+        document = DDEXDocument(VALID_ERN_43_XML)
+        with patch('ddex_workbench.document.ET.fromstring', wraps=ET.fromstring) as parse:
+            document.version
+            document.profile
+            document.metadata()
+            extract_message_id(document)
+            validate_xml_structure(document)
+        
+        assert parse.call_count == 1
+    
+    def test_malformed(self):
+        """Test malformed content"""
+        document = DDEXDocument(MALFORMED_XML)
+        
+        assert document.root is None
+        assert document.version is None
+        assert document.profile is None
+        assert 'parse_error' in document.metadata()
+        assert validate_xml_structure(document)[0] is False
+    
+    def test_utils_accept_document(self):
+        """Test utils helpers accept a document"""
+        document = DDEXDocument(VALID_ERN_43_XML)
+        
+        assert detect_ern_version(document) == '4.3'
+        assert extract_message_id(document) == 'MSG_TEST_001'
+        assert validate_xml_structure(document) == (True, None)
+    
+    def test_mapped_content(self, tmp_path):
+        """Test memory-mapped content is parsed without being decoded"""
+        path = tmp_path / "release.xml"
+        path.write_text(SENDER_XML, encoding='utf-8')
+        
+        with read_file(path, mmap_threshold=0) as source:
+            document = DDEXDocument(source.data)
+            assert document.version == '4.2'
+            assert document.message_id == 'MSG_42'
+            assert document._text is None
+        
+        assert source.data.closed
+    
+    def test_from_file_missing(self, tmp_path):
+        """Test reading a missing file"""
+        with pytest.raises(FileError):
+            DDEXDocument.from_file(tmp_path / "missing.xml")
+
+
+class TestValidatorWithDocument:
+    """Test DDEXValidator methods that accept a DDEXDocument"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.mock_client = Mock(spec=DDEXClient)
+        self.mock_client.validate.return_value = ValidationResult(
+            valid=True, errors=[], warnings=[], metadata={}
+        )
+        self.validator = DDEXValidator(self.mock_client)
+    
+    def test_validate_auto(self):
+        """Test validate_auto with a document"""
+        self.validator.validate_auto(DDEXDocument(VALID_ERN_43_XML))
+        
+        self.mock_client.validate.assert_called_once_with(
+            VALID_ERN_43_XML,
+            version="4.3",
+            profile="AudioSingle",
+            options=None
+        )
+    
+    def test_validate_file(self, tmp_path):
+        """Test validate_file with a document read from disk"""
+        filepath = tmp_path / "release.xml"
+        filepath.write_text(VALID_ERN_43_XML, encoding='utf-8')
+        document = DDEXDocument.from_file(filepath)
+        
+        result = self.validator.validate_file(document, document.version)
+        
+        assert result.metadata['file_name'] == "release.xml"
+        self.mock_client.validate.assert_called_once_with(VALID_ERN_43_XML, "4.3", None, None)
+    
+    def test_validate_file_hashes_file_bytes(self, tmp_path):
+        """Test hashes cover the file as stored, not the newline-normalised text"""
+        import hashlib
+        
+        raw = VALID_ERN_43_XML.replace("\n", "\r\n").encode('utf-8')
+        filepath = tmp_path / "release.xml"
+        filepath.write_bytes(raw)
+        document = DDEXDocument.from_file(filepath)
+        
+        result = self.validator.validate_file(document, "4.3", generate_hash=True)
+        
+        assert result.metadata['file_hash_sha256'] == hashlib.sha256(raw).hexdigest()
+        assert result.metadata['file_hash_md5'] == hashlib.md5(raw).hexdigest()
+    
+    def test_extract_metadata(self):
+        """Test extract_metadata matches the document"""
+        document = DDEXDocument(VALID_ERN_43_XML)
+        
+        assert self.validator.extract_metadata(document) == document.metadata()
+        assert self.validator.extract_metadata(VALID_ERN_43_XML) == document.metadata()
+
+
+class TestStreamMetadata:
+    """Test bounded-memory metadata extraction"""
+    
+    def test_matches_document(self, tmp_path):
+        """Test streaming gives the same dictionary as a full parse"""
+        for xml in (VALID_ERN_43_XML, SENDER_XML):
+            filepath = tmp_path / "release.xml"
+            filepath.write_text(xml, encoding='utf-8')
+            
+            assert stream_metadata(filepath) == DDEXDocument(xml).metadata()
+            with open(filepath, 'rb') as f:
+                assert stream_metadata(f) == DDEXDocument(xml).metadata()
+    
+    def test_validator_streams_paths(self, tmp_path):
+        """Test extract_metadata streams file paths"""
+        filepath = tmp_path / "release.xml"
+        filepath.write_text(VALID_ERN_43_XML, encoding='utf-8')
+        validator = DDEXValidator(Mock(spec=DDEXClient))
+        
+        with patch('ddex_workbench.validator.stream_metadata', wraps=stream_metadata) as streamed:
+            metadata = validator.extract_metadata(filepath)
+        
+        streamed.assert_called_once_with(filepath)
+        assert metadata['message_id'] == 'MSG_TEST_001'
+    
+    def test_bounded_memory(self):
+        """Test memory does not grow with the number of resources"""
+        count = 50000
+        
+        def generate():
+            yield b'<ern:NewReleaseMessage xmlns:ern="http://ddex.net/xml/ern/43"><ResourceList>'
+            for i in range(count):
+                yield b'<SoundRecording><ResourceReference>A%d</ResourceReference></SoundRecording>' % i
+            yield b'</ResourceList></ern:NewReleaseMessage>'
+        
+        class Stream:
+            def __init__(self):
+                self.chunks = generate()
+            
+            def read(self, size=-1):
+                return next(self.chunks, b'')
+        
+        tracemalloc.start()
+        try:
+            metadata = stream_metadata(Stream())
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        assert metadata['sound_recording_count'] == count
+        assert metadata['profile'] == 'AudioAlbum'
+        assert peak < 2 * 1024 * 1024
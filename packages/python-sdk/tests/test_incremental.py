@@ -0,0 +1,210 @@
+# packages/python-sdk/tests/test_incremental.py
+"""Tests for incremental parsing of /validate responses"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+import responses
+
+from ddex_workbench import DDEXClient
+from ddex_workbench import incremental
+from ddex_workbench.codec import StdlibCodec
+from ddex_workbench.errors import DDEXError
+from ddex_workbench.incremental import ErrorStreamParser
+from tests import VALID_ERN_43_XML
+
+
+def error(i):
+    return {"line": i + 1, "column": 5, "message": f"Error {i}", "severity": "error",
+            "rule": "ERN-001", "xpath": f"/NewReleaseMessage/ReleaseList/Release[{i}]"}
+
+
+def response_body(count):
+    return json.dumps({
+        "valid": False,
+        "errors": [error(i) for i in range(count)],
+        "warnings": [],
+        "svrl": None,
+        "metadata": {"errorCount": count}
+    }).encode()
+
+
+class TestErrorStreamParser:
+    """Test the push parser"""
+    
+    def test_errors_complete_as_chunks_arrive(self):
+        """Test errors are returned as soon as their JSON is complete"""
+        pytest.importorskip("ijson")
+        body = response_body(50)
+        parser = ErrorStreamParser(StdlibCodec())
+        
+        first = parser.feed(body[:len(body) // 2])
+        rest = parser.feed(body[len(body) // 2:]) + parser.close()
+        
+        assert parser.incremental is True
+        assert 0 < len(first) < 50
+        assert first + rest == [error(i) for i in range(50)]
+    
+    def test_buffered_without_ijson(self, monkeypatch):
+        """Test the fallback decodes the whole body at close()"""
+        monkeypatch.setattr(incremental, "ijson", None)
+        body = response_body(5)
+        parser = ErrorStreamParser(StdlibCodec())
+        
+        assert parser.feed(body[:100]) == []
+        assert parser.feed(body[100:]) == []
+        assert parser.incremental is False
+        assert parser.close() == [error(i) for i in range(5)]
+    
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    def test_invalid_json(self, monkeypatch, use_ijson):
+        """Test malformed or truncated bodies raise DDEXError"""
+        if use_ijson:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(incremental, "ijson", None)
+        parser = ErrorStreamParser(StdlibCodec())
+        
+        with pytest.raises(DDEXError):
+            parser.feed(b'{"errors": [{"line": 1}, ')
+            parser.close()
+
+
+class TestClientIterErrors:
+    """Test DDEXClient.iter_errors"""
+    
+    @responses.activate
+    def test_yields_errors(self):
+        """Test every error is yielded as a ValidationErrorDetail"""
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            body=response_body(3),
+            status=200,
+            content_type="application/json"
+        )
+        
+        client = DDEXClient()
+        errors = list(client.iter_errors(VALID_ERN_43_XML, "4.3"))
+        
+        assert [e.message for e in errors] == ["Error 0", "Error 1", "Error 2"]
+        assert errors[2].line == 3
+        assert errors[0].rule == "ERN-001"
+    
+    @responses.activate
+    def test_error_status_raises(self):
+        """Test HTTP errors surface before anything is yielded"""
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json={"error": {"message": "Version is required"}},
+            status=400
+        )
+        
+        client = DDEXClient(max_retries=0)
+        with pytest.raises(DDEXError):
+            next(client.iter_errors(VALID_ERN_43_XML, "4.3"))
+    
+    @responses.activate
+    def test_minified_positions(self):
+        """Test streamed errors are remapped like validate()'s"""
+        document = "<a>\n    <!-- note -->\n    <b/>\n</a>"
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json={"valid": False, "errors": [{"line": 3, "column": 1, "message": "b"}]},
+            status=200
+        )
+        
+        client = DDEXClient(minify=True)
+        (detail,) = client.iter_errors(document, "4.3")
+        
+        assert (detail.line, detail.column) == (3, 5)
+
+
+class TestAsyncIterErrors:
+    """Test AsyncDDEXClient.iter_errors"""
+    
+    @pytest.mark.asyncio
+    async def test_yields_until_max_errors(self):
+        """Test async iteration yields errors and honours max_errors"""
+        httpx = pytest.importorskip("httpx")
+        from ddex_workbench import AsyncDDEXClient
+        
+        def handler(request):
+            return httpx.Response(200, content=response_body(100))
+        
+        async with AsyncDDEXClient(transport=httpx.MockTransport(handler)) as client:
+            errors = [e async for e in client.iter_errors(VALID_ERN_43_XML, "4.3", max_errors=7)]
+        
+        assert [e.line for e in errors] == list(range(1, 8))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Streams a huge error response in batches, noting whether it finished"""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        
+        def write(data):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        
+        try:
+            write(b'{"valid":false,"errors":[')
+            for batch in range(self.server.batches):
+                items = ",".join(json.dumps(error(batch * 1000 + i)) for i in range(1000))
+                write((items if batch == 0 else "," + items).encode())
+                self.server.sent += 1
+            write(b'],"warnings":[],"metadata":{}}')
+            self.wfile.write(b"0\r\n\r\n")
+            self.server.completed = True
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.server.done.set()
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, batches):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.batches = batches
+        self.sent = 0
+        self.completed = False
+        self.done = threading.Event()
+
+
+class TestStopReading:
+    """Test the response is abandoned once max_errors is reached"""
+    
+    def test_max_errors_stops_download(self):
+        """Test a 300k-error response is not read past the first errors"""
+        pytest.importorskip("ijson")
+        server = _Server(batches=300)
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        try:
+            client = DDEXClient(base_url=f"http://127.0.0.1:{server.server_address[1]}/",
+                                max_retries=0)
+            errors = list(client.iter_errors(VALID_ERN_43_XML, "4.3", max_errors=10))
+            server.done.wait(5)
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert [e.message for e in errors] == [f"Error {i}" for i in range(10)]
+        assert server.completed is False
+        assert server.sent < 300
@@ -0,0 +1,159 @@
+# packages/python-sdk/tests/test_journal.py
+"""Tests for the checkpoint journal and resumable batches"""
+
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from ddex_workbench import CheckpointJournal, DDEXValidator, ValidationResult
+from ddex_workbench.types import PassedRule, ValidationError as ValidationErrorDetail
+from tests import VALID_ERN_43_XML, INVALID_XML
+
+
+def make_result(valid=True):
+    errors = [] if valid else [ValidationErrorDetail(line=3, column=1, message="Missing", rule="R1")]
+    return ValidationResult(valid=valid, errors=errors, warnings=[], metadata={"processingTime": 5})
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Ten small files, every third one invalid"""
+    files = []
+    for i in range(10):
+        path = tmp_path / f"file{i}.xml"
+        path.write_text(INVALID_XML if i % 3 == 0 else VALID_ERN_43_XML)
+        files.append(path)
+    return files
+
+
+class TestCheckpointJournal:
+    """Test CheckpointJournal storage"""
+    
+    def test_round_trip(self, tmp_path, catalog):
+        """Test a recorded result is returned after reopening"""
+        result = make_result(valid=False)
+        result.passed_rules = [PassedRule(rule="R2", test="x")]
+        
+        with CheckpointJournal(tmp_path / "run.db") as journal:
+            key = journal.key(catalog[0], "4.3")
+            journal.record(key, catalog[0], result)
+        
+        with CheckpointJournal(tmp_path / "run.db") as journal:
+            stored = journal.get(key)
+            assert journal.get(journal.key(catalog[0], "4.2")) is None
+        
+        assert stored.valid is False
+        assert stored.errors[0].rule == "R1"
+        assert stored.passed_rules[0].rule == "R2"
+        assert stored.metadata["resumed"] is True
+    
+    def test_wal_mode(self, tmp_path):
+        """Test the database runs in WAL mode"""
+        with CheckpointJournal(tmp_path / "run.db") as journal:
+            mode = journal._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        assert mode == "wal"
+    
+    def test_stat_key_changes_with_file(self, tmp_path, catalog):
+        """Test modified files get a new key in stat mode"""
+        with CheckpointJournal(tmp_path / "run.db") as journal:
+            before = journal.key(catalog[1], "4.3")
+            stat = catalog[1].stat()
+            os.utime(catalog[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            
+            assert journal.key(catalog[1], "4.3") != before
+    
+    def test_hash_key_follows_content(self, tmp_path, catalog):
+        """Test hash keys identify content regardless of path"""
+        with CheckpointJournal(tmp_path / "run.db", key="hash") as journal:
+            assert journal.key(catalog[1], "4.3") == journal.key(catalog[2], "4.3")
+            assert journal.key(catalog[0], "4.3") != journal.key(catalog[1], "4.3")
+    
+    def test_record_after_close(self, tmp_path, catalog):
+        """Test recording to a closed journal raises instead of queueing forever"""
+        journal = CheckpointJournal(tmp_path / "run.db")
+        journal.close()
+        
+        with pytest.raises(ValueError):
+            journal.record("key", catalog[0], make_result())
+        journal.flush()
+        journal.close()
+    
+    def test_concurrent_records(self, tmp_path, catalog):
+        """Test records from many threads are all committed"""
+        with CheckpointJournal(tmp_path / "run.db") as journal:
+            def worker(n):
+                for i in range(50):
+                    journal.record(f"key-{n}-{i}", catalog[0], make_result())
+            
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            assert journal.stats() == {"total": 400, "valid": 400, "invalid": 0}
+
+
+class TestResumableBatch:
+    """Test validate_batch with a journal"""
+    
+    def test_rerun_skips_completed(self, tmp_path, catalog):
+        """Test a rerun only validates files missing from the journal"""
+        client = Mock()
+        client.validate.side_effect = lambda content, *args: make_result(b"MessageId" in content)
+        validator = DDEXValidator(client)
+        
+        # First run dies after four results
+        with CheckpointJournal(tmp_path / "run.db") as journal:
+            stream = validator.iter_validate(catalog, "4.3", max_workers=1, window=1, journal=journal)
+            first = [next(stream) for _ in range(4)]
+            stream.close()
+        assert client.validate.call_count <= 5
+        
+        client.validate.reset_mock()
+        with CheckpointJournal(tmp_path / "run.db") as journal:
+            batch = validator.validate_batch(catalog, "4.3", journal=journal)
+        
+        resumed = [r for r in batch.results if r.metadata.get("resumed")]
+        assert len(resumed) == len(first)
+        assert client.validate.call_count == 10 - len(first)
+        assert batch.total_files == 10
+        assert batch.invalid_files == 4
+    
+    def test_file_errors_not_journaled(self, tmp_path, catalog):
+        """Test files that could not be validated are retried"""
+        client = Mock()
+        client.validate.return_value = make_result()
+        validator = DDEXValidator(client)
+        files = catalog[:2] + [tmp_path / "missing.xml"]
+        
+        with CheckpointJournal(tmp_path / "run.db") as journal:
+            validator.validate_batch(files, "4.3", journal=journal)
+            
+            assert len(journal) == 2
+    
+    def test_hash_keys_from_uploaded_bytes(self, tmp_path, catalog):
+        """Test hash-mode workers key files from the bytes they upload"""
+        client = Mock()
+        client.validate.side_effect = lambda content, *args: make_result(b"MessageId" in content)
+        validator = DDEXValidator(client)
+        for i, path in enumerate(catalog):
+            # Distinct content, so no two files share a key
+            path.write_text(path.read_text() + f"<!-- {i} -->")
+        
+        for _ in range(2):
+            with CheckpointJournal(tmp_path / "run.db", key="hash") as journal:
+                # The submitting thread never reads files itself
+                journal.key = Mock(side_effect=AssertionError)
+                batch = validator.validate_batch(catalog, "4.3", max_workers=3, journal=journal)
+        
+        with CheckpointJournal(tmp_path / "run.db", key="hash") as journal:
+            stored = journal.get(journal.key(catalog[1], "4.3"))
+        
+        assert client.validate.call_count == 10
+        assert all(r.metadata.get("resumed") for r in batch.results)
+        assert batch.invalid_files == 4
+        assert stored.metadata["file"] == str(catalog[1])
@@ -0,0 +1,164 @@
+# packages/python-sdk/tests/test_lazy.py
+"""Tests for lazily decoded validation results"""
+
+import copy
+import dataclasses
+import json
+import pickle
+from unittest.mock import Mock
+
+import responses
+
+from ddex_workbench import DDEXClient, LazySequence, LazyValidationResult, ValidationResult
+from ddex_workbench.journal import result_from_dict, result_to_dict
+from ddex_workbench.types import PassedRule, ValidationError as ValidationErrorDetail
+from tests import VALID_ERN_43_XML
+
+
+def make_response(errors=3, passed=100):
+    return {
+        "valid": errors == 0,
+        "errors": [
+            {"line": i, "column": 1, "message": f"Error {i}", "severity": "error", "rule": "ERN-001"}
+            for i in range(errors)
+        ],
+        "warnings": [{"line": 1, "column": 2, "message": "Check", "rule": "W-1"}],
+        "passedRules": [{"rule": f"R{i}", "test": "true()"} for i in range(passed)],
+        "summary": {"total_rules": passed + errors, "passed_rules": passed,
+                    "failed_rules": errors, "pass_rate": 0.9},
+        "metadata": {"processingTime": 7}
+    }
+
+
+def make_result(response):
+    return LazyValidationResult(response, DDEXClient._parse_error, DDEXClient._parse_warning)
+
+
+class TestLazySequence:
+    """Test LazySequence view"""
+    
+    def test_decodes_on_access(self):
+        """Test entries are decoded once, on first read"""
+        decode = Mock(side_effect=lambda raw: raw * 10)
+        view = LazySequence([1, 2, 3], decode)
+        
+        assert len(view) == 3
+        assert decode.call_count == 0
+        assert view[1] == 20
+        assert view[1] == 20
+        assert view[-1] == 30
+        assert decode.call_count == 2
+        assert view.decoded == 2
+    
+    def test_list_operations(self):
+        """Test slicing, mutation and comparison behave like a list"""
+        view = LazySequence([1, 2, 3], lambda raw: raw * 10)
+        
+        assert view[:2] == [10, 20]
+        view.append(99)
+        view.extend([100])
+        view[0] = 5
+        del view[1]
+        
+        assert list(view) == [5, 30, 99, 100]
+        assert view == [5, 30, 99, 100]
+        assert view + [1] == [5, 30, 99, 100, 1]
+        assert 30 in view
+        assert copy.copy(view) == [5, 30, 99, 100]
+        assert type(pickle.loads(pickle.dumps(view))) is list
+    
+    
+    def test_is_a_list(self):
+        """Test the view is a real list and compares decoded entries"""
+        view = LazySequence([1, 2, 3], lambda raw: raw * 10)
+        other = LazySequence([1, 2, 3], lambda raw: raw * 10)
+        
+        assert isinstance(view, list)
+        assert view == other
+        assert [0] + view == [0, 10, 20, 30]
+        assert view + other == [10, 20, 30] * 2
+        assert type(view.copy()) is list
+
+
+class TestLazyValidationResult:
+    """Test LazyValidationResult"""
+    
+    def test_verdict_without_decoding(self):
+        """Test valid, metadata and summary do not decode entries"""
+        result = make_result(make_response())
+        
+        assert result.valid is False
+        assert result.metadata["processingTime"] == 7
+        assert result.summary.passed_rules == 100
+        assert result._errors is None
+        assert result._passed_rules is None
+    
+    def test_entries_decoded_on_access(self):
+        """Test errors, warnings and passed rules decode into SDK types"""
+        result = make_result(make_response())
+        
+        assert isinstance(result, ValidationResult)
+        assert isinstance(result.errors[0], ValidationErrorDetail)
+        assert result.errors.decoded == 1
+        assert result.errors[2].message == "Error 2"
+        assert result.warnings[0].rule == "W-1"
+        assert len(result.passed_rules) == 100
+        assert result.passed_rules.decoded == 0
+        assert result.passed_rules[5] == PassedRule(rule="R5", test="true()")
+    
+    def test_missing_passed_rules(self):
+        """Test passed_rules stays None when the response has none"""
+        response = make_response()
+        del response["passedRules"]
+        
+        assert make_result(response).passed_rules is None
+    
+    def test_materialize_and_pickle(self):
+        """Test materialized copies are plain ValidationResults"""
+        result = make_result(make_response())
+        result.errors.append(ValidationErrorDetail(line=9, column=9, message="Local"))
+        
+        plain = result.materialize()
+        restored = pickle.loads(pickle.dumps(result))
+        
+        assert type(plain) is ValidationResult
+        assert isinstance(plain.errors, list)
+        assert len(plain.errors) == 4
+        assert type(restored) is ValidationResult
+        assert restored == plain
+    
+    def test_asdict_serializes(self):
+        """Test dataclasses.asdict sees decoded entries, as for a plain result"""
+        result = make_result(make_response(passed=2))
+        
+        data = dataclasses.asdict(result)
+        
+        assert isinstance(result.errors, list)
+        assert data["errors"][1]["message"] == "Error 1"
+        assert data["passed_rules"][0]["rule"] == "R0"
+        assert json.loads(json.dumps(data)) == dataclasses.asdict(result.materialize())
+    
+    def test_journal_round_trip(self):
+        """Test lazy results serialise like plain ones"""
+        result = make_result(make_response(passed=2))
+        
+        data = result_to_dict(result)
+        
+        assert data["errors"][0]["message"] == "Error 0"
+        assert result_from_dict(data) == result.materialize()
+    
+    @responses.activate
+    def test_client_returns_lazy_result(self):
+        """Test validate() returns a lazy result"""
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json=make_response(),
+            status=200
+        )
+        
+        result = DDEXClient().validate(VALID_ERN_43_XML, version="4.3")
+        
+        assert isinstance(result, LazyValidationResult)
+        assert result.valid is False
+        assert len(result.errors) == 3
@@ -0,0 +1,144 @@
+# packages/python-sdk/tests/test_local.py
+"""Tests for local-first (hybrid) validation"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from ddex_workbench import DDEXClient, LocalValidator
+from ddex_workbench.errors import ConfigurationError
+from ddex_workbench.source import read_file
+from tests import VALID_ERN_43_XML, INVALID_XML
+
+
+VALIDATE_URL = "https://api.ddex-workbench.org/validate"
+ERN_382_XML = VALID_ERN_43_XML.replace("ern/43", "ern/382")
+
+
+class TestLocalValidator:
+    """Test LocalValidator class"""
+    
+    def test_engines_recorded(self):
+        """Test each issue records the engine that produced it"""
+        result = LocalValidator(xsd=False).validate(INVALID_XML, "4.3")
+        
+        assert result.valid is False
+        assert result.metadata['engines'] == ["structural"]
+        assert {e.engine for e in result.errors} == {"structural"}
+    
+    def test_xsd_optional(self, monkeypatch):
+        """Test XSD is skipped when unavailable unless required"""
+        monkeypatch.delenv("DDEX_SCHEMA_DIR", raising=False)
+        
+        assert LocalValidator().validate(VALID_ERN_43_XML, "4.3").valid is True
+        with pytest.raises(ConfigurationError):
+            LocalValidator(xsd=True).validate(VALID_ERN_43_XML, "4.3")
+
+
+class TestLocalFirstClient:
+    """Test DDEXClient with local_first enabled"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.client = DDEXClient(local_first=LocalValidator(xsd=False))
+    
+    @responses.activate
+    def test_local_rejection_skips_api(self):
+        """Test documents failing locally are not sent"""
+        result = self.client.validate(INVALID_XML, "4.3")
+        
+        assert len(responses.calls) == 0
+        assert result.valid is False
+        assert result.metadata['remote_skipped'] is True
+        assert [e.rule for e in result.errors][:2] == ["ERN43-MessageHeader", "ERN43-ReleaseList"]
+    
+    @responses.activate
+    def test_force_remote(self):
+        """Test force_remote sends failing documents anyway"""
+        responses.add(responses.POST, VALIDATE_URL, json={
+            "valid": False,
+            "errors": [{"line": 0, "column": 0, "message": "DealList is required in ERN 4.3",
+                        "rule": "ERN43-DealList"}],
+            "warnings": []
+        })
+        
+        result = self.client.validate(INVALID_XML, "4.3", force_remote=True)
+        
+        assert len(responses.calls) == 1
+        rules = [(e.rule, e.engine) for e in result.errors]
+        # Reported by both: kept once, attributed to the API
+        assert rules.count(("ERN43-DealList", "api")) == 1
+        assert ("ERN43-DealList", "structural") not in rules
+        assert ("ERN43-ReleaseList", "structural") in rules
+    
+    @responses.activate
+    def test_passing_document_goes_remote(self):
+        """Test documents passing locally get the full API validation"""
+        responses.add(responses.POST, VALIDATE_URL, json={
+            "valid": False,
+            "errors": [
+                {"line": 7, "column": 3, "message": "ISRC missing", "rule": "SCH-AudioAlbum-001"},
+                {"line": 0, "column": 0, "severity": "warning", "rule": "ERN382-UpdateIndicator",
+                 "message": "UpdateIndicator is recommended but not required in ERN 3.8.2"}
+            ],
+            "warnings": []
+        })
+        
+        result = self.client.validate(ERN_382_XML, "3.8.2")
+        
+        assert len(responses.calls) == 1
+        assert json.loads(responses.calls[0].request.body)["version"] == "3.8.2"
+        assert result.metadata['engines'] == ["structural", "api"]
+        assert [e.engine for e in result.errors] == ["api", "api"]
+        # The local UpdateIndicator warning duplicates the server's entry
+        assert result.warnings == []
+    
+    def test_mapped_file_checked_in_place(self, tmp_path):
+        """Test a memory-mapped upload reaches the local checks without a copy"""
+        path = tmp_path / "invalid.xml"
+        path.write_text(INVALID_XML, encoding="utf-8")
+        
+        with read_file(path, mmap_threshold=0) as source:
+            with patch.object(self.client.local_validator, "validate",
+                              wraps=self.client.local_validator.validate) as local:
+                result = self.client.validate(source.data, "4.3")
+            checked = local.call_args[0][0]
+        
+        assert checked is source.data
+        assert result.metadata['remote_skipped'] is True
+    
+    @responses.activate
+    def test_cache_hit_skips_local_checks(self):
+        """Test cached results are returned without parsing the document"""
+        responses.add(responses.POST, VALIDATE_URL, json={"valid": True, "errors": [], "warnings": []})
+        client = DDEXClient(local_first=LocalValidator(xsd=False), cache=True)
+        
+        client.validate(VALID_ERN_43_XML, "4.3")
+        with patch.object(client.local_validator, "validate") as local:
+            result = client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert local.call_count == 0
+        assert result.metadata["cached"] is True
+        assert len(responses.calls) == 1
+    
+    @responses.activate
+    def test_merge_does_not_decode_remote_entries(self):
+        """Test remote errors are attributed to the API as they are decoded"""
+        responses.add(responses.POST, VALIDATE_URL, json={
+            "valid": False,
+            "errors": [{"line": i, "column": 1, "message": f"E{i}", "rule": "SCH"} for i in range(50)],
+            "warnings": []
+        })
+        
+        result = self.client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert result.errors.decoded == 0
+        assert result.errors[10].engine == "api"
+        assert result.errors.decoded == 1
+    
+    def test_config(self):
+        """Test local_first is reported in the config"""
+        assert self.client.get_config()["local_first"] is True
+        assert DDEXClient().get_config()["local_first"] is False
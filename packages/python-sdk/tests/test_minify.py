@@ -0,0 +1,158 @@
+# packages/python-sdk/tests/test_minify.py
+"""Tests for minified uploads and position remapping"""
+
+import json
+import time
+
+import responses
+
+from ddex_workbench import DDEXClient, MinifiedDocument
+from ddex_workbench.minify import minify
+from tests import VALID_ERN_43_XML
+
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- Generated by a release tool -->
+<Release>
+    <!-- multi-line
+         comment -->
+    <Title>  </Title>
+    <Note><![CDATA[ keep  me ]]>  </Note>
+    <Artist>Name <!-- inline --> Here</Artist>   <Empty/>
+</Release>
+"""
+
+
+def assert_maps_back(document: MinifiedDocument, original: str):
+    """Every character of the minified text maps to the same character"""
+    source_lines = original.split("\n")
+    for line, text in enumerate(document.content.split("\n"), 1):
+        for column, char in enumerate(text, 1):
+            orig_line, orig_column = document.to_original(line, column)
+            assert source_lines[orig_line - 1][orig_column - 1] == char
+
+
+class TestMinifiedDocument:
+    """Test minification and the offset map"""
+    
+    def test_strips_comments_and_indentation(self):
+        """Test comments and inter-element whitespace are removed"""
+        document = MinifiedDocument(DOCUMENT)
+        
+        assert "<!--" not in document.content
+        assert "\n<Release>\n" in document.content
+        assert "<Artist>Name  Here</Artist><Empty/>" in document.content
+        assert document.size < document.original_size
+        assert document.saved == document.original_size - document.size
+    
+    def test_keeps_line_structure(self):
+        """Test line N of the upload is line N of the original"""
+        document = MinifiedDocument(VALID_ERN_43_XML)
+        
+        assert document.content.count("\n") == VALID_ERN_43_XML.count("\n")
+        assert document.size < document.original_size
+    
+    def test_keeps_significant_whitespace(self):
+        """Test whitespace-only element content and CDATA survive"""
+        document = MinifiedDocument(DOCUMENT)
+        
+        assert "<Title>  </Title>" in document.content
+        assert "<Note><![CDATA[ keep  me ]]>  </Note>" in document.content
+    
+    def test_preserve_keeps_whitespace(self):
+        """Test xml:space="preserve" disables whitespace stripping"""
+        xml = '<a xml:space="preserve">\n  <b/> <!-- c -->\n</a>'
+        
+        assert minify(xml) == '<a xml:space="preserve">\n  <b/> \n</a>'
+    
+    def test_columns_map_back(self):
+        """Test every minified position maps to the original character"""
+        assert_maps_back(MinifiedDocument(DOCUMENT), DOCUMENT)
+        assert_maps_back(MinifiedDocument(VALID_ERN_43_XML), VALID_ERN_43_XML)
+    
+    def test_unknown_positions_unchanged(self):
+        """Test missing line/column values pass through"""
+        document = MinifiedDocument(DOCUMENT)
+        
+        assert document.to_original(0, 0) == (0, 0)
+        assert document.to_original(6, 0) == (6, 0)
+    
+    def test_bytes_input(self):
+        """Test UTF-8 bytes are accepted"""
+        document = MinifiedDocument(DOCUMENT.encode("utf-8"))
+        
+        assert document.content == minify(DOCUMENT)
+    
+    def test_unterminated_markup_left_as_is(self):
+        """Test unterminated tags fall back to the original content in linear time"""
+        for tail in ('<c y="oops', '<!-- never closed', '<![CDATA[ open', '<' * 50000, '<a x="' * 20000):
+            content = DOCUMENT + tail
+            start = time.perf_counter()
+            document = MinifiedDocument(content)
+            
+            assert document.content == content
+            assert document.saved == 0
+            assert document.to_original(4, 7) == (4, 7)
+            assert time.perf_counter() - start < 1.0
+
+
+class TestClientMinify:
+    """Test minified uploads through DDEXClient.validate"""
+    
+    @responses.activate
+    def test_upload_minified_and_positions_remapped(self):
+        """Test the upload is smaller and reported columns are remapped"""
+        document = MinifiedDocument(DOCUMENT)
+        artist_line = 8
+        upload_column = document.content.split("\n")[artist_line - 1].index("<Empty/>") + 1
+        original_column = DOCUMENT.split("\n")[artist_line - 1].index("<Empty/>") + 1
+        
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json={
+                "valid": False,
+                "errors": [
+                    {"line": artist_line, "column": upload_column, "message": "Unexpected Empty",
+                     "severity": "error"},
+                    {"line": 0, "column": 0, "message": "Missing MessageHeader", "severity": "error"}
+                ],
+                "warnings": [
+                    {"line": artist_line, "column": upload_column, "message": "Deprecated"}
+                ],
+                "metadata": {"processingTime": 10}
+            },
+            status=200
+        )
+        
+        client = DDEXClient(minify=True)
+        result = client.validate(DOCUMENT, version="4.3")
+        
+        sent = json.loads(responses.calls[0].request.body)
+        assert sent["content"] == document.content
+        assert len(responses.calls[0].request.body) < len(json.dumps({"content": DOCUMENT}))
+        
+        assert upload_column != original_column
+        assert (result.errors[0].line, result.errors[0].column) == (artist_line, original_column)
+        assert (result.errors[1].line, result.errors[1].column) == (0, 0)
+        assert result.warnings[0].column == original_column
+        assert result.metadata["minified"] == {
+            "originalSize": document.original_size,
+            "uploadSize": document.size
+        }
+    
+    @responses.activate
+    def test_per_call_override(self):
+        """Test validate(minify=False) sends the content unchanged"""
+        responses.add(
+            responses.POST,
+            "https://api.ddex-workbench.org/validate",
+            json={"valid": True, "errors": [], "warnings": [], "metadata": {}},
+            status=200
+        )
+        
+        client = DDEXClient(minify=True)
+        assert client.get_config()["minify"] is True
+        client.validate(DOCUMENT, version="4.3", minify=False)
+        
+        assert json.loads(responses.calls[0].request.body)["content"] == DOCUMENT
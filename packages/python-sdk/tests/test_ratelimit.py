@@ -0,0 +1,170 @@
+# packages/python-sdk/tests/test_ratelimit.py
+"""Tests for client-side rate limiting"""
+
+import threading
+
+import pytest
+import responses
+
+from ddex_workbench import DDEXClient
+from ddex_workbench.errors import RateLimitError
+from ddex_workbench.ratelimit import RateLimiter, parse_retry_after
+from tests import VALID_ERN_43_XML
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep() advances time"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Test RateLimiter token bucket"""
+    
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(limit=10, window=60, clock=self.clock, sleep=self.clock.sleep)
+    
+    def test_burst_then_paced(self):
+        """Test a full bucket allows a burst, then one request per interval"""
+        waits = [self.limiter.reserve() for _ in range(12)]
+        
+        assert waits[:10] == [0.0] * 10
+        assert waits[10] == pytest.approx(6.0)
+        assert waits[11] == pytest.approx(12.0)
+    
+    def test_acquire_sleeps(self):
+        """Test acquire blocks for the reserved wait"""
+        for _ in range(10):
+            self.limiter.acquire()
+        self.limiter.acquire()
+        
+        assert self.clock.sleeps == [pytest.approx(6.0)]
+    
+    def test_refill(self):
+        """Test tokens refill over time up to the limit"""
+        for _ in range(10):
+            self.limiter.reserve()
+        self.clock.now += 30
+        assert self.limiter.available == pytest.approx(5.0)
+        self.clock.now += 600
+        assert self.limiter.available == pytest.approx(10.0)
+    
+    def test_update_from_headers(self):
+        """Test the bucket is re-seeded from server headers"""
+        self.limiter.update_from_headers({
+            "X-RateLimit-Limit": "60",
+            "X-RateLimit-Remaining": "2"
+        })
+        
+        assert self.limiter.limit == 60
+        assert self.limiter.available == pytest.approx(2.0)
+        
+        self.limiter.update_from_headers({
+            "RateLimit-Policy": "30;w=60",
+            "RateLimit-Limit": "30",
+            "RateLimit-Remaining": "0",
+            "RateLimit-Reset": "15"
+        })
+        assert self.limiter.limit == 30
+        assert self.limiter.reserve() == pytest.approx(15.0)
+    
+    def test_pause(self):
+        """Test Retry-After style pauses block new reservations"""
+        self.limiter.pause(20)
+        assert self.limiter.reserve() == pytest.approx(20.0)
+    
+    def test_thread_safety(self):
+        """Test concurrent reservations never hand out the same slot"""
+        limiter = RateLimiter(limit=100, window=60)
+        waits = []
+        lock = threading.Lock()
+        
+        def worker():
+            for _ in range(50):
+                wait = limiter.reserve()
+                with lock:
+                    waits.append(wait)
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        # 100 immediate tokens, the other 300 queued at 0.6s spacing
+        assert sum(1 for w in waits if w == 0) == 100
+        assert max(waits) == pytest.approx(300 * 0.6, rel=0.01)
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing"""
+        assert parse_retry_after("30") == 30.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("garbage") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestClientRateLimiting:
+    """Test DDEXClient integration with RateLimiter"""
+    
+    def test_default_budget_follows_api_key(self):
+        """Test the built-in limiter uses the 10/60 req/min budgets"""
+        client = DDEXClient(rate_limit=True)
+        assert client.rate_limiter.limit == 10
+        
+        client.set_api_key("test_key")
+        assert client.rate_limiter.limit == 60
+        assert client.get_config()["rate_limit"] == 60
+        
+        assert DDEXClient().rate_limiter is None
+    
+    def test_shared_limiter(self):
+        """Test a limiter instance can be shared between clients"""
+        limiter = RateLimiter(limit=5)
+        assert DDEXClient(rate_limit=limiter).rate_limiter is limiter
+        assert DDEXClient(rate_limit=limiter).rate_limiter is limiter
+    
+    @responses.activate
+    def test_429_paced_by_limiter(self):
+        """Test a 429 pauses the limiter for Retry-After and is retried"""
+        headers = {"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "0", "Retry-After": "7"}
+        responses.add(responses.POST, "https://api.ddex-workbench.org/validate",
+                      json={}, status=429, headers=headers)
+        responses.add(responses.POST, "https://api.ddex-workbench.org/validate",
+                      json={"valid": True, "errors": [], "warnings": []},
+                      headers={"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "59"})
+        
+        clock = FakeClock()
+        limiter = RateLimiter(limit=10, clock=clock, sleep=clock.sleep)
+        client = DDEXClient(rate_limit=limiter)
+        result = client.validate(VALID_ERN_43_XML, version="4.3")
+        
+        assert result.valid is True
+        assert len(responses.calls) == 2
+        assert clock.sleeps == [pytest.approx(7.0)]
+        assert limiter.limit == 60
+    
+    @responses.activate
+    def test_429_raised_after_retries(self):
+        """Test RateLimitError still surfaces once retries are exhausted"""
+        responses.add(responses.POST, "https://api.ddex-workbench.org/validate",
+                      json={}, status=429, headers={"Retry-After": "1"})
+        
+        clock = FakeClock()
+        limiter = RateLimiter(limit=10, clock=clock, sleep=clock.sleep)
+        client = DDEXClient(rate_limit=limiter, max_retries=2)
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            client.validate(VALID_ERN_43_XML, version="4.3")
+        
+        assert exc_info.value.retry_after == 1
+        assert len(responses.calls) == 3
@@ -0,0 +1,148 @@
+# packages/python-sdk/tests/test_schematron.py
+"""Tests for local Schematron-style rule validation"""
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from ddex_workbench import DDEXDocument, SchematronValidator, ValidationOptions
+from ddex_workbench.errors import UnsupportedVersionError
+from ddex_workbench.schematron import load_rules
+from tests import VALID_ERN_43_XML, INVALID_XML, MALFORMED_XML
+
+
+BAD_RECORDINGS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<ern:NewReleaseMessage xmlns:ern="http://ddex.net/xml/ern/43" ReleaseProfileVersionId="Video">
+    <MessageHeader>
+        <MessageId>MSG_TEST_002</MessageId>
+        <MessageCreatedDateTime>2024-01-01T00:00:00Z</MessageCreatedDateTime>
+    </MessageHeader>
+    <ResourceList>
+        <SoundRecording>
+            <ResourceReference>A1</ResourceReference>
+            <ResourceId><ISRC>US-RC1-76-07839</ISRC></ResourceId>
+        </SoundRecording>
+        <SoundRecording>
+            <ResourceReference>A2</ResourceReference>
+            <ResourceId><ISRC>BAD</ISRC></ResourceId>
+        </SoundRecording>
+    </ResourceList>
+    <ReleaseList>
+        <Release>
+            <ReleaseReference>R0</ReleaseReference>
+        </Release>
+    </ReleaseList>
+    <DealList>
+        <ReleaseDeal>
+            <DealReleaseReference>R9</DealReleaseReference>
+        </ReleaseDeal>
+    </DealList>
+</ern:NewReleaseMessage>"""
+
+
+class TestSchematronValidator:
+    """Test SchematronValidator class"""
+    
+    def test_valid(self):
+        """Test a message with no failed assertions"""
+        result = SchematronValidator("4.3").validate(VALID_ERN_43_XML, "AudioAlbum")
+        
+        assert result.valid is True
+        assert result.metadata['engine'] == 'schematron'
+        assert "Schematron-MessageSender" in {w.rule for w in result.warnings}
+    
+    def test_failures_have_location(self):
+        """Test failed assertions report rule ID, line and xpath"""
+        errors = [
+            e for e in SchematronValidator("4.3").check(BAD_RECORDINGS_XML)[0]
+            if e.severity == 'error'
+        ]
+        
+        assert [(e.rule, e.line) for e in errors] == [
+            ("Schematron-ISRC-Format", 10),
+            ("Schematron-ISRC-Format", 14),
+            ("Schematron-DealReleaseReference-Integrity", 24),
+        ]
+        assert errors[1].xpath == "/ern:NewReleaseMessage/ResourceList/SoundRecording[2]/ResourceId/ISRC"
+        assert {e.engine for e in errors} == {"schematron"}
+    
+    def test_max_errors_stops_early(self):
+        """Test evaluation stops once max_errors errors were found"""
+        result = SchematronValidator("4.3").validate(
+            BAD_RECORDINGS_XML, options=ValidationOptions(max_errors=1, include_passed_rules=True)
+        )
+        
+        assert [e.line for e in result.errors] == [10]
+        assert result.passed_rules == []
+    
+    def test_passed_rules(self):
+        """Test passed rules are returned when requested"""
+        result = SchematronValidator("4.3").validate(
+            DDEXDocument(VALID_ERN_43_XML), "AudioAlbum",
+            ValidationOptions(include_passed_rules=True)
+        )
+        passed = {rule.rule for rule in result.passed_rules}
+        
+        assert "Schematron-AudioAlbum-SoundRecording" in passed
+        assert "Schematron-DealReleaseReference-Integrity" in passed
+        assert "Schematron-ReleaseType" not in passed
+        assert result.summary.passed_rules == len(result.passed_rules)
+        assert result.summary.failed_rules == 4
+    
+    def test_passed_rules_not_requested(self):
+        """Test passed rules are omitted by default"""
+        assert SchematronValidator("4.3").validate(VALID_ERN_43_XML).passed_rules is None
+    
+    def test_profile_rules_and_mismatch(self):
+        """Test profile rules are added and a declared profile is compared"""
+        result = SchematronValidator("4.3").validate(BAD_RECORDINGS_XML, "AudioSingle")
+        
+        assert "Schematron-ProfileMismatch" in {w.rule for w in result.warnings}
+        assert "Schematron-Video-Resource" not in {e.rule for e in result.errors}
+        
+        result = SchematronValidator("4.3").validate(BAD_RECORDINGS_XML, "Video")
+        assert "Schematron-ProfileMismatch" not in {w.rule for w in result.warnings}
+        assert "Schematron-Video-Resource" in {e.rule for e in result.errors}
+    
+    def test_default_namespace(self):
+        """Test a default-namespace message gets the same issues as its prefixed form"""
+        default_ns = (VALID_ERN_43_XML
+                      .replace('<ern:NewReleaseMessage xmlns:ern=', '<NewReleaseMessage xmlns=')
+                      .replace('</ern:NewReleaseMessage>', '</NewReleaseMessage>'))
+        validator = SchematronValidator("4.3")
+        
+        prefixed = validator.validate(VALID_ERN_43_XML, "AudioAlbum")
+        result = validator.validate(default_ns, "AudioAlbum")
+        
+        assert 'xmlns="http://ddex.net/xml/ern/43"' in default_ns
+        assert result.valid is True
+        assert [(e.rule, e.line) for e in result.errors] == [(e.rule, e.line) for e in prefixed.errors]
+        assert [w.rule for w in result.warnings] == [w.rule for w in prefixed.warnings]
+    
+    def test_missing_header_fields(self):
+        """Test header assertions on an incomplete message"""
+        rules = {e.rule for e in SchematronValidator("4.3").validate(INVALID_XML).errors}
+        
+        assert rules == {"Schematron-MessageId", "Schematron-MessageCreatedDateTime"}
+    
+    def test_malformed(self):
+        """Test malformed XML is reported instead of raising"""
+        result = SchematronValidator("4.3").validate(MALFORMED_XML)
+        
+        assert result.valid is False
+        assert result.errors[0].rule == "XML Well-formedness"
+    
+    def test_unsupported_version(self):
+        """Test unknown versions are rejected"""
+        with pytest.raises(UnsupportedVersionError):
+            SchematronValidator("5.0")
+
+
+class TestRuleCache:
+    """Test compiled rule set caching"""
+    
+    def test_compiled_once(self):
+        """Test rule sets are compiled once per version and profile"""
+        assert load_rules("4.3", "Video") is load_rules("4.3", "Video")
+        assert load_rules("4.3", "Video") is not load_rules("4.3", "AudioAlbum")
+        assert len(load_rules("4.3", "Video")) > len(load_rules("4.3"))
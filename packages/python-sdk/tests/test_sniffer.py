@@ -0,0 +1,75 @@
+# packages/python-sdk/tests/test_sniffer.py
+"""Tests for root start-tag sniffing"""
+
+import io
+
+from ddex_workbench.sniffer import sniff, sniff_profile, sniff_version
+from ddex_workbench.utils import detect_ern_version
+from tests import VALID_ERN_43_XML
+
+
+class CountingStream(io.BytesIO):
+    """BytesIO that records how much was read"""
+    
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+    
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class TestSniffer:
+    """Test sniff() and helpers"""
+    
+    def test_sources(self, tmp_path):
+        """Test str, bytes, path and stream sources"""
+        filepath = tmp_path / "release.xml"
+        filepath.write_text(VALID_ERN_43_XML, encoding='utf-8')
+        
+        assert sniff_version(VALID_ERN_43_XML) == "4.3"
+        assert sniff_version(VALID_ERN_43_XML.encode('utf-8')) == "4.3"
+        assert sniff_version(filepath) == "4.3"
+        assert sniff_version(io.BytesIO(VALID_ERN_43_XML.encode('utf-8'))) == "4.3"
+        assert detect_ern_version(filepath) == "4.3"
+    
+    def test_reads_only_prefix(self):
+        """Test parsing stops at the root start-tag"""
+        body = b"<Release/>" * 1_000_000
+        stream = CountingStream(
+            b'<?xml version="1.0"?>\n<ern:NewReleaseMessage xmlns:ern="http://ddex.net/xml/ern/42">'
+            + body + b"</ern:NewReleaseMessage>"
+        )
+        
+        result = sniff(stream, chunk_size=1024)
+        
+        assert result.version == "4.2"
+        assert result.tag == "ern:NewReleaseMessage"
+        assert stream.bytes_read == 1024
+    
+    def test_root_attributes(self):
+        """Test schema version id and profile attributes"""
+        xml = (
+            '<NewReleaseMessage MessageSchemaVersionId="3.8.2" '
+            'ReleaseProfileVersionId="CommonReleaseTypes/14/AudioSingle">'
+        )
+        
+        assert sniff_version(xml) == "3.8.2"
+        assert sniff_profile(xml) == "AudioSingle"
+    
+    def test_no_root(self):
+        """Test content without a root element"""
+        result = sniff(b"<?xml version='1.0'?>" + b" " * 1000, max_bytes=256, chunk_size=128)
+        
+        assert result.tag is None
+        assert result.version is None
+        assert result.error
+    
+    def test_malformed_prolog(self):
+        """Test string fallback when the prolog is not well-formed"""
+        result = sniff('<?xml version="1.0"?><!-- -- --><x xmlns="http://ddex.net/xml/ern/43">')
+        
+        assert result.tag is None
+        assert result.version == "4.3"
@@ -0,0 +1,182 @@
+# packages/python-sdk/tests/test_streaming.py
+"""Tests for streamed (chunked) /validate request bodies"""
+
+import gzip
+import hashlib
+import io
+import json
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from ddex_workbench import AsyncDDEXClient, DDEXClient
+from ddex_workbench.codec import STREAM_THRESHOLD, escape_json_bytes
+from tests import VALID_ERN_43_XML
+
+
+VALID_RESPONSE = {"valid": True, "errors": [], "warnings": [], "metadata": {}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Stand-in /validate route that accepts chunked and gzipped bodies"""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, *args):
+        pass
+    
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            parts = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return b"".join(parts)
+                parts.append(self.rfile.read(size))
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers["Content-Length"]))
+    
+    def _digest_body(self):
+        """Read the body keeping only its digest, so memory stays with the client"""
+        digest = hashlib.sha256()
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            if size == 0:
+                self.rfile.readline()
+                return digest.hexdigest()
+            while size:
+                chunk = self.rfile.read(min(size, 65536))
+                digest.update(chunk)
+                size -= len(chunk)
+            self.rfile.readline()
+    
+    def do_POST(self):
+        if self.server.digest_only:
+            self.server.requests.append({"chunked": True, "sha256": self._digest_body()})
+            self._reply()
+            return
+        raw = self._read_body()
+        if self.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        self.server.requests.append({
+            "chunked": self.headers.get("Transfer-Encoding") == "chunked",
+            "encoding": self.headers.get("Content-Encoding"),
+            "body": json.loads(raw),
+        })
+        self._reply()
+    
+    def _reply(self):
+        data = json.dumps(VALID_RESPONSE).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.requests = []
+        self.digest_only = False
+
+
+@pytest.fixture
+def server():
+    """Local stand-in server"""
+    srv = _Server()
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def make_client(server, **kwargs):
+    kwargs.setdefault("compression", False)
+    return DDEXClient(base_url=f"http://127.0.0.1:{server.server_address[1]}/", **kwargs)
+
+
+class TestValidateStream:
+    """Test DDEXClient.validate_stream"""
+    
+    def test_file_object(self, server):
+        """Test a file object is sent chunked with the request fields"""
+        client = make_client(server)
+        
+        result = client.validate_stream(io.BytesIO(VALID_ERN_43_XML.encode()), "4.3", profile="AudioAlbum")
+        
+        assert result.valid is True
+        request = server.requests[0]
+        assert request["chunked"] is True
+        assert request["body"]["content"] == VALID_ERN_43_XML
+        assert request["body"]["version"] == "4.3"
+        assert request["body"]["profile"] == "AudioAlbum"
+    
+    def test_chunk_iterator(self, server):
+        """Test a generator of str/bytes chunks is streamed as-is"""
+        client = make_client(server)
+        lines = (line + "\n" for line in VALID_ERN_43_XML.split("\n"))
+        
+        client.validate_stream(lines, "4.3")
+        
+        assert server.requests[0]["body"]["content"].rstrip("\n") == VALID_ERN_43_XML.rstrip("\n")
+    
+    def test_compressed_stream(self, server):
+        """Test streamed bodies are gzipped incrementally"""
+        client = make_client(server, compression="gzip")
+        
+        client.validate_stream(io.StringIO(VALID_ERN_43_XML), "4.3")
+        
+        assert server.requests[0]["encoding"] == "gzip"
+        assert server.requests[0]["body"]["content"] == VALID_ERN_43_XML
+    
+    @pytest.mark.asyncio
+    async def test_async_client(self, server):
+        """Test the async client streams file objects too"""
+        pytest.importorskip("httpx")
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+        async with AsyncDDEXClient(base_url=base_url, compression=False) as client:
+            result = await client.validate_stream(io.BytesIO(VALID_ERN_43_XML.encode()), "4.3")
+        
+        assert result.valid is True
+        assert server.requests[0]["chunked"] is True
+        assert server.requests[0]["body"]["content"] == VALID_ERN_43_XML
+
+
+class TestLargeDocuments:
+    """Test validate() streams documents over STREAM_THRESHOLD"""
+    
+    def test_large_bytes_streamed_not_copied(self, server):
+        """Test the body is never built in memory for a large document"""
+        padding = b"<!-- " + b"x" * 1000 + b" -->\n"
+        content = VALID_ERN_43_XML.encode() + padding * (STREAM_THRESHOLD // len(padding) + 1)
+        client = make_client(server)
+        server.digest_only = True
+        
+        tracemalloc.start()
+        try:
+            client.validate(content, "4.3")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        expected = b"".join([b'{"content":"', escape_json_bytes(content),
+                             b'","type":"ERN","version":"4.3"}'])
+        assert server.requests[0]["sha256"] == hashlib.sha256(expected).hexdigest()
+        # Only a couple of 1 MB slices are alive at once, not a second copy
+        assert peak < len(content) // 2
+    
+    def test_small_document_buffered(self, server):
+        """Test documents under the threshold keep a Content-Length body"""
+        client = make_client(server)
+        
+        client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert server.requests[0]["chunked"] is False
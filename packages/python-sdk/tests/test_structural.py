@@ -0,0 +1,93 @@
+# packages/python-sdk/tests/test_structural.py
+"""Tests for the local structural validator"""
+
+import pytest
+
+from ddex_workbench import DDEXDocument, StructuralValidator
+from ddex_workbench.errors import UnsupportedVersionError
+from ddex_workbench.structural import validate_structure
+from tests import VALID_ERN_43_XML, INVALID_XML, MALFORMED_XML
+
+
+def rules(issues):
+    return [issue.rule for issue in issues]
+
+
+class TestStructuralValidator:
+    """Test StructuralValidator class"""
+    
+    def test_valid_message(self):
+        """Test a complete ERN 4.3 message passes"""
+        result = validate_structure(VALID_ERN_43_XML, "4.3", "AudioAlbum")
+        
+        assert result.valid is True
+        assert result.errors == []
+        assert result.metadata['engine'] == 'structural'
+        assert result.metadata['schemaVersion'] == 'ERN 4.3'
+    
+    def test_missing_composites_per_version(self):
+        """Test required elements and rule IDs per version"""
+        # An empty MessageHeader counts as missing, as on the server
+        assert rules(StructuralValidator("4.3").check(INVALID_XML)) == [
+            "ERN43-MessageHeader", "ERN43-ReleaseList", "ERN43-ResourceList", "ERN43-DealList"
+        ]
+        assert rules(StructuralValidator("4.2").check(INVALID_XML)) == [
+            "ERN42-MessageHeader", "ERN42-ReleaseList"
+        ]
+        
+        issues = StructuralValidator("3.8.2").check(INVALID_XML)
+        assert rules(issues) == [
+            "ERN382-MessageHeader", "ERN382-UpdateIndicator", "ERN382-ReleaseList", "ERN382-ResourceList"
+        ]
+        assert issues[1].severity == "warning"
+    
+    def test_warnings_do_not_invalidate(self):
+        """Test recommendations are returned as warnings"""
+        result = validate_structure(
+            VALID_ERN_43_XML.replace("ern/43", "ern/382").replace("DealList", "UpdateIndicator"),
+            "3.8.2"
+        )
+        
+        assert result.valid is True
+        
+        result = StructuralValidator("3.8.2").validate(VALID_ERN_43_XML)
+        assert result.valid is True
+        assert rules(result.warnings) == ["ERN382-UpdateIndicator"]
+    
+    def test_root_element(self):
+        """Test wrong root element"""
+        issues = StructuralValidator().check("<PurgeReleaseMessage/>")
+        
+        assert rules(issues) == ["Root Element"]
+        assert "found 'PurgeReleaseMessage'" in issues[0].message
+    
+    def test_well_formedness(self):
+        """Test malformed XML reports the parser position"""
+        issues = StructuralValidator().check(DDEXDocument(MALFORMED_XML))
+        
+        assert rules(issues) == ["XML Well-formedness"]
+        assert issues[0].line == 4
+    
+    def test_profiles(self):
+        """Test profile-specific checks"""
+        validator = StructuralValidator("4.3")
+        two_releases = VALID_ERN_43_XML.replace(
+            "</ReleaseList>",
+            "<Release><ReleaseType>Single</ReleaseType></Release></ReleaseList>"
+        )
+        album_single = VALID_ERN_43_XML.replace(
+            "<ReleaseReference>R0</ReleaseReference>",
+            "<ReleaseReference>R0</ReleaseReference><ReleaseType>Single</ReleaseType>"
+        )
+        
+        assert rules(validator.check(two_releases, "AudioSingle")) == ["AudioSingle-SingleRelease"]
+        assert rules(validator.check(album_single, "AudioAlbum")) == ["AudioAlbum-ReleaseType"]
+        assert rules(validator.check(VALID_ERN_43_XML, "Video")) == ["Video-VideoResource"]
+        assert rules(validator.check(VALID_ERN_43_XML, "Mixed")) == []
+        assert rules(validator.check(VALID_ERN_43_XML, "ReleaseByRelease")) == ["Profile-Version-Mismatch"]
+        assert "AudioAlbum-ReleaseList" in rules(validator.check(INVALID_XML, "AudioAlbum"))
+    
+    def test_unsupported_version(self):
+        """Test unknown versions are rejected"""
+        with pytest.raises(UnsupportedVersionError):
+            StructuralValidator("5.0")
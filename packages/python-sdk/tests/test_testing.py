@@ -0,0 +1,257 @@
+# packages/python-sdk/tests/test_testing.py
+"""Tests for the local stand-in API server"""
+
+import gzip
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from ddex_workbench import AsyncDDEXClient, DDEXClient
+from ddex_workbench.errors import APIError, AuthenticationError, RateLimitError, ServerError
+from ddex_workbench.testing import StandInServer, constant, exponential, lognormal, uniform
+from tests import VALID_ERN_43_XML
+
+
+@pytest.fixture
+def server(request):
+    """Running stand-in server; parametrize with StandInServer kwargs"""
+    with StandInServer(**getattr(request, "param", {})) as srv:
+        yield srv
+
+
+def make_client(server, **kwargs):
+    kwargs.setdefault("max_retries", 0)
+    return DDEXClient(base_url=server.url, **kwargs)
+
+
+class TestLatency:
+    """Test the latency samplers"""
+    
+    def test_distributions(self):
+        """Test samplers draw plausible values from a seeded generator"""
+        rng = random.Random(1)
+        
+        assert constant(0.2)(rng) == 0.2
+        assert all(0.1 <= uniform(0.1, 0.3)(rng) <= 0.3 for _ in range(100))
+        samples = sorted(lognormal(0.05)(rng) for _ in range(1001))
+        assert 0.04 < samples[500] < 0.06
+        assert 0.04 < sum(exponential(0.05)(rng) for _ in range(2000)) / 2000 < 0.06
+        assert lognormal(0)(rng) == exponential(0)(rng) == 0.0
+    
+    @pytest.mark.parametrize("server", [{"latency": 0.1, "processing_per_mb": 2.0}], indirect=True)
+    def test_response_delays(self, server):
+        """Test latency applies to every route and processing time scales with content"""
+        client = make_client(server)
+        
+        start = time.perf_counter()
+        client.health()
+        health_time = time.perf_counter() - start
+        
+        content = VALID_ERN_43_XML + "<!-- x -->" * 26000  # ~0.25 MB
+        start = time.perf_counter()
+        client.validate(content, "4.3")
+        validate_time = time.perf_counter() - start
+        
+        assert health_time >= 0.1
+        assert validate_time >= 0.1 + 0.45
+
+
+class TestRoutes:
+    """Test the emulated endpoints through DDEXClient"""
+    
+    def test_validate(self, server):
+        """Test /validate returns structural results in the API's shape"""
+        client = make_client(server)
+        
+        valid = client.validate(VALID_ERN_43_XML, "4.3", profile="AudioAlbum")
+        invalid = client.validate("<ern:NewReleaseMessage xmlns:ern='http://ddex.net/xml/ern/43'/>", "4.3")
+        
+        assert valid.valid is True
+        assert valid.metadata["schemaVersion"] == "ERN 4.3"
+        assert valid.metadata["profile"] == "AudioAlbum"
+        assert invalid.valid is False
+        assert invalid.metadata["errorCount"] == len(invalid.errors) > 0
+        assert invalid.errors[0].rule.startswith("ERN43-")
+    
+    def test_validate_bad_requests(self, server):
+        """Test missing fields and unknown versions are 400s"""
+        client = make_client(server)
+        
+        with pytest.raises(APIError) as exc_info:
+            client.validate(VALID_ERN_43_XML, "9.9")
+        assert exc_info.value.status_code == 400
+        response = requests.post(f"{server.url}/validate", json={"type": "ERN", "version": "4.3"})
+        assert response.status_code == 400
+        assert response.json()["error"]["message"] == "XML content is required"
+    
+    def test_compressed_and_chunked_bodies(self, server):
+        """Test gzip bodies are inflated and unknown encodings get a 415"""
+        body = json.dumps({"content": VALID_ERN_43_XML, "type": "ERN", "version": "4.3"}).encode()
+        
+        gzipped = requests.post(f"{server.url}/api/validate", data=gzip.compress(body),
+                                headers={"Content-Encoding": "gzip"})
+        chunked = requests.post(f"{server.url}/validate", data=iter([body[:100], body[100:]]))
+        rejected = requests.post(f"{server.url}/validate", data=body, headers={"Content-Encoding": "br"})
+        
+        assert gzipped.json()["valid"] is True
+        assert chunked.json()["valid"] is True
+        assert rejected.status_code == 415
+        assert server.stats["bytes_received"] == 2 * len(body)
+    
+    def test_health_and_formats(self, server):
+        """Test /health and /formats parse into the SDK's types"""
+        client = make_client(server)
+        
+        health = client.health()
+        formats = client.formats()
+        
+        assert health.status == "ok"
+        assert health.request_encodings == ["gzip", "deflate"]
+        assert formats.formats == ["ERN"]
+        assert {v["version"] for v in formats.versions} == {"4.3", "4.2", "3.8.2"}
+    
+    def test_api_keys(self, server):
+        """Test creating, listing and deleting keys"""
+        client = make_client(server, api_key=server.create_key("admin"))
+        
+        created = client.create_api_key("ci")
+        listed = client.list_api_keys()
+        
+        assert created.key.startswith("ddex_")
+        assert [k.name for k in listed] == ["admin", "ci"]
+        assert listed[1].key is None
+        assert client.delete_api_key(created.id) is True
+        assert len(client.list_api_keys()) == 1
+    
+    def test_api_keys_require_credentials(self, server):
+        """Test anonymous and unknown-key requests are 401s"""
+        with pytest.raises(AuthenticationError):
+            make_client(server).list_api_keys()
+        with pytest.raises(AuthenticationError):
+            make_client(server, api_key="ddex_unknown").validate(VALID_ERN_43_XML, "4.3")
+
+
+class TestRateLimiting:
+    """Test the 60/10 req/min budgets"""
+    
+    def test_anonymous_limit(self, server):
+        """Test the 11th anonymous request in a minute is a 429"""
+        client = make_client(server)
+        
+        for _ in range(10):
+            client.formats()
+        with pytest.raises(RateLimitError) as exc_info:
+            client.formats()
+        
+        assert exc_info.value.limit == 10
+        assert 0 < exc_info.value.retry_after <= 60
+        assert server.stats["rate_limited"] == 1
+        # /health is exempt
+        assert client.health().status == "ok"
+    
+    def test_api_key_limit(self, server):
+        """Test a key gets 60 requests, counted separately from anonymous ones"""
+        client = make_client(server, api_key=server.create_key())
+        
+        for _ in range(60):
+            client.formats()
+        with pytest.raises(RateLimitError) as exc_info:
+            client.formats()
+        
+        assert exc_info.value.limit == 60
+        assert make_client(server).formats().formats == ["ERN"]
+    
+    @pytest.mark.parametrize("server", [{"anonymous_limit": 3, "window": 0.5}], indirect=True)
+    def test_window_resets(self, server):
+        """Test the budget is restored once the window has passed"""
+        client = make_client(server)
+        
+        for _ in range(3):
+            client.formats()
+        with pytest.raises(RateLimitError):
+            client.formats()
+        time.sleep(0.6)
+        
+        assert client.formats().formats == ["ERN"]
+    
+    @pytest.mark.parametrize("server", [{"anonymous_limit": 5, "window": 1.0}], indirect=True)
+    def test_paced_client_completes(self, server):
+        """Test a rate-limited client paces and waits out 429s instead of failing"""
+        client = make_client(server, rate_limit=True, max_retries=3)
+        client.rate_limiter.set_limit(5, 1.0)
+        
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(lambda _: client.formats(), range(12)))
+        
+        assert len(results) == 12
+        assert server.stats["statuses"][200] == 12
+
+
+class TestFaults:
+    """Test injected 5xx responses"""
+    
+    @pytest.mark.parametrize("server", [{"rate_limit": False}], indirect=True)
+    def test_injected_faults(self, server):
+        """Test the next requests fail with the given status, then recover"""
+        client = make_client(server)
+        server.inject_faults(2, status=502)
+        
+        for _ in range(2):
+            with pytest.raises(ServerError) as exc_info:
+                client.validate(VALID_ERN_43_XML, "4.3")
+            assert exc_info.value.status_code == 502
+        
+        assert client.validate(VALID_ERN_43_XML, "4.3").valid is True
+        assert server.stats["faults"] == 2
+        assert server.stats["statuses"] == {502: 2, 200: 1}
+    
+    @pytest.mark.parametrize("server", [{"rate_limit": False, "fault_rate": 0.3, "seed": 7}], indirect=True)
+    def test_fault_rate(self, server):
+        """Test random faults hit about fault_rate of requests"""
+        for _ in range(200):
+            requests.get(f"{server.url}/formats")
+        
+        stats = server.stats
+        assert 30 < stats["faults"] < 90
+        assert set(stats["statuses"]) <= {200, 500, 502, 503}
+    
+    @pytest.mark.parametrize("server", [{"rate_limit": False}], indirect=True)
+    def test_retried_by_client(self, server):
+        """Test the client's retries ride out a transient 503"""
+        client = make_client(server, max_retries=2, retry_delay=0.01)
+        server.inject_faults(1)
+        
+        assert client.validate(VALID_ERN_43_XML, "4.3").valid is True
+        assert server.stats["statuses"] == {503: 1, 200: 1}
+
+
+class TestConcurrency:
+    """Test the server under concurrent load"""
+    
+    @pytest.mark.parametrize("server", [{"rate_limit": False, "latency": 0.1}], indirect=True)
+    def test_requests_overlap(self, server):
+        """Test concurrent requests are served in parallel"""
+        client = make_client(server, max_connections=8)
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: client.validate(VALID_ERN_43_XML + " " * _, "4.3"), range(8)))
+        elapsed = time.perf_counter() - start
+        
+        assert all(r.valid for r in results)
+        assert server.stats["peak_concurrency"] >= 4
+        assert elapsed < 0.5
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("server", [{"rate_limit": False}], indirect=True)
+    async def test_async_client(self, server):
+        """Test the async client against the stand-in server"""
+        pytest.importorskip("httpx")
+        async with AsyncDDEXClient(base_url=server.url, max_retries=0) as client:
+            result = await client.validate(VALID_ERN_43_XML, "4.3")
+        
+        assert result.valid is True
@@ -248,6 +248,50 @@ class TestDDEXValidator:
             assert batch_result.invalid_files == 1
             assert len(batch_result.results) == 2
     
+    def test_iter_validate_bounded_window(self):
+        """Test iter_validate submits at most `window` files ahead"""
+        pulled = []
+        self.mock_client.validate.return_value = ValidationResult(
+            valid=True, errors=[], warnings=[], metadata={}
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.xml"
+            path.write_text(VALID_ERN_43_XML)
+            
+            def files():
+                for i in range(20):
+                    pulled.append(i)
+                    yield str(path)
+            
+            stream = self.validator.iter_validate(files(), "4.3", max_workers=2, window=3)
+            first = next(stream)
+            assert len(pulled) <= 4
+            results = [first] + list(stream)
+        
+        assert len(results) == 20
+        assert results[0].metadata['file'] == str(path)
+    
+    def test_validate_batch_without_results(self):
+        """Test batch totals can be kept without the individual results"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            good = Path(tmpdir) / "good.xml"
+            good.write_text(VALID_ERN_43_XML)
+            self.mock_client.validate.return_value = ValidationResult(
+                valid=True, errors=[], warnings=[], metadata={}
+            )
+            
+            batch_result = self.validator.validate_batch(
+                files=[good, Path(tmpdir) / "missing.xml"],
+                version="4.3",
+                keep_results=False
+            )
+        
+        assert batch_result.total_files == 2
+        assert batch_result.valid_files == 1
+        assert batch_result.invalid_files == 1
+        assert batch_result.results == []
+    
     def test_validate_file(self):
         """Test file validation"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
@@ -268,6 +312,33 @@ class TestDDEXValidator:
         finally:
             filepath.unlink()
     
+    def test_validate_file_bytes_and_hashes(self, tmp_path):
+        """Test files are sent as bytes with hashes from the same read"""
+        import hashlib
+        
+        filepath = tmp_path / "release.xml"
+        filepath.write_bytes(VALID_ERN_43_XML.encode('utf-8'))
+        self.mock_client.validate.return_value = ValidationResult(
+            valid=True, errors=[], warnings=[], metadata={}
+        )
+        
+        result = self.validator.validate_file(filepath, version="4.3", generate_hash=True)
+        
+        sent = self.mock_client.validate.call_args[0][0]
+        assert not isinstance(sent, str)
+        assert bytes(sent) == VALID_ERN_43_XML.encode('utf-8')
+        expected = hashlib.sha256(VALID_ERN_43_XML.encode('utf-8')).hexdigest()
+        assert result.metadata['file_hash_sha256'] == expected
+        assert result.metadata['file_size'] == filepath.stat().st_size
+    
+    def test_validate_file_not_utf8(self, tmp_path):
+        """Test non-UTF-8 files are reported as file errors"""
+        filepath = tmp_path / "latin1.xml"
+        filepath.write_bytes('<a>caf\xe9</a>'.encode('latin-1'))
+        
+        with pytest.raises(FileError):
+            self.validator.validate_file(filepath, version="4.3")
+    
     def test_validate_file_not_found(self):
         """Test validation of non-existent file"""
         with pytest.raises(FileError) as exc_info:
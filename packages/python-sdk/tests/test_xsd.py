@@ -0,0 +1,126 @@
+# packages/python-sdk/tests/test_xsd.py
+"""Tests for local XSD validation"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from ddex_workbench import DDEXDocument, XSDValidator
+from ddex_workbench.errors import ConfigurationError, UnsupportedVersionError
+from ddex_workbench.xsd import clear_schema_cache, load_schema
+
+
+MAIN_XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           xmlns:avs="http://ddex.net/xml/avs/avs"
+           targetNamespace="http://ddex.net/xml/ern/43">
+  <xs:import namespace="http://ddex.net/xml/avs/avs"
+             schemaLocation="http://ddex.net/xml/allowed-value-sets/allowed-value-sets.xsd"/>
+  <xs:element name="NewReleaseMessage">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="MessageHeader">
+          <xs:complexType>
+            <xs:sequence><xs:element name="MessageId" type="xs:string"/></xs:sequence>
+          </xs:complexType>
+        </xs:element>
+        <xs:element name="ReleaseType" type="avs:ReleaseType" minOccurs="0"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>"""
+
+AVS_XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="http://ddex.net/xml/avs/avs">
+  <xs:simpleType name="ReleaseType">
+    <xs:restriction base="xs:string">
+      <xs:enumeration value="Album"/>
+      <xs:enumeration value="Single"/>
+    </xs:restriction>
+  </xs:simpleType>
+</xs:schema>"""
+
+MESSAGE = """<?xml version="1.0" encoding="UTF-8"?>
+<ern:NewReleaseMessage xmlns:ern="http://ddex.net/xml/ern/43">
+    <MessageHeader>
+        <MessageId>MSG_TEST_001</MessageId>
+    </MessageHeader>
+    <ReleaseType>{release_type}</ReleaseType>
+</ern:NewReleaseMessage>"""
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """Minimal ERN 4.3 schema set in the server's directory layout"""
+    version_dir = tmp_path / "ern" / "4.3"
+    version_dir.mkdir(parents=True)
+    (version_dir / "release-notification.xsd").write_text(MAIN_XSD, encoding='utf-8')
+    (version_dir / "allowed-value-sets.xsd").write_text(AVS_XSD, encoding='utf-8')
+    yield tmp_path
+    clear_schema_cache()
+
+
+class TestXSDValidator:
+    """Test XSDValidator class"""
+    
+    def test_valid(self, schema_dir):
+        """Test a schema-valid message"""
+        result = XSDValidator("4.3", schema_dir).validate(MESSAGE.format(release_type="Album"))
+        
+        assert result.valid is True
+        assert result.metadata['engine'] == 'xsd'
+    
+    def test_errors_have_location(self, schema_dir):
+        """Test violations map to XSD-Schema errors with line and xpath"""
+        validator = XSDValidator("4.3", schema_dir)
+        
+        errors = validator.check(DDEXDocument(MESSAGE.format(release_type="EP")))
+        
+        assert len(errors) == 1
+        assert errors[0].rule == "XSD-Schema"
+        assert errors[0].line == 6
+        assert errors[0].xpath == "/ern:NewReleaseMessage/ReleaseType"
+        assert "EP" in errors[0].message
+    
+    def test_file_and_malformed(self, schema_dir, tmp_path):
+        """Test file paths and well-formedness errors"""
+        validator = XSDValidator("4.3", schema_dir)
+        filepath = tmp_path / "release.xml"
+        filepath.write_text(MESSAGE.format(release_type="Single"), encoding='utf-8')
+        
+        assert validator.check(filepath) == []
+        assert validator.check("<unclosed>")[0].rule == "XML Well-formedness"
+    
+    def test_schema_compiled_once(self, schema_dir):
+        """Test validators share the compiled schema"""
+        first = XSDValidator("4.3", schema_dir)
+        second = XSDValidator("4.3", Path(schema_dir))
+        
+        assert first._compiled is second._compiled
+        assert load_schema("4.3", schema_dir) is first._compiled
+    
+    def test_threads_share_schema(self, schema_dir):
+        """Test concurrent checks share one compiled schema and keep their own errors"""
+        validator = XSDValidator("4.3", schema_dir)
+        messages = [MESSAGE.format(release_type=t) for t in ("Album", "EP") * 20]
+        
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(validator.check, messages))
+            schemas = set(pool.map(lambda _: id(load_schema("4.3", schema_dir).schema), range(8)))
+        
+        assert [len(errors) for errors in results] == [0, 1] * 20
+        assert all("EP" in errors[0].message for errors in results[1::2])
+        assert schemas == {id(validator._compiled.schema)}
+    
+    def test_configuration_errors(self, schema_dir, monkeypatch):
+        """Test missing schemas and versions"""
+        monkeypatch.delenv("DDEX_SCHEMA_DIR", raising=False)
+        with pytest.raises(ConfigurationError):
+            XSDValidator("4.3")
+        with pytest.raises(ConfigurationError):
+            XSDValidator("4.2", schema_dir)
+        with pytest.raises(UnsupportedVersionError):
+            XSDValidator("5.0", schema_dir)